@@ -4,3 +4,6 @@ __init__ file'''
 
 # napack Version
 __version__ = "1.0.0"
+
+# Backend of the sequential kernels, see nanpack.backend.kernels
+from .backend.kernels import set_backend, get_backend
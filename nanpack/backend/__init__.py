@@ -1,9 +1,3 @@
-<<<<<<< Updated upstream
-# coding: utf-8
-'''
-__init__ file'''
-=======
 # coding: utf-8
 '''
 __init__ file'''
->>>>>>> Stashed changes
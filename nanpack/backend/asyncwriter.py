@@ -0,0 +1,152 @@
+"""Write output files on a background thread."""
+#   ***********************************************************************
+#
+#   FILE         asyncwriter.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import atexit
+import queue
+import threading
+
+import numpy as np
+
+_STOP = object()
+
+
+class AsyncWriter:
+    """Perform the formatting and disk I/O of the output on a thread.
+
+    The write requests are put in a bounded queue and executed in order
+    by one background thread, i.e. the solver only copies the solution
+    at the time steps at which it is written. The solver waits only if
+    MaxQueue requests are pending. The pending requests are written by
+    Flush(), Close() and at the exit of the interpreter.
+
+    Call signature:
+        AsyncWriter(MaxQueue=8)
+
+    Attributes
+    ----------
+    MaxQueue: int, Default=8
+        Maximum number of pending write requests.
+    """
+
+    def __init__(self, MaxQueue=8):
+        """Class constructor for the AsyncWriter class."""
+        self._queue = queue.Queue(maxsize=MaxQueue)
+        self._error = None
+        self._thread = threading.Thread(target=self._Worker, daemon=True,
+                                        name="nanpack-writer")
+        self._thread.start()
+        atexit.register(self.Close)
+
+    def __enter__(self):
+        """Return the writer for use in a with statement."""
+        return self
+
+    def __exit__(self, *args):
+        """Write the pending requests and stop the thread."""
+        self.Close()
+
+    def Submit(self, func, *args, **kwargs):
+        """Call func(*args, **kwargs) on the background thread.
+
+        The arguments are passed by reference, copy any array that is
+        modified by the solver before the call is executed.
+        """
+        if self._thread is None:
+            raise ValueError("AsyncWriter is closed.")
+        self._queue.put((func, args, kwargs))
+
+    def WriteSolutionToFile(self, U, n, nWrite, nMax, OutFileName, dX,
+                            dY=None, Format="Text"):
+        """Write a copy of U in the background, see WriteSolutionToFile()."""
+        from ..postprocess import WriteSolutionToFile
+
+        if n % nWrite == 0 or n == nMax:
+            self.Submit(WriteSolutionToFile, np.array(U), n, nWrite, nMax,
+                        OutFileName, dX, dY, Format)
+
+    def WriteConvHistToFile(self, CfgClsObj, n, Error, HistFName=None):
+        """Write the convergence history in the background.
+
+        See WriteConvHistToFile().
+        """
+        from ..postprocess import WriteConvHistToFile
+
+        self.Submit(WriteConvHistToFile, CfgClsObj, n, float(Error),
+                    HistFName)
+
+    def Flush(self):
+        """Wait until all pending requests are written.
+
+        An exception raised by a request is raised again here, the
+        requests submitted after it are not executed.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._RaiseError()
+
+    def Close(self):
+        """Write the pending requests and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.Close)
+        self._RaiseError()
+
+    def _Worker(self):
+        """Execute the requests until the stop request is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                func, args, kwargs = item
+                if self._error is None:
+                    func(*args, **kwargs)
+            except Exception as err:
+                self._error = err
+            finally:
+                self._queue.task_done()
+
+    def _RaiseError(self):
+        """Raise the first exception raised by a request."""
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
@@ -38,6 +38,8 @@
 #
 #   ***********************************************************************
 
+import numpy as np
+
 
 def ReadBCfromFile(BCFileName):
     """Read user specified boundary conditions from the file.
@@ -156,7 +158,24 @@ def ReadBCfromFile(BCFileName):
 
 def BCatAxis(U, axis, Ubc, A, B, dX, dY):
     """Assign boundary conditions along the input axis."""
-    global delta
+    dst, src, h = BCIndices(axis, A, B, dX, dY)
+    U[dst] = Ubc
+
+    return U
+
+
+def BCIndices(axis, A, B, dX, dY):
+    """Return the indices of the boundary points between A and B.
+
+    Returns the index of the boundary points on the axis, the index of
+    the adjacent interior points and the grid step size normal to the
+    axis.
+    """
+    from .fetchoptions import FetchOptions
+    from .exceptions import InvalidValueError
+
+    if axis not in FetchOptions().BCAxisOptions():
+        raise InvalidValueError("AXIS", axis)
     if axis in ['X-lo', 'X-hi']:
         delta = dY
     elif axis in ['Y-lo', 'Y-hi']:
@@ -166,15 +185,142 @@ def BCatAxis(U, axis, Ubc, A, B, dX, dY):
     ijB = int(B/delta)
 
     if axis == 'X-lo':
-        U[0, ijA:ijB+1] = Ubc
+        return (0, slice(ijA, ijB+1)), (1, slice(ijA, ijB+1)), dX
     elif axis == 'X-hi':
-        U[-1, ijA+1:ijB] = Ubc
+        return (-1, slice(ijA+1, ijB)), (-2, slice(ijA+1, ijB)), dX
     elif axis == 'Y-lo':
-        U[ijA:ijB+1, 0] = Ubc
+        return (slice(ijA, ijB+1), 0), (slice(ijA, ijB+1), 1), dY
     elif axis == 'Y-hi':
-        U[ijA+1:ijB, -1] = Ubc
+        return (slice(ijA+1, ijB), -1), (slice(ijA+1, ijB), -2), dY
 
-    return U
+
+class BCPlan:
+    """Boundary conditions compiled to the indices of the boundary points.
+
+    The indices and values of each boundary segment are computed once
+    from the settings returned by ReadBCfromFile(), i.e. Apply() only
+    performs one array assignment per segment. The segments are applied
+    in the order INLET, WALL, FAR-FIELD, OUTLET.
+
+    BC_TYPE = DIRICHLET assigns the value U at the boundary points.
+    BC_TYPE = NEUMANN imposes the value U of the outward normal
+    derivative with a first-order difference, e.g. at X-lo,
+        -(U[1,j] - U[0,j])/dX = Ubc, i.e. U[0,j] = U[1,j] + Ubc*dX.
+    Ubc = 0 gives the zero-gradient condition.
+    BC_TYPE = PERIODIC treats the boundary points as ghost points which
+    are copied from the interior points next to the opposite boundary,
+    e.g. U[0,j] = U[-2,j] at X-lo and U[-1,j] = U[1,j] at X-hi. The
+    value U is ignored.
+
+    Call signature:
+        BCPlan(BC, delX, delY)
+
+    Attributes
+    ----------
+    BC: list
+        Boundary conditions settings obtained from boundary configuration
+        file.
+    delX: float
+        Grid step size along X-axis.
+    delY: float
+        Grid step size along Y-axis.
+    """
+
+    def __init__(self, BC, delX, delY):
+        """Class constructor for the BCPlan class."""
+        from .fetchoptions import FetchOptions
+        from .exceptions import InvalidValueError
+
+        self.Segments = []
+        for Axis1, A1, B1, Axis2, A2, B2, BCType, Ubc in BC:
+            if BCType.upper() not in FetchOptions().BCTypeOptions():
+                raise InvalidValueError("BC_TYPE", BCType)
+            segments = [(Axis1, A1, B1)]
+            if Axis2.lower() != 'none':
+                segments.append((Axis2, A2, B2))
+            for axis, A, B in segments:
+                dst, src, h = BCIndices(axis, A, B, delX, delY)
+                if BCType.upper() == 'DIRICHLET':
+                    self.Segments.append((dst, None, Ubc))
+                elif BCType.upper() == 'NEUMANN':
+                    self.Segments.append((dst, src, Ubc*h))
+                elif BCType.upper() == 'PERIODIC':
+                    self.Segments.append((dst, _PeriodicIndex(src), 0.0))
+
+    def Apply(self, U):
+        """Assign the boundary conditions to U in place and return U."""
+        for dst, src, value in self.Segments:
+            if src is None:
+                U[dst] = value
+            else:
+                np.add(U[src], value, out=U[dst])
+
+        return U
+
+
+class BCPlan1D(BCPlan):
+    """Boundary conditions of a 1D solution compiled for repeated use.
+
+    The multi-stage explicit schemes apply the plan to each stage array,
+    i.e. Apply() is called several times per time step. Left and Right
+    are the boundary settings at the first and the last point, either a
+    string BCType or a tuple (BCType, Ubc) with the BC types of BCPlan.
+    Ubc = None with BCType = DIRICHLET keeps the boundary value of the
+    solution at time level n. PERIODIC must be specified at both ends,
+    U[0] and U[-1] are then the ghost points of the periodic domain
+    U[1:-1], i.e. the period is (iMax-2)*dX.
+
+    Call signature:
+        BCPlan1D(Left, Right, dX)
+
+    Attributes
+    ----------
+    Left: str or tuple
+        Boundary settings at the first point.
+    Right: str or tuple
+        Boundary settings at the last point.
+    dX: float
+        Grid step size along X-axis.
+    """
+
+    def __init__(self, Left, Right, dX):
+        """Class constructor for the BCPlan1D class."""
+        from .fetchoptions import FetchOptions
+        from .exceptions import InvalidValueError
+
+        self.Segments = []
+        BCTypes = []
+        for BCSide, dst, src in [(Left, 0, 1), (Right, -1, -2)]:
+            if isinstance(BCSide, str):
+                BCType, Ubc = BCSide, None
+            else:
+                BCType, Ubc = BCSide
+            if BCType.upper() not in FetchOptions().BCTypeOptions():
+                raise InvalidValueError("BC_TYPE", BCType)
+            BCTypes.append(BCType.upper())
+            if BCType.upper() == 'DIRICHLET':
+                if Ubc is not None:
+                    self.Segments.append((dst, None, Ubc))
+            elif BCType.upper() == 'NEUMANN':
+                Ubc = 0.0 if Ubc is None else Ubc
+                self.Segments.append((slice(dst, dst+1 or None),
+                                      slice(src, src+1),
+                                      Ubc*dX))
+            elif BCType.upper() == 'PERIODIC':
+                self.Segments.append((slice(dst, dst+1 or None),
+                                      slice(-src-1, -src or None),
+                                      0.0))
+        if BCTypes.count('PERIODIC') == 1:
+            raise InvalidValueError("BC_TYPE", "PERIODIC")
+
+
+def _PeriodicIndex(src):
+    """Return the index of the interior points opposite to src."""
+    i, j = src
+    if isinstance(i, int):
+        return (-i-1, j)
+    else:
+        return (i, -j-1)
 
 
 def BC2D(U, BC, delX, delY):
@@ -182,6 +328,8 @@ def BC2D(U, BC, delX, delY):
 
     This function uses the conditions specified in the boundary
     configuration file which is provided as an argument to this function.
+    The settings are compiled at every call; to apply the same boundary
+    conditions at every step, create a BCPlan once and call its Apply().
 
     Call signature;
         BC(U, BC, delX, delY)
@@ -203,35 +351,4 @@ def BC2D(U, BC, delX, delY):
     U: ndarray[float], =2d
         Updated boundary conditions for the dependent variable.
     """
-    Inlet, Wall, Farf, Outlet = BC
-    InletAxis1, Ain1, Bin1, InletAxis2, Ain2, Bin2, InBCType, Uin = Inlet
-    WallAxis1, Aw1, Bw1, WallAxis2, Aw2, Bw2, WallBCType, Uw = Wall
-    FarfAxis1, Aff1, Bff1, FarfAxis2, Aff2, Bff2, FarfBCType, Uff = Farf
-    OutletAxis1, Ao1, Bo1, OutletAxis2, Ao2, Bo2, OutBCType, Uo = Outlet
-
-    # ---------------------------------------------------------------------
-    #                         INLET BOUNDARY CONDITIONS
-    # ---------------------------------------------------------------------
-    U = BCatAxis(U, InletAxis1, Uin, Ain1, Bin1, delX, delY)
-    if InletAxis2.lower() != 'none':
-        U = BCatAxis(U, InletAxis2, Uin, Ain2, Bin2, delX, delY)
-    # ---------------------------------------------------------------------
-    #                         WALL BOUNDARY CONDITIONS
-    # ---------------------------------------------------------------------
-    U = BCatAxis(U, WallAxis1, Uw, Aw1, Bw1, delX, delY)
-    if WallAxis2.lower() != 'none':
-        U = BCatAxis(U, WallAxis2, Uw, Aw2, Bw2, delX, delY)
-    # ---------------------------------------------------------------------
-    #                     FAR-FIELD BOUNDARY CONDITIONS
-    # ---------------------------------------------------------------------
-    U = BCatAxis(U, FarfAxis1, Uff, Aff1, Bff1, delX, delY)
-    if FarfAxis2.lower() != 'none':
-        U = BCatAxis(U, FarfAxis2, Uff, Aff2, Bff2, delX, delY)
-    # ---------------------------------------------------------------------
-    #                          OUTLET CONDITIONS
-    # ---------------------------------------------------------------------
-    U = BCatAxis(U, OutletAxis1, Uo, Ao1, Bo1, delX, delY)
-    if OutletAxis2.lower() != 'none':
-        U = BCatAxis(U, OutletAxis2, Uo, Ao2, Bo2, delX, delY)
-
-    return U
+    return BCPlan(BC, delX, delY).Apply(U)
@@ -0,0 +1,121 @@
+"""Binary checkpoint files to restart a simulation."""
+#   ***********************************************************************
+#
+#   FILE         checkpoint.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+from .exceptions import RestartFileError
+
+# A checkpoint file starts with a header of HEADER_SIZE bytes,
+#   magic (8 bytes), version, dimension, number of arrays (int32),
+#   IMAX, JMAX, n (int64), time (float64), config hash (32 bytes),
+# followed by U and, for three-level schemes, Uo2 as little-endian
+# float64 values in C order.
+MAGIC = b"NANPCHKP"
+VERSION = 1
+HEADER = struct.Struct("<8s3i3qd32s")
+HEADER_SIZE = 96
+DTYPE = np.dtype("<f8")
+# Sections of the configuration file which define the simulation that is
+# continued from a checkpoint. The IC, STOP and OUTPUT sections may be
+# changed when the simulation is restarted.
+HASH_SECTIONS = ["SETUP", "DOMAIN", "MESH", "BC", "CONST"]
+
+
+def config_hash(config):
+    """Return the SHA-256 digest of the simulation setup in config."""
+    h = hashlib.sha256()
+    for section in HASH_SECTIONS:
+        if not config.has_section(section):
+            continue
+        for key, value in sorted(config.items(section)):
+            h.update(f"{section}.{key}={value.strip()}\n".encode())
+    return h.digest()
+
+
+def save_checkpoint(fName, U, n, Time, Hash, Uo2=None):
+    """Write U, Uo2, the step n and the time to a checkpoint file.
+
+    The checkpoint is written to a temporary file which then replaces
+    fName, i.e. an interrupted write never destroys the last checkpoint.
+    """
+    arrays = [U] if Uo2 is None else [U, Uo2]
+    iM, jM = (U.shape[0], 1) if U.ndim == 1 else U.shape
+    header = HEADER.pack(MAGIC, VERSION, U.ndim, len(arrays), iM, jM, n,
+                         Time, Hash)
+    tmpName = fName + ".tmp"
+    with open(tmpName, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+        for array in arrays:
+            f.write(np.ascontiguousarray(array, dtype=DTYPE).data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmpName, fName)
+
+
+def load_checkpoint(fName, Hash=None, shape=None):
+    """Return the contents of a checkpoint file as a dict.
+
+    The dict contains the keys "U", "Uo2" (None if not stored), "n" and
+    "Time". RestartFileError is raised if the checkpoint was written by
+    a simulation with a different setup Hash or solution shape.
+    """
+    with open(fName, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+            raise RestartFileError(fName, "not a NAnPack checkpoint")
+        (magic, version, dim, nArrays, iM, jM, n, Time,
+         fileHash) = HEADER.unpack(header[:HEADER.size])
+        shapeU = (iM,) if dim == 1 else (iM, jM)
+        if Hash is not None and fileHash != Hash:
+            raise RestartFileError(fName, "the checkpoint was written with\
+ a different simulation setup")
+        if shape is not None and tuple(shape) != shapeU:
+            raise RestartFileError(fName, f"the checkpoint solution has\
+ shape {shapeU} instead of {tuple(shape)}")
+        data = np.fromfile(f, dtype=DTYPE, count=nArrays*iM*jM)
+    if data.size != nArrays*iM*jM:
+        raise RestartFileError(fName, "the checkpoint file is truncated")
+    arrays = data.reshape((nArrays,) + shapeU)
+    Uo2 = arrays[1] if nArrays == 2 else None
+    return {"U": arrays[0], "Uo2": Uo2, "n": n, "Time": Time}
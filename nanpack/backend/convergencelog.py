@@ -0,0 +1,220 @@
+"""Buffered convergence history log."""
+#   ***********************************************************************
+#
+#   FILE         convergencelog.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from .fetchoptions import FetchOptions
+from .exceptions import LogFormatInputError
+from .writefiles import write_steadyst_notconv_msg, write_steadyst_conv_msg
+from .writefiles import write_transient_conv_msg
+
+# A binary log file starts with MAGIC followed by the rows stored as
+# little-endian records of ROW. Text and CSV logs store the same columns.
+MAGIC = b"NANPHIST"
+ROW = np.dtype([("n", "<i8"), ("Error", "<f8"), ("L1", "<f8"),
+                ("L2", "<f8"), ("Linf", "<f8")])
+
+
+class ConvergenceLog:
+    """Log of the convergence history kept open during the simulation.
+
+    The logged rows are buffered in a NumPy array and written to the
+    file in blocks of BufferSize rows, the file is opened only once.
+    Each row contains the iteration level, the error and the L1, L2 and
+    Linf norms of the residual (NaN if no residual is provided).
+
+    Call signature:
+        ConvergenceLog(CfgClsObj=None, HistFName=None, Format="Text",
+                       BufferSize=256)
+
+    Attributes
+    ----------
+    CfgClsObj: class object, Default=None
+        Object of the class RunConfig. If provided, the rows are logged
+        every nDisplay iterations, at nMax and at convergence, and the
+        convergence status message is written at the end of the log.
+        Otherwise every row is logged.
+    HistFName: str, Default=None
+        File name of the log, default is CfgClsObj.HistFileName.
+    Format: str, Default="Text"
+        "Text", "CSV" or "Binary".
+    BufferSize: int, Default=256
+        Number of rows kept in the memory before they are written.
+    """
+
+    def __init__(self, CfgClsObj=None, HistFName=None, Format="Text",
+                 BufferSize=256):
+        """Class constructor for the ConvergenceLog class."""
+        if Format not in FetchOptions().LogFormatOptions():
+            raise LogFormatInputError(Format)
+        if HistFName is None:
+            HistFName = CfgClsObj.HistFileName
+        self.CfgClsObj = CfgClsObj
+        self.HistFName = HistFName
+        self.Format = Format
+        self._rows = np.zeros(BufferSize, dtype=ROW)
+        self._count = 0
+        self._status = None
+        if Format == "Binary":
+            self._file = open(HistFName, "wb")
+            self._file.write(MAGIC)
+        else:
+            self._file = open(HistFName, "w")
+            self._file.write(_header(Format))
+
+    def __enter__(self):
+        """Return the log for use in a with statement."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the log at the end of a with statement."""
+        self.Close()
+
+    def Log(self, n, Error, Residual=None):
+        """Add the error at iteration level n to the log.
+
+        Call signature:
+            ConvergenceLog.Log(n, Error, Residual=None)
+
+        Parameters
+        ----------
+        n: int
+            Iteration level (time level).
+        Error: float
+            Error in the solution at the iteration level.
+        Residual: ndarray[float], =1d, 2d, Default=None
+            Residual whose norms are logged, e.g. U - Uold.
+        """
+        cfg = self.CfgClsObj
+        if cfg is not None and not (n % cfg.nDisplay == 0
+                                    or n == cfg.nMax
+                                    or Error < cfg.ConvCrit):
+            return
+        if Residual is None:
+            self._rows[self._count] = (n, Error, np.nan, np.nan, np.nan)
+        else:
+            absR = np.abs(Residual)
+            self._rows[self._count] = (n, Error, absR.sum(),
+                                       np.sqrt(np.square(absR).sum()),
+                                       absR.max())
+        self._count += 1
+        if self._count == self._rows.size:
+            self.Flush()
+        if cfg is not None and self._status is None:
+            self._status = _status_message(cfg, n, Error)
+
+    def Flush(self):
+        """Write the buffered rows to the file."""
+        rows = self._rows[:self._count]
+        if self.Format == "Binary":
+            rows.tofile(self._file)
+        elif rows.size > 0:
+            sep = "," if self.Format == "CSV" else " "
+            fmt = _row_format(self.Format)
+            self._file.write("".join(
+                fmt.format(*row, sep=sep) for row in rows.tolist()))
+        self._count = 0
+        self._file.flush()
+
+    def Close(self):
+        """Write the buffered rows and the status message, close the file."""
+        if self._file.closed:
+            return
+        self.Flush()
+        if self._status is not None and self.Format == "Text":
+            print(self._status, file=self._file)
+        self._file.close()
+        if self._status is not None:
+            print("Writing convergence log file: Completed.")
+            print("Files saved:")
+            print(f'"{self.HistFName}".')
+
+
+def read_convergence_log(fName):
+    """Return the rows of a convergence log as a structured array."""
+    with open(fName, "rb") as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return np.fromfile(f, dtype=ROW)
+    with open(fName) as f:
+        lines = f.read().splitlines()
+    if lines[0].startswith("ITER,"):
+        table = [line.split(",") for line in lines[1:]]
+    else:
+        # Skip the header, stop at the status message
+        table = []
+        for line in lines[2:]:
+            if not line.strip():
+                break
+            table.append(line.split())
+    # Logs written by WriteConvHistToFile() have no residual norms
+    rows = np.zeros(len(table), dtype=ROW)
+    for k, name in enumerate(ROW.names):
+        rows[name] = [row[k] if k < len(row) else "nan" for row in table]
+    return rows
+
+
+def _header(Format):
+    """Return the header lines of a text or CSV log."""
+    if Format == "CSV":
+        return ",".join(["ITER", "ERROR", "L1", "L2", "LINF"]) + "\n"
+    return (f'{"ITER":>7} {"ERROR":>15} {"L1":>15} {"L2":>15}'
+            f' {"LINF":>15}\n'
+            f'{"----":>7} {"-----":>15} {"--":>15} {"--":>15}'
+            f' {"----":>15}\n')
+
+
+def _row_format(Format):
+    """Return the format string of a row of a text or CSV log."""
+    if Format == "CSV":
+        return "{0}{sep}{1:.17g}{sep}{2:.17g}{sep}{3:.17g}{sep}{4:.17g}\n"
+    return "{0:>7}{sep}{1:>15.8f}{sep}{2:>15.8e}{sep}{3:>15.8e}\
+{sep}{4:>15.8e}\n"
+
+
+def _status_message(cfg, n, Error):
+    """Return the convergence status message, None if not finished."""
+    if cfg.State.upper() == "STEADY":
+        if n == cfg.nMax and Error > cfg.ConvCrit:
+            return write_steadyst_notconv_msg(cfg.nMax)
+        elif Error < cfg.ConvCrit:
+            return write_steadyst_conv_msg(n, cfg.ConvCrit)
+    elif cfg.State.upper() == "TRANSIENT" and n == cfg.nMax:
+        return write_transient_conv_msg(cfg.nMax, cfg.totTime)
+    return None
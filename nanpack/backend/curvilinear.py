@@ -0,0 +1,166 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         curvilinear.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from .mesh_elliptic import is_periodic
+from .meshmetrics import cached_metrics
+
+
+class LaplaceOperator:
+    """Laplacian on a curvilinear grid in the computational coordinates.
+
+    The Laplacian of u is written in the conservative form
+        JJ*[(g11 u_xi + g12 u_eta)_xi + (g12 u_xi + g22 u_eta)_eta],
+    in which g11 = (XiX^2 + XiY^2)/JJ, g12 = (XiX EtaX + XiY EtaY)/JJ
+    and g22 = (EtaX^2 + EtaY^2)/JJ are evaluated once from the metrics of
+    the grid. g11 and g22 are averaged to the cell faces between the grid
+    points and the mixed derivatives use the four diagonal neighbours,
+    which gives a nine-point stencil
+        JJ*(aE u(i+1,j) + aW u(i-1,j) + aN u(i,j+1) + aS u(i,j-1)
+            - aP u(i,j) + cross terms).
+    All coefficient arrays are stored at the unknown points, the interior
+    points or, on a periodic grid (O-grid), all points except the line
+    i = iM which is the same as the line i = 1.
+
+    Call signature:
+        LaplaceOperator(Metrics, periodic)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax, jMax) of the grid.
+    periodic: bool
+        True if the grid is periodic along the index i.
+    I: slice
+        The lines i of the unknown points.
+    """
+
+    def __init__(self, Metrics, periodic):
+        """Class constructor for the LaplaceOperator class."""
+        XiX, XiY, EtaX, EtaY, JJ = Metrics.Metrics()
+        iM, jM = JJ.shape
+        self.shape = (iM, jM)
+        self.periodic = periodic
+        self.I = slice(0, iM-1) if periodic else slice(1, iM-1)
+        # Rows of the unknown points and their neighbours in Extend(U)
+        first = 1 if periodic else 2
+        self._C = slice(first, iM)
+        self._W = slice(first-1, iM-1)
+        self._E = slice(first+1, iM+1)
+        g11 = (XiX*XiX + XiY*XiY)/JJ
+        g12 = (XiX*EtaX + XiY*EtaY)/JJ
+        g22 = (EtaX*EtaX + EtaY*EtaY)/JJ
+        G11 = self.Extend(g11)
+        G12 = self.Extend(g12)/4.0
+        C, W, E = self._C, self._W, self._E
+        self.aW = 0.5*(G11[W, 1:-1] + G11[C, 1:-1])
+        self.aE = 0.5*(G11[C, 1:-1] + G11[E, 1:-1])
+        self.aS = 0.5*(g22[self.I, 0:-2] + g22[self.I, 1:-1])
+        self.aN = 0.5*(g22[self.I, 1:-1] + g22[self.I, 2:])
+        self.aP = self.aE + self.aW + self.aN + self.aS
+        self.cW = G12[W, 1:-1]
+        self.cE = G12[E, 1:-1]
+        self.cS = G12[C, 0:-2]
+        self.cN = G12[C, 2:]
+        self.JJ = np.array(JJ[self.I, 1:-1])
+        i, j = np.indices(self.JJ.shape)
+        self.Red = (i + j) % 2 == 0  # points of the red-black ordering
+
+    def Extend(self, U):
+        """Return U with a ghost line before the line 1 and after iM.
+
+        On a periodic grid the ghost lines are the lines iM-1 and 2, on
+        other grids they are copies of the boundary lines and not used.
+        """
+        if self.periodic:
+            return np.concatenate([U[-2:-1], U, U[1:2]])
+        return np.concatenate([U[0:1], U, U[-1:]])
+
+    def XiTerms(self, Ux):
+        """Return aE u(i+1,j) + aW u(i-1,j) from Ux = Extend(U)."""
+        return self.aE*Ux[self._E, 1:-1] + self.aW*Ux[self._W, 1:-1]
+
+    def EtaTerms(self, U):
+        """Return aN u(i,j+1) + aS u(i,j-1)."""
+        return self.aN*U[self.I, 2:] + self.aS*U[self.I, 0:-2]
+
+    def Cross(self, Ux):
+        """Return the mixed derivative terms from Ux = Extend(U)."""
+        NE = Ux[self._E, 2:]
+        SE = Ux[self._E, 0:-2]
+        NW = Ux[self._W, 2:]
+        SW = Ux[self._W, 0:-2]
+        return (self.cE*(NE - SE) - self.cW*(NW - SW)
+                + self.cN*(NE - NW) - self.cS*(SE - SW))
+
+    def Laplacian(self, U):
+        """Return the Laplacian of U at the unknown points."""
+        Ux = self.Extend(U)
+        L = self.XiTerms(Ux) + self.EtaTerms(U) + self.Cross(Ux)
+        L -= self.aP*U[self.I, 1:-1]
+        L *= self.JJ
+        return L
+
+    def MaxDiffT(self):
+        """Return the largest stable diffusivity*dT of the FTCS method.
+
+        This is the limit of the terms without the mixed derivatives,
+        i.e. of an orthogonal grid, and 1/(2/dX^2 + 2/dY^2) on a
+        rectangular grid.
+        """
+        return 1.0/np.max(self.JJ*self.aP)
+
+
+def laplace_operator(X, Y, periodic=None):
+    """Return the LaplaceOperator of the grid X, Y, created once per grid.
+
+    The operator is stored with the cached metrics of the grid (see
+    cached_metrics()) so that the solvers called at every time step or
+    iteration reuse the coefficient arrays. If periodic is None, the grid
+    is periodic if its first and last lines i are the same (O-grid).
+    """
+    Metrics = cached_metrics(X, Y)
+    if periodic is None:
+        periodic = is_periodic(X, Y)
+    key = ("laplace", bool(periodic))
+    if key not in Metrics.Derived:
+        Metrics.Derived[key] = LaplaceOperator(Metrics, bool(periodic))
+    return Metrics.Derived[key]
@@ -113,6 +113,112 @@ class TVDLimiterFunctionInputError(Exception):
         super().__init__(self.msg)
 
 
+class SweepOrderingInputError(Exception):
+    """Raise exception when an invalid grid point ordering is entered."""
+
+    def __init__(self, ordering, method):
+        self.msg = f"Invalid sweep ordering {ordering} provided in the\
+ call to {method}() function."
+        super().__init__(self.msg)
+
+
+class MultigridSmootherInputError(Exception):
+    """Raise exception when an invalid multigrid smoother is entered."""
+
+    def __init__(self, smoother, method):
+        self.msg = f"Invalid multigrid smoother {smoother} provided in\
+ the call to {method}() function."
+        super().__init__(self.msg)
+
+
+class PreconditionerInputError(Exception):
+    """Raise exception when an invalid preconditioner is entered."""
+
+    def __init__(self, precond, method):
+        self.msg = f"Invalid preconditioner {precond} provided in the\
+ call to {method}() function."
+        super().__init__(self.msg)
+
+
+class BackendInputError(Exception):
+    """Raise exception when an invalid kernel backend is entered."""
+
+    def __init__(self, backend):
+        self.msg = f"Invalid backend {backend} provided in the call to\
+ set_backend() function."
+        super().__init__(self.msg)
+
+
+class BackendNotAvailableError(Exception):
+    """Raise exception when the package for a backend is not installed."""
+
+    def __init__(self, backend, package):
+        self.msg = f"The {backend} backend requires the package {package}\
+ which is not installed."
+        super().__init__(self.msg)
+
+
+class OutputFormatInputError(Exception):
+    """Raise exception when an invalid output file format is entered."""
+
+    def __init__(self, fmt):
+        self.msg = f"Invalid output file format {fmt} provided. Use\
+ \"Text\" or \"Binary\"."
+        super().__init__(self.msg)
+
+
+class LogFormatInputError(Exception):
+    """Raise exception when an invalid convergence log format is entered."""
+
+    def __init__(self, fmt):
+        self.msg = f"Invalid convergence log format {fmt} provided. Use\
+ \"Text\", \"CSV\" or \"Binary\"."
+        super().__init__(self.msg)
+
+
+class RestartFileError(Exception):
+    """Raise exception when a checkpoint does not match the simulation."""
+
+    def __init__(self, file, text):
+        self.msg = f"Cannot restart from {file}: {text}."
+        super().__init__(self.msg)
+
+
+class ResidualNormInputError(Exception):
+    """Raise exception when an invalid residual norm is entered."""
+
+    def __init__(self, norm):
+        self.msg = f"Invalid residual norm {norm} provided. Use \"L1\",\
+ \"L2\" or \"Linf\"."
+        super().__init__(self.msg)
+
+
+class ResidualTypeInputError(Exception):
+    """Raise exception when an invalid residual type is entered."""
+
+    def __init__(self, residual):
+        self.msg = f"Invalid residual type {residual} provided. Use\
+ \"Difference\" or \"Laplace\"."
+        super().__init__(self.msg)
+
+
+class SimulationHookInputError(Exception):
+    """Raise exception when an invalid simulation hook event is entered."""
+
+    def __init__(self, event):
+        self.msg = f"Invalid simulation hook event {event} provided. Use\
+ \"PreStep\", \"PostStep\" or \"End\"."
+        super().__init__(self.msg)
+
+
+class MeshFileError(Exception):
+    """Raise exception when a mesh file cannot be used."""
+
+    def __init__(self, file, text):
+        self.msg = f"Cannot read the mesh from {file}: {text}."
+        super().__init__(self.msg)
+
+
 class MeshingInputError(Exception):
     """Raise exception for invalid inputs in the  grid functions."""
 
@@ -76,6 +76,21 @@ class FetchOptions:
                         "2D"]
         return self.options
 
+    def BCTypeOptions(self):
+        """Return a list of allowed inputs for BC_TYPE key in BC file."""
+        self.options = ["DIRICHLET",
+                        "NEUMANN",
+                        "PERIODIC"]
+        return self.options
+
+    def BCAxisOptions(self):
+        """Return a list of allowed inputs for AXIS keys in BC file."""
+        self.options = ["X-lo",
+                        "X-hi",
+                        "Y-lo",
+                        "Y-hi"]
+        return self.options
+
     def TVDLimiterFunctionOptions(self):
         """Return a list of allowed inputs for Limiter functions.
 
@@ -88,6 +103,100 @@ class FetchOptions:
                         "Davis-Yee-Symmetric"]
         return self.options
 
+    def SweepOrderingOptions(self):
+        """Return a list of allowed inputs for grid point ordering.
+
+        The Ordering argument is optional in the call to functions
+        PointGaussSeidel() and PSOR().
+        """
+        self.options = ["Lexicographic",
+                        "Red-Black"]
+        return self.options
+
+    def MultigridSmootherOptions(self):
+        """Return a list of allowed inputs for multigrid smoothers.
+
+        The Smoother argument is optional in the call to functions
+        MultigridV() and FullMultigrid().
+        """
+        self.options = ["Red-Black",
+                        "Zebra-Line"]
+        return self.options
+
+    def PreconditionerOptions(self):
+        """Return a list of allowed inputs for Krylov preconditioners.
+
+        The Precond argument is optional in the call to function
+        ConjugateGradient().
+        """
+        self.options = ["SSOR",
+                        "Jacobi",
+                        "None"]
+        return self.options
+
+    def BackendOptions(self):
+        """Return a list of allowed inputs for the kernel backend.
+
+        The backend argument is required in the call to function
+        set_backend().
+        """
+        self.options = ["numpy",
+                        "numba",
+                        "python"]
+        return self.options
+
+    def OutputFormatOptions(self):
+        """Return a list of allowed inputs for the solution file format.
+
+        The Format argument is optional in the call to functions
+        WriteSolutionToFile() and save_solution().
+        """
+        self.options = ["Text",
+                        "Binary"]
+        return self.options
+
+    def LogFormatOptions(self):
+        """Return a list of allowed inputs for the convergence log format.
+
+        The Format argument is optional in the call to ConvergenceLog().
+        """
+        self.options = ["Text",
+                        "CSV",
+                        "Binary"]
+        return self.options
+
+    def ResidualNormOptions(self):
+        """Return a list of allowed inputs for the residual norms.
+
+        The Norm argument is optional in the call to ResidualNorm() and
+        ResidualMonitor().
+        """
+        self.options = ["L1",
+                        "L2",
+                        "Linf"]
+        return self.options
+
+    def ResidualTypeOptions(self):
+        """Return a list of allowed inputs for the residual types.
+
+        The Residual argument is optional in the call to ResidualNorm()
+        and ResidualMonitor().
+        """
+        self.options = ["Difference",
+                        "Laplace"]
+        return self.options
+
+    def SimulationHookOptions(self):
+        """Return a list of allowed events for the simulation hooks.
+
+        The Event argument is required in the call to
+        Simulation.AddHook().
+        """
+        self.options = ["PreStep",
+                        "PostStep",
+                        "End"]
+        return self.options
+
     def GeomTemplateOptions(self):
         """Return a list of allowed inputs for geometry templates.
 
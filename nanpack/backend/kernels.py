@@ -0,0 +1,292 @@
+"""Sequential kernels with selectable numpy, numba or python backend."""
+#   ***********************************************************************
+#
+#   FILE         kernels.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from . import fetchoptions as fo
+from .exceptions import BackendInputError
+from .exceptions import BackendNotAvailableError
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Some algorithms cannot be written with array slices without changing
+# their results: the lexicographic point Gauss-Seidel and PSOR sweeps use
+# the new values at (i-1,j) and (i,j-1), and the Thomas algorithm is a
+# recursion. The kernels in this module implement them for three
+# backends, all of which produce identical numerical output:
+#   "numpy"  - default; sweeps are vectorized along the anti-diagonals
+#              i + j = const, whose points depend only on the previous
+#              anti-diagonal, so that the Gauss-Seidel order is kept.
+#   "numba"  - the point by point loops compiled with numba.njit, only
+#              available when numba is installed.
+#   "python" - the point by point loops in plain Python.
+# The Thomas recursion has no vectorized form and runs as a Python loop
+# with both the "numpy" and the "python" backend.
+
+_state = {"backend": "numpy"}
+
+
+def set_backend(backend):
+    """Select the backend used by the sequential kernels.
+
+    Call signature:
+        set_backend(backend)
+
+    Parameters
+    ----------
+    backend: str
+        "numpy", "numba" or "python".
+    """
+    fetch = fo.FetchOptions()
+    if backend not in fetch.BackendOptions():
+        raise BackendInputError(backend)
+    if backend == "numba":
+        if numba is None:
+            raise BackendNotAvailableError(backend, "numba")
+        _compile_numba_kernels()
+    _state["backend"] = backend
+
+
+def get_backend():
+    """Return the name of the backend used by the sequential kernels."""
+    return _state["backend"]
+
+
+def pgs_sweep(U, A, B2):
+    """Perform one lexicographic point Gauss-Seidel sweep on U in place."""
+    return _kernel("pgs_sweep")(U, A, B2)
+
+
+def psor_sweep(U, A, B2, omega):
+    """Perform one lexicographic point SOR sweep on U in place."""
+    return _kernel("psor_sweep")(U, A, B2, omega)
+
+
+def thomas(tMax, A, B, C, D, UU):
+    """Solve one tridiagonal system with the Thomas algorithm.
+
+    UU holds the boundary values at t = 0 and t = tMax-1 on input and is
+    overwritten with the solution at the interior points.
+    """
+    if _state["backend"] != "numba":
+        H = [0 for t in range(tMax)]  # initialize H
+        G = [0 for t in range(tMax)]  # initialize G
+        return _thomas_python(tMax, A, B, C, D, UU, H, G)
+
+    H = np.zeros(tMax)
+    G = np.zeros(tMax)
+    X = np.array(UU, dtype=float)
+    _kernel("thomas")(tMax, _as_float(A), _as_float(B), _as_float(C),
+                      _as_float(D), X, H, G)
+    if isinstance(UU, np.ndarray):
+        UU[1:tMax-1] = X[1:tMax-1]
+    else:
+        UU[1:tMax-1] = X[1:tMax-1].tolist()
+    return UU
+
+
+def ogrid_interior(x, y, S, cosA, sinA, imid, i_lower_mid, i_upper_mid):
+    """Place the interior points of an O-grid along the lines i in place.
+
+    The point (i,j) is located at the distance S(i,j) from the inner
+    boundary point (i,0) in the direction of the angle whose cosine and
+    sine are cosA(i) and sinA(i). The signs depend on the quadrant of
+    the line, given by imid, i_lower_mid and i_upper_mid.
+    """
+    return _kernel("ogrid_interior")(x, y, S, _as_float(cosA),
+                                     _as_float(sinA), imid, i_lower_mid,
+                                     i_upper_mid)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#                          PYTHON KERNELS                            +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# These are also compiled by numba, so they must use a subset of Python
+# which numba supports in nopython mode.
+
+
+def _pgs_sweep_python(U, A, B2):
+    iMax, jMax = U.shape
+    for i in range(1, iMax-1):
+        for j in range(1, jMax-1):
+            U[i, j] = A*(U[i+1, j] + U[i-1, j]
+                         +
+                         B2*(U[i, j+1] + U[i, j-1]))
+    return U
+
+
+def _psor_sweep_python(U, A, B2, omega):
+    iMax, jMax = U.shape
+    for i in range(1, iMax-1):
+        for j in range(1, jMax-1):
+            U[i, j] = (
+                (1 - omega)*U[i, j]
+                + omega*A*(U[i+1, j] + U[i-1, j]
+                           + B2*(U[i, j+1] + U[i, j-1]))
+                )
+    return U
+
+
+def _thomas_python(tMax, A, B, C, D, UU, H, G):
+    H[0] = 0.0
+    G[0] = UU[0]
+    for t in range(1, tMax-1):
+        # Equation B-8 and B-9 in CFD Vol. 1 by Klaus Hoffmann
+        H[t] = C[t]/(B[t] - A[t]*H[t-1])
+        G[t] = (D[t] - A[t]*G[t-1])/(B[t] - A[t]*H[t-1])
+
+    for t in range(tMax-2, 0, -1):
+        # Equation B-5 in CFD Vol. 1 by Klaus Hoffmann
+        UU[t] = -H[t]*UU[t+1] + G[t]
+    return UU
+
+
+def _ogrid_interior_python(x, y, S, cosA, sinA, imid, i_lower_mid,
+                           i_upper_mid):
+    iM, jM = x.shape
+    for j in range(1, jM-1):
+        for i in range(0, iM-1):
+            if i < i_lower_mid:
+                x[i, j] = x[i, 0] + S[i, j]*cosA[i]
+                y[i, j] = y[i, 0] - S[i, j]*sinA[i]
+            elif i_lower_mid <= i < imid:
+                x[i, j] = x[i, 0] - S[i, j]*cosA[i]
+                y[i, j] = y[i, 0] - S[i, j]*sinA[i]
+            elif imid <= i < i_upper_mid:
+                x[i, j] = x[i, 0] - S[i, j]*cosA[i]
+                y[i, j] = y[i, 0] + S[i, j]*sinA[i]
+            else:
+                x[i, j] = x[i, 0] + S[i, j]*cosA[i]
+                y[i, j] = y[i, 0] + S[i, j]*sinA[i]
+        x[iM-1, j] = x[0, j]
+        y[iM-1, j] = y[0, j]
+    return x, y
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#                           NUMPY KERNELS                            +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def _anti_diagonals(iMax, jMax):
+    """Yield the interior points (I, J) on each anti-diagonal i + j = k."""
+    for k in range(2, iMax+jMax-3):
+        I = np.arange(max(1, k-jMax+2), min(iMax-2, k-1)+1)
+        yield I, k - I
+
+
+def _pgs_sweep_numpy(U, A, B2):
+    iMax, jMax = U.shape
+    for I, J in _anti_diagonals(iMax, jMax):
+        U[I, J] = A*(U[I+1, J] + U[I-1, J]
+                     +
+                     B2*(U[I, J+1] + U[I, J-1]))
+    return U
+
+
+def _psor_sweep_numpy(U, A, B2, omega):
+    iMax, jMax = U.shape
+    for I, J in _anti_diagonals(iMax, jMax):
+        U[I, J] = (
+            (1 - omega)*U[I, J]
+            + omega*A*(U[I+1, J] + U[I-1, J]
+                       + B2*(U[I, J+1] + U[I, J-1]))
+            )
+    return U
+
+
+def _ogrid_interior_numpy(x, y, S, cosA, sinA, imid, i_lower_mid,
+                          i_upper_mid):
+    iM, jM = x.shape
+    i = np.arange(iM-1)
+    # Signs of the cosine and sine terms in each quadrant, in the same
+    # order of precedence as the branches of _ogrid_interior_python()
+    quadrant = [i < i_lower_mid, i < imid, i < i_upper_mid]
+    sx = np.select(quadrant, [1.0, -1.0, -1.0], 1.0)[:, np.newaxis]
+    sy = np.select(quadrant, [-1.0, -1.0, 1.0], 1.0)[:, np.newaxis]
+    cosA = cosA[:-1, np.newaxis]
+    sinA = sinA[:-1, np.newaxis]
+    x[:-1, 1:-1] = x[:-1, 0:1] + sx*(S[:-1, 1:-1]*cosA)
+    y[:-1, 1:-1] = y[:-1, 0:1] + sy*(S[:-1, 1:-1]*sinA)
+    x[-1, 1:-1] = x[0, 1:-1]
+    y[-1, 1:-1] = y[0, 1:-1]
+    return x, y
+
+
+_KERNELS = {
+    "numpy": {
+        "pgs_sweep": _pgs_sweep_numpy,
+        "psor_sweep": _psor_sweep_numpy,
+        "ogrid_interior": _ogrid_interior_numpy
+        },
+    "python": {
+        "pgs_sweep": _pgs_sweep_python,
+        "psor_sweep": _psor_sweep_python,
+        "ogrid_interior": _ogrid_interior_python
+        },
+    "numba": {}
+    }
+
+_PYTHON_KERNELS = {
+    "pgs_sweep": _pgs_sweep_python,
+    "psor_sweep": _psor_sweep_python,
+    "thomas": _thomas_python,
+    "ogrid_interior": _ogrid_interior_python
+    }
+
+
+def _compile_numba_kernels():
+    """Wrap the python kernels with numba.njit once."""
+    if not _KERNELS["numba"]:
+        for name, func in _PYTHON_KERNELS.items():
+            _KERNELS["numba"][name] = numba.njit(cache=True)(func)
+
+
+def _kernel(name):
+    """Return the kernel name for the selected backend."""
+    return _KERNELS[_state["backend"]][name]
+
+
+def _as_float(X):
+    """Return X as a float ndarray for the compiled kernels."""
+    return np.asarray(X, dtype=float)
@@ -0,0 +1,126 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         krylov.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from .relaxation import symmetric_red_black_sweep
+
+
+def apply_operator(X, B2, out):
+    """Apply the negative five-point Laplace operator to X.
+
+    out = 2(1+B2)X(i,j) - [X(i+1,j) + X(i-1,j) + B2*(X(i,j+1) + X(i,j-1))]
+    at the interior points and 0 at the boundary points. With zero
+    boundary values of X this is a symmetric positive definite operator
+    on the interior unknowns; it is never assembled as a matrix.
+    """
+    out[1:-1, 1:-1] = (2.0*(1.0 + B2)*X[1:-1, 1:-1]
+                       - (X[2:, 1:-1] + X[0:-2, 1:-1]
+                          + B2*(X[1:-1, 2:] + X[1:-1, 0:-2])))
+    return out
+
+
+def residual(U, B2, F=None):
+    """Return the residual b - A*U at the interior points.
+
+    The Dirichlet boundary values of U are part of b, so that the
+    residual is computed directly from the five-point equation.
+    """
+    R = np.zeros_like(U)
+    R[1:-1, 1:-1] = (U[2:, 1:-1] + U[0:-2, 1:-1]
+                     + B2*(U[1:-1, 2:] + U[1:-1, 0:-2])
+                     - 2.0*(1.0 + B2)*U[1:-1, 1:-1])
+    if F is not None:
+        R[1:-1, 1:-1] -= F[1:-1, 1:-1]
+    return R
+
+
+def precondition(R, B2, precond, omega, Z):
+    """Return Z = inverse(M)*R for the selected preconditioner M."""
+    if precond == "SSOR":
+        # One symmetric red-black SOR sweep on A*Z = R from Z = 0.
+        # The relaxation works on the equation -A*Z = F, hence F = -R.
+        Z.fill(0.0)
+        symmetric_red_black_sweep(Z, B2, omega, -R)
+    elif precond == "Jacobi":
+        Z[...] = R/(2.0*(1.0 + B2))
+    else:
+        Z[...] = R
+    return Z
+
+
+def pcg(U, B2, F, precond, omega, tol, maxIter):
+    """Solve the five-point equation with the preconditioned CG method.
+
+    U holds the initial guess at the interior points and the Dirichlet
+    boundary values, which are not modified. F is the right-hand side
+    of U(i+1,j) + U(i-1,j) + B2*(U(i,j+1) + U(i,j-1)) - 2(1+B2)U(i,j)
+    = F. The iterations stop when the L2 norm of the residual is reduced
+    by the factor tol relative to the right-hand side. Returns U and
+    the number of iterations performed.
+    """
+    R = residual(U, B2, F)
+    # Norm of b, i.e. the residual of the initial guess U = 0 with the
+    # boundary values contributing to b, for the relative criterion.
+    Ub = U.copy()
+    Ub[1:-1, 1:-1] = 0.0
+    bNorm = np.linalg.norm(residual(Ub, B2, F))
+    if bNorm == 0.0:
+        bNorm = 1.0
+
+    Q = np.zeros_like(U)
+    Z = precondition(R, B2, precond, omega, np.zeros_like(U))
+    P = Z.copy()
+    rz = np.vdot(R, Z)
+    n = 0
+    while n < maxIter and np.linalg.norm(R) > tol*bNorm:
+        n += 1
+        apply_operator(P, B2, Q)
+        alpha = rz/np.vdot(P, Q)
+        U[1:-1, 1:-1] += alpha*P[1:-1, 1:-1]
+        R -= alpha*Q
+        precondition(R, B2, precond, omega, Z)
+        rzNew = np.vdot(R, Z)
+        P *= rzNew/rz
+        P += Z
+        rz = rzNew
+
+    return U, n
+
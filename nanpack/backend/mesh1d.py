@@ -58,39 +58,33 @@ def meshing_func(clust_loc, Xi, dX, iM, alpha, beta):
 
 def clustering_left_wall(Xi, dX, iM, alpha, beta):
     # clust_opt option must always be ON in this type of mesh.
-    x = Xi.copy()
     A = dX * (iM-1)
     beta1 = calculate_beta1(beta)
-    for i in range(0, iM):
-        # Grid clustering near X = 0.0
-        xi1 = calculate_eta1(Xi[i], Xi[-1])
-        x[i] = A * (((beta+1.0) - (beta-1.0)*(beta1**xi1))
-                    / ((beta1**xi1)+1.0))
+    # Grid clustering near X = 0.0
+    xi1 = calculate_eta1(Xi, Xi[-1])
+    x = A * (((beta+1.0) - (beta-1.0)*(beta1**xi1))
+             / ((beta1**xi1)+1.0))
     return x
 
 
 def clustering_right_wall(Xi, dX, iM, alpha, beta):
     # clust_opt option must always be ON in this type of mesh.
-    x = Xi.copy()
     A = dX * (iM-1)
     beta1 = calculate_beta1(beta)
     alpha = 0.0
-    for i in range(0, iM):
-        # Grid clustering near X = A
-        xi1 = calculate_eta1(Xi[i], Xi[-1], False)
-        x[i] = get_clust_wall(xi1, alpha, beta, beta1, A)
+    # Grid clustering near X = A
+    xi1 = calculate_eta1(Xi, Xi[-1], False)
+    x = get_clust_wall(xi1, alpha, beta, beta1, A)
     return x
 
 
 def clustering_both_walls(Xi, dX, iM, alpha, beta):
     # clust_opt option must always be ON in this type of mesh.
-    x = Xi.copy()
     A = dX * (iM-1)
     beta1 = calculate_beta1(beta)
-    for i in range(0, iM):
-        # Grid clustering equally distributed between X = 0 and X = A
-        xi1 = calculate_eta1(Xi[i], Xi[-1], False)
-        x[i] = get_clust_wall(xi1, alpha, beta, beta1, A)
+    # Grid clustering equally distributed between X = 0 and X = A
+    xi1 = calculate_eta1(Xi, Xi[-1], False)
+    x = get_clust_wall(xi1, alpha, beta, beta1, A)
     return x
 
 
@@ -72,12 +72,8 @@ def curvilinear_coordinates(iM, jM):
     """Return grid points on the curvilinear coord. Xi, Eta."""
     dXi = 1.0
     dEta = 1.0
-    Xi = np.zeros((iM, jM), dtype="float")
-    Eta = np.zeros((iM, jM), dtype="float")
-    for i in range(0, iM):
-        for j in range(0, jM):
-            Xi[i][j] = i*dXi
-            Eta[i][j] = j*dEta
+    Xi, Eta = np.meshgrid(np.arange(0, iM)*dXi, np.arange(0, jM)*dEta,
+                          indexing="ij")
 
     return Xi, Eta
 
@@ -38,6 +38,7 @@
 #   ***********************************************************************
 
 import math
+import numpy as np
 from .util_clustering import clustering_parameter
 
 
@@ -66,26 +67,19 @@ def blunt_body_cone(length, cone_angle, cone_radius, major, minor,
     # distance from coordinate origin to center of blunt cone
     # quarter circle on x-axis
     o_dist = major - length + cone_radius
-    # Define grid points on the conical blunt body surface
-    for i in range(0, i1):
-        k = i1 - i - 1
-        x[i][0] = o_dist - cone_radius*math.sin(cthet[k])
-        y[i][0] = cone_radius*math.cos(cthet[k])
+    # Define grid points on the conical blunt body surface, the angles
+    # of the points i = 0..i1-1 are cthet[i1-1..0]
+    x[0:i1, 0] = o_dist - cone_radius*np.sin(cthet[::-1])
+    y[0:i1, 0] = cone_radius*np.cos(cthet[::-1])
     dh = cone_sh / (iM-i1)
-    for i in range(i1, iM):
-        k = i - i1 + 1
-        x[i][0] = o_dist + k*dh
-        y[i][0] = cone_radius + k*dh*math.sin(cone_ang_degree)
-    thet = calculate_angle_theta(i1_loc, iM, geo="ellip")
-    for i in range(0, iM):
-        k = iM - i - 1
-        # Equation after 9-56 in CFD Vol.1 by Dr. Hoffmann
-        ro1 = math.sin(thet[k])*math.sin(thet[k]) / (major*major)
-        ro2 = math.cos(thet[k])*math.cos(thet[k]) / (minor*minor)
-        r_o = 1.0 / math.sqrt(ro1+ro2)
-        # Define grid points on the outer ellipse surface
-        x[i][-1] = major - r_o*math.sin(thet[k])
-        y[i][-1] = r_o*math.cos(thet[k])
+    k = np.arange(1, iM-i1+1)
+    x[i1:, 0] = o_dist + k*dh
+    y[i1:, 0] = cone_radius + k*dh*math.sin(cone_ang_degree)
+    # Define grid points on the outer ellipse surface
+    thet = calculate_angle_theta(i1_loc, iM, geo="ellip")[::-1]
+    r_o = ellipse_radius(major, minor, thet)
+    x[:, -1] = major - r_o*np.sin(thet)
+    y[:, -1] = r_o*np.cos(thet)
 
     x, y = calculate_interior_mesh(x, y, Eta, iM, jM, beta, clust_opt)
 
@@ -103,55 +97,48 @@ def blunt_body_ellipt(major1, major2, minor1, minor2,
     x = Xi.copy()
     y = Xi.copy()
 
-    thet = calculate_angle_theta(i1_loc, iM, geo="ellip")
-
-    for i in range(0, iM):
-        # Equation after 9-56 in CFD Vol.1 by Dr. Hoffmann
-        k = iM - i - 1
-        ri1 = math.sin(thet[k])*math.sin(thet[k]) / (major2*major2)
-        ri2 = math.cos(thet[k])*math.cos(thet[k]) / (minor2*minor2)
-        r_i = 1.0 / math.sqrt(ri1+ri2)
-        # Define grid points on the elliptical blunt body surface
-        x[i][0] = major1 - r_i*math.sin(thet[k])
-        y[i][0] = r_i*math.cos(thet[k])
-
-        ro1 = math.sin(thet[k])*math.sin(thet[k]) / (major1*major1)
-        ro2 = math.cos(thet[k])*math.cos(thet[k]) / (minor1*minor1)
-        r_o = 1.0 / math.sqrt(ro1+ro2)
-        # Define grid points on the outer ellipse surface
-        x[i][-1] = major1 - r_o*math.sin(thet[k])
-        y[i][-1] = r_o*math.cos(thet[k])
+    # The angle of the grid line i is thet[iM-i-1]
+    thet = calculate_angle_theta(i1_loc, iM, geo="ellip")[::-1]
+    # Define grid points on the elliptical blunt body surface
+    r_i = ellipse_radius(major2, minor2, thet)
+    x[:, 0] = major1 - r_i*np.sin(thet)
+    y[:, 0] = r_i*np.cos(thet)
+    # Define grid points on the outer ellipse surface
+    r_o = ellipse_radius(major1, minor1, thet)
+    x[:, -1] = major1 - r_o*np.sin(thet)
+    y[:, -1] = r_o*np.cos(thet)
 
     x, y = calculate_interior_mesh(x, y, Eta, iM, jM, beta, clust_opt)
 
     return x, y
 
 
+def ellipse_radius(major, minor, thet):
+    """Return the distance of the ellipse points from the center."""
+    # Equation after 9-56 in CFD Vol.1 by Dr. Hoffmann
+    sin_t = np.sin(thet)
+    cos_t = np.cos(thet)
+    r1 = sin_t*sin_t / (major*major)
+    r2 = cos_t*cos_t / (minor*minor)
+    return 1.0 / np.sqrt(r1+r2)
+
+
 def calculate_interior_mesh(x, y, Eta, iM, jM, beta, clust_opt):
-    S = Eta.copy()
     # Calculate the distance, delI between j = jM and j = 1
     # Calculate the angle alpI of each line i from j = 1 to j = j jM
-    delI = []
-    alpha = []
-    for i in range(0, iM):
-        delxx = x[i, 0] - x[i, -1]
-        delyy = y[i, -1] - y[i, 0]
-        delI.append(math.sqrt(delxx*delxx + delyy*delyy))
-        alpha.append(math.asin(delyy/delI[i]))
+    delxx = x[:, 0] - x[:, -1]
+    delyy = y[:, -1] - y[:, 0]
+    delI = np.sqrt(delxx*delxx + delyy*delyy)
+    alpha = np.arcsin(delyy/delI)
 
     # Calculate interior grid point locations using
     # clustering option = True or False.
-    for i in range(0, iM):
-        for j in range(0, jM):
-            if clust_opt is True:
-                S[i][j] = clustering_parameter(Eta[i][j], Eta[i, -1],
-                                               beta, delI[i])
-            else:
-                S[i][j] = delI[i] * j / (jM - 1)
-    for j in range(1, jM-1):
-        for i in range(0, iM):
-            x[i][j] = x[i][0] - S[i][j]*math.cos(alpha[i])
-            y[i][j] = y[i][0] + S[i][j]*math.sin(alpha[i])
+    if clust_opt is True:
+        S = clustering_parameter(Eta, Eta[:, -1:], beta, delI[:, None])
+    else:
+        S = delI[:, None] * np.arange(0, jM) / (jM - 1)
+    x[:, 1:-1] = x[:, 0:1] - S[:, 1:-1]*np.cos(alpha)[:, None]
+    y[:, 1:-1] = y[:, 0:1] + S[:, 1:-1]*np.sin(alpha)[:, None]
 
     return x, y
 
@@ -164,11 +151,8 @@ def calculate_angle_theta(i1loc, im, geo):
         d_alp = calculate_angle_alpha_cone(i1loc, im)
     else:
         raise Exception(f"angle error in {geo} mesh.")
-    thet = [0.0 for i in range(0, im)]
     # Calculate angle theta along all grid lines i
-    for i in range(0, im):
-        # t = im - i - 1
-        thet[i] = i*d_alp
+    thet = np.arange(0, im)*d_alp
     return thet
 
 
@@ -0,0 +1,251 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         mesh_elliptic.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from ..tridiagonal import BatchTridiagonalSolver
+
+# Smallest number of points of a grid in the grid sequence
+MIN_POINTS = 9
+
+
+def is_periodic(x, y):
+    """Return True if the first and the last line i are the same (O-grid)."""
+    return bool(np.array_equal(x[0], x[-1]) and np.array_equal(y[0], y[-1]))
+
+
+def elliptic_mesh(x, y, periodic=None, control=True, omega=1.5, tol=1e-5,
+                  n_max=1000, sequence=True):
+    """Return the elliptic grid with the boundary points of x, y.
+
+    The interior points of x, y are the initial guess. The sweeps are
+    repeated until the largest change of the grid points, relative to the
+    size of the grid, is below tol or n_max sweeps are done. With sequence
+    True, the grid is first solved on a grid with about every other point
+    (recursively) and the displacement of its points is interpolated to
+    the initial guess, which removes the smooth part of the error that the
+    line relaxation is slow to remove. Returns x, y and the number of
+    sweeps on the finest grid.
+    """
+    x = np.array(x, dtype=float)
+    y = np.array(y, dtype=float)
+    if periodic is None:
+        periodic = is_periodic(x, y)
+    if control:
+        phi, psi = control_functions(x, y, periodic)
+    else:
+        phi = np.zeros(x.shape)
+        psi = np.zeros(x.shape)
+    iM, jM = x.shape
+    if sequence and min(iM, jM) >= 2*MIN_POINTS - 1:
+        I = coarse_index(iM)
+        J = coarse_index(jM)
+        xc = x[np.ix_(I, J)]
+        yc = y[np.ix_(I, J)]
+        xs, ys, _ = elliptic_mesh(xc, yc, periodic, control, omega, tol,
+                                  n_max, sequence)
+        x += prolong(xs - xc, I, J, iM, jM)
+        y += prolong(ys - yc, I, J, iM, jM)
+    size = max(np.ptp(x), np.ptp(y))
+    for n in range(1, n_max+1):
+        change = winslow_sweep(x, y, phi, psi, periodic, omega)
+        if change <= tol*size:
+            break
+    return x, y, n
+
+
+def control_functions(x, y, periodic):
+    """Return the control functions phi, psi of the initial grid x, y.
+
+    For an orthogonal grid with the scale factors h1 = |r_xi| and
+    h2 = |r_eta| the Winslow equations with the control functions
+        phi = (ln h2/h1)_xi, psi = (ln h1/h2)_eta
+    are satisfied exactly. psi is evaluated at every point of the initial
+    grid, so that the point distribution along the lines i (the
+    clustering at the wall) is kept, while phi is evaluated at the
+    boundaries j = 1 and j = jM and interpolated linearly in between, so
+    that the distribution along the lines j is smoothed (Thomas and
+    Middlecoff). The scale factors are evaluated from the arc length,
+    which remains bounded at the corners of the boundary, such as the
+    trailing edge of an airfoil.
+    """
+    iM, jM = x.shape
+    h1, h2 = _scale_factors(x, y, periodic)
+    psi = np.zeros((iM, jM))
+    psi[:, 1:-1] = _log_derivative(h1/h2, False)
+    phi = np.zeros((iM, jM))
+    rows = slice(0, iM-1) if periodic else slice(1, iM-1)
+    for j in (0, -1):
+        phi[rows, j] = _log_derivative(h2[:, j]/h1[:, j], periodic)
+    if periodic:
+        phi[-1] = phi[0]
+    s = np.linspace(0.0, 1.0, jM)
+    phi[:] = (1.0 - s)*phi[:, 0:1] + s*phi[:, -1:]
+    return phi, psi
+
+
+def winslow_sweep(x, y, phi, psi, periodic, omega=1.0):
+    """Perform one zebra line relaxation sweep of the Winslow equations.
+
+    The equations
+        alpha(x_xixi + phi x_xi) - 2 beta x_xieta
+        + gamma(x_etaeta + psi x_eta) = 0,
+    and the same for y, with alpha = x_eta^2 + y_eta^2,
+    beta = x_xi x_eta + y_xi y_eta and gamma = x_xi^2 + y_xi^2, are
+    solved along the lines i (from the boundary j = 1 to j = jM), first
+    on the odd and then on the even lines. The lines of one color are
+    solved together with the batched tridiagonal solver, for x and y at
+    once. The coefficients are evaluated from the current grid. If the
+    grid is periodic, the line iM is the same as the line 1 and is not
+    solved.
+
+    Returns the largest change of the grid point locations.
+    """
+    iM, jM = x.shape
+    nLines = iM - 1 if periodic else iM - 2
+    first = 0 if periodic else 1
+    change = 0.0
+    for start in (first, first+1):
+        L = np.arange(start, first+nLines, 2)
+        if L.size == 0:
+            continue
+        if periodic:
+            Lw = (L - 1) % (iM - 1)
+            Le = (L + 1) % (iM - 1)
+        else:
+            Lw = L - 1
+            Le = L + 1
+        xw, xc, xe = x[Lw], x[L], x[Le]
+        yw, yc, ye = y[Lw], y[L], y[Le]
+        # Derivatives at the interior points of the lines
+        x_xi = (xe[:, 1:-1] - xw[:, 1:-1])/2.0
+        y_xi = (ye[:, 1:-1] - yw[:, 1:-1])/2.0
+        x_eta = (xc[:, 2:] - xc[:, :-2])/2.0
+        y_eta = (yc[:, 2:] - yc[:, :-2])/2.0
+        alpha = x_eta*x_eta + y_eta*y_eta
+        beta = x_xi*x_eta + y_xi*y_eta
+        gamma = x_xi*x_xi + y_xi*y_xi
+        x_xieta = (xe[:, 2:] - xe[:, :-2] - xw[:, 2:] + xw[:, :-2])/4.0
+        y_xieta = (ye[:, 2:] - ye[:, :-2] - yw[:, 2:] + yw[:, :-2])/4.0
+        Phi = phi[L, 1:-1]
+        Psi = psi[L, 1:-1]
+        # The rows of x and then of y with the same coefficients
+        nL = L.size
+        A = np.zeros((2*nL, jM))
+        B = np.ones((2*nL, jM))
+        C = np.zeros((2*nL, jM))
+        D = np.zeros((2*nL, jM))
+        A[:nL, 1:-1] = gamma*(1.0 - 0.5*Psi)
+        B[:nL, 1:-1] = -2.0*(alpha + gamma)
+        C[:nL, 1:-1] = gamma*(1.0 + 0.5*Psi)
+        A[nL:] = A[:nL]
+        B[nL:] = B[:nL]
+        C[nL:] = C[:nL]
+        D[:nL, 1:-1] = (2.0*beta*x_xieta
+                        - alpha*(xe[:, 1:-1] + xw[:, 1:-1] + Phi*x_xi))
+        D[nL:, 1:-1] = (2.0*beta*y_xieta
+                        - alpha*(ye[:, 1:-1] + yw[:, 1:-1] + Phi*y_xi))
+        UU = BatchTridiagonalSolver(A, B, C, D, np.concatenate([xc, yc]))
+        dx = UU[:nL, 1:-1] - xc[:, 1:-1]
+        dy = UU[nL:, 1:-1] - yc[:, 1:-1]
+        x[L, 1:-1] = xc[:, 1:-1] + omega*dx
+        y[L, 1:-1] = yc[:, 1:-1] + omega*dy
+        change = max(change, np.abs(dx).max(), np.abs(dy).max())
+    if periodic:
+        x[-1] = x[0]
+        y[-1] = y[0]
+    return change
+
+
+def coarse_index(nPoints):
+    """Return the indices of about every other point, with both ends."""
+    return np.unique(np.rint(np.linspace(0, nPoints-1, (nPoints+1)//2))
+                     .astype(int))
+
+
+def prolong(d, I, J, iM, jM):
+    """Return d at the points I, J interpolated linearly to iM x jM points."""
+    d = _interp_rows(d, I, iM)
+    return _interp_rows(d.T, J, jM).T
+
+
+def _interp_rows(d, I, nPoints):
+    """Return the rows I of d interpolated linearly to nPoints rows."""
+    i = np.arange(nPoints)
+    k = np.clip(np.searchsorted(I, i), 1, len(I)-1)
+    w = ((i - I[k-1])/(I[k] - I[k-1]))[:, np.newaxis]
+    return (1.0 - w)*d[k-1] + w*d[k]
+
+
+def _scale_factors(x, y, periodic):
+    """Return the arc length scale factors h1 = |r_xi|, h2 = |r_eta|.
+
+    The scale factor at a point is the mean length of the two segments
+    of the grid line at the point, or the length of the segment at the
+    boundaries.
+    """
+    return _arc_scale(x.T, y.T, periodic).T, _arc_scale(x, y, False)
+
+
+def _arc_scale(x, y, periodic):
+    """Return the mean segment length along the last axis at each point."""
+    ds = np.hypot(np.diff(x, axis=-1), np.diff(y, axis=-1))
+    h = np.empty(x.shape)
+    h[..., 1:-1] = (ds[..., 1:] + ds[..., :-1])/2.0
+    if periodic:
+        h[..., 0] = h[..., -1] = (ds[..., 0] + ds[..., -1])/2.0
+    else:
+        h[..., 0] = ds[..., 0]
+        h[..., -1] = ds[..., -1]
+    return h
+
+
+def _log_derivative(h, periodic):
+    """Return (ln h)_s along the last axis at the interior points.
+
+    If h is periodic, the derivative is returned at all points except the
+    last one, which is the same as the first one.
+    """
+    if periodic:
+        hc = h[..., :-1]
+        hs, hn = np.roll(hc, 1, axis=-1), np.roll(hc, -1, axis=-1)
+    else:
+        hs, hc, hn = h[..., :-2], h[..., 1:-1], h[..., 2:]
+    return (hn - hs)/(2.0*hc)
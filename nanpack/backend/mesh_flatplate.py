@@ -37,25 +37,25 @@
 #
 #   ***********************************************************************
 
+import numpy as np
 from .util_clustering import calculate_beta1, calculate_eta1
 
 
 def flateplate(A, B, x, y, dX, dY, iM, jM, Xi, Eta, beta):
     beta1 = calculate_beta1(beta)
-    for j in range(0, jM):
-        # Grid points along wall X = 0.0
-        eta1 = calculate_eta1(Eta[0, j], Eta[0, -1])
-        x[0][j] = 0.0
-        y[0][j] = B * (((beta+1.0) - (beta-1.0)*(beta1**eta1))
-                       / ((beta1**eta1)+1.0))
-        # Grid points along wall X = A
-        eta1 = calculate_eta1(Eta[-1, j], Eta[-1, -1])
-        x[-1][j] = A
-        y[-1][j] = B * (((beta+1) - (beta-1)*(beta1**eta1))
-                        / ((beta1**eta1)+1.0))
+    # Grid points along wall X = 0.0
+    eta1 = calculate_eta1(Eta[0, :], Eta[0, -1])
+    x[0, :] = 0.0
+    y[0, :] = B * (((beta+1.0) - (beta-1.0)*(beta1**eta1))
+                   / ((beta1**eta1)+1.0))
+    # Grid points along wall X = A
+    eta1 = calculate_eta1(Eta[-1, :], Eta[-1, -1])
+    x[-1, :] = A
+    y[-1, :] = B * (((beta+1) - (beta-1)*(beta1**eta1))
+                    / ((beta1**eta1)+1.0))
 
-        for i in range(1, iM-1):
-            x[i][j] = x[i-1][j] + dX
-            y[i][j] = y[0][j]
+    # x[i][j] = x[i-1][j] + dX, summed in the same order by cumsum
+    x[1:-1, :] = np.cumsum(np.full(iM-2, dX))[:, None]
+    y[1:-1, :] = y[0:1, :]
 
     return x, y
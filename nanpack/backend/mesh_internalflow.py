@@ -37,6 +37,7 @@
 #
 #   ***********************************************************************
 
+import numpy as np
 from .util_clustering import calculate_beta1, calculate_eta1
 
 
@@ -44,30 +45,26 @@ def cavity(A, B, x, y, iM, jM, Xi, Eta, alphax, alphay, betax, betay):
     betax1 = calculate_beta1(betax)
     betay1 = calculate_beta1(betay)
 
-    for i in range(0, iM):
-        # Grid points along wall Y = 0.0
-        xi1 = calculate_eta1(Xi[i, 0], Xi[-1, 0], False)
-        x[i][0] = get_clust_wall(xi1, alphax, betax, betax1, A)
-        y[i][0] = 0.0
-        # Grid points along wall Y = B
-        xi1 = calculate_eta1(Xi[i, -1], Xi[-1, -1], False)
-        x[i][-1] = get_clust_wall(xi1, alphax, betax, betax1, A)
-        y[i][-1] = B
-
-    for j in range(0, jM):
-        # Grid points along wall X = 0.0
-        x[0][j] = 0.0
-        eta1 = calculate_eta1(Eta[0, j], Eta[0, -1], False)
-        y[0][j] = get_clust_wall(eta1, alphay, betay, betay1, B)
-        # Grid points along wall X = A
-        x[-1][j] = A
-        eta1 = calculate_eta1(Eta[-1, j], Eta[-1, -1], False)
-        y[-1][j] = get_clust_wall(eta1, alphay, betay, betay1, B)
-
-    for i in range(1, iM-1):
-        for j in range(1, jM-1):
-            x[i][j] = x[i][0]
-            y[i][j] = y[0][j]
+    # Grid points along wall Y = 0.0
+    xi1 = calculate_eta1(Xi[:, 0], Xi[-1, 0], False)
+    x[:, 0] = get_clust_wall(xi1, alphax, betax, betax1, A)
+    y[:, 0] = 0.0
+    # Grid points along wall Y = B
+    xi1 = calculate_eta1(Xi[:, -1], Xi[-1, -1], False)
+    x[:, -1] = get_clust_wall(xi1, alphax, betax, betax1, A)
+    y[:, -1] = B
+
+    # Grid points along wall X = 0.0
+    x[0, :] = 0.0
+    eta1 = calculate_eta1(Eta[0, :], Eta[0, -1], False)
+    y[0, :] = get_clust_wall(eta1, alphay, betay, betay1, B)
+    # Grid points along wall X = A
+    x[-1, :] = A
+    eta1 = calculate_eta1(Eta[-1, :], Eta[-1, -1], False)
+    y[-1, :] = get_clust_wall(eta1, alphay, betay, betay1, B)
+
+    x[1:-1, 1:-1] = x[1:-1, 0:1]
+    y[1:-1, 1:-1] = y[0:1, 1:-1]
 
     return x, y
 
@@ -76,35 +73,33 @@ def duct(A, B, x, y, dX, dY, Xi, Eta, iM, jM, alphax, alphay, betax,
          betay):
     if betax is not None:
         beta1 = calculate_beta1(betax)
-        for i in range(0, iM):
-            # Grid points along wall Y = 0.0
-            xi1 = calculate_eta1(Xi[i, 0], Xi[-1, 0], False)
-            x[i][0] = get_clust_wall(xi1, alphax, betax, beta1, A)
-            y[i][0] = 0.0
-            # Grid points along wall Y = B
-            xi1 = calculate_eta1(Xi[i, -1], Xi[-1, -1], False)
-            x[i][-1] = get_clust_wall(xi1, alphax, betax, beta1, A)
-            y[i][-1] = B
-
-            for j in range(1, jM-1):
-                x[i][j] = x[i][0]
-                y[i][j] = y[i][j-1] + dY
+        # Grid points along wall Y = 0.0
+        xi1 = calculate_eta1(Xi[:, 0], Xi[-1, 0], False)
+        x[:, 0] = get_clust_wall(xi1, alphax, betax, beta1, A)
+        y[:, 0] = 0.0
+        # Grid points along wall Y = B
+        xi1 = calculate_eta1(Xi[:, -1], Xi[-1, -1], False)
+        x[:, -1] = get_clust_wall(xi1, alphax, betax, beta1, A)
+        y[:, -1] = B
+
+        # y[i][j] = y[i][j-1] + dY, summed in the same order by cumsum
+        x[:, 1:-1] = x[:, 0:1]
+        y[:, 1:-1] = np.cumsum(np.full(jM-2, dY))
 
     elif betay is not None:
         beta1 = calculate_beta1(betay)
-        for j in range(0, jM):
-            # Grid points along wall X = 0.0
-            x[0][j] = 0.0
-            eta1 = calculate_eta1(Eta[0, j], Eta[0, -1], False)
-            y[0][j] = get_clust_wall(eta1, alphay, betay, beta1, B)
-            # Grid points along wall X = A
-            x[-1][j] = A
-            eta1 = calculate_eta1(Eta[-1, j], Eta[-1, -1], False)
-            y[-1][j] = get_clust_wall(eta1, alphay, betay, beta1, B)
-
-            for i in range(1, iM-1):
-                x[i][j] = x[i-1][j] + dX
-                y[i][j] = y[0][j]
+        # Grid points along wall X = 0.0
+        x[0, :] = 0.0
+        eta1 = calculate_eta1(Eta[0, :], Eta[0, -1], False)
+        y[0, :] = get_clust_wall(eta1, alphay, betay, beta1, B)
+        # Grid points along wall X = A
+        x[-1, :] = A
+        eta1 = calculate_eta1(Eta[-1, :], Eta[-1, -1], False)
+        y[-1, :] = get_clust_wall(eta1, alphay, betay, beta1, B)
+
+        # x[i][j] = x[i-1][j] + dX, summed in the same order by cumsum
+        x[1:-1, :] = np.cumsum(np.full(iM-2, dX))[:, None]
+        y[1:-1, :] = y[0:1, :]
 
     return x, y
 
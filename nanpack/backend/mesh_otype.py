@@ -38,8 +38,9 @@
 #
 #   ***********************************************************************
 
-import math
+import numpy as np
 from .util_clustering import clustering_parameter
+from .kernels import ogrid_interior
 
 
 def ogrid_airfoil(x, y, radius, chord, thick, Xi, Eta, iM, jM, clust_opt,
@@ -51,41 +52,25 @@ def ogrid_airfoil(x, y, radius, chord, thick, Xi, Eta, iM, jM, clust_opt,
     # distance between airfoil leading edge and # the outer boundary.
     del_d = radius - chord/2.0
 
-    # Define airfoil surface
+    # Define airfoil surface, lower surface for i < imid
     dx_afc = chord / ((iM+1)/2-1)  # grid steps size on the airfoil chord
-    for i in range(0, imid):
-        x[i][0] = del_d + dx_afc*(imid-i-1)
-        x_af = x[i][0] - del_d  # x-locations on airfoil surface
-        xaf2 = x_af * x_af
-        xaf3 = x_af * x_af * x_af
-        y[i][0] = -(thick/0.2) * (0.2969 * math.sqrt(x_af)
-                                  - 0.126 * x_af
-                                  - 0.3516 * xaf2
-                                  + 0.2843 * xaf3
-                                  - 0.1015 * xaf2 * xaf2)
-
-    for i in range(imid, iM-1):
-        x[i][0] = del_d + dx_afc*(i+1-imid)
-        x_af = x[i][0] - del_d
-        xaf2 = x_af * x_af
-        xaf3 = x_af * x_af * x_af
-        y[i][0] = (thick/0.2) * (0.2969 * math.sqrt(x_af)
-                                 - 0.126 * x_af
-                                 - 0.3516 * xaf2
-                                 + 0.2843 * xaf3
-                                 - 0.1015 * xaf2 * xaf2)
+    i = np.arange(0, iM-1)
+    lower = i < imid
+    x[:-1, 0] = del_d + dx_afc*np.where(lower, imid-i-1, i+1-imid)
+    x_af = x[:-1, 0] - del_d  # x-locations on airfoil surface
+    xaf2 = x_af * x_af
+    xaf3 = x_af * x_af * x_af
+    y[:-1, 0] = np.where(lower, -(thick/0.2), thick/0.2) * (
+        0.2969 * np.sqrt(x_af)
+        - 0.126 * x_af
+        - 0.3516 * xaf2
+        + 0.2843 * xaf3
+        - 0.1015 * xaf2 * xaf2)
     x[-1][0] = x[0][0]
     y[-1][0] = y[0][0]
 
     # Define outer circular boundary
-    dtheta = 2.0 * math.pi / (iM-1)  # calculate angular step size
-    for i in range(0, imid):
-        x[i][-1] = radius + radius*math.cos(dtheta*(i))
-        y[i][-1] = -radius*math.sin(dtheta*(i))
-
-    for i in range(imid, iM):
-        x[i][-1] = radius + radius*math.cos(dtheta*(iM-i-1))
-        y[i][-1] = radius*math.sin(dtheta*(iM-i-1))
+    x[:, -1], y[:, -1] = circle_points(radius, radius, iM, imid)
 
     x, y = interior_of_ogrid(iM, jM, imid, x, y, clust_opt, Eta, beta)
     return x, y
@@ -96,52 +81,48 @@ def ogrid_cylinder(x, y, rad_o, rad_i, Xi, Eta, iM, jM, clust_opt, beta):
         imid = int(iM/2 + 1)
     else:
         imid = int((iM-1)/2 + 1)
-    dtheta = 2.0 * math.pi / (iM-1)  # calculate angular step size
-    for i in range(0, imid):
-        x[i][0] = rad_o + rad_i*math.cos(dtheta*(i))
-        y[i][0] = - rad_i*math.sin(dtheta*(i))
-
-    for i in range(imid, iM-1):
-        x[i][0] = rad_o + rad_i*math.cos(dtheta*(iM-i-1))
-        y[i][0] = rad_i*math.sin(dtheta*(iM-i-1))
+    x[:, 0], y[:, 0] = circle_points(rad_o, rad_i, iM, imid)
     x[-1][0] = x[0][0]
     y[-1][0] = y[0][0]
 
     # Define outer circular boundary
-    for i in range(0, imid):
-        x[i][-1] = rad_o + rad_o*math.cos(dtheta*(i))
-        y[i][-1] = -rad_o*math.sin(dtheta*(i))
-
-    for i in range(imid, iM):
-        x[i][-1] = rad_o + rad_o*math.cos(dtheta*(iM-i-1))
-        y[i][-1] = rad_o*math.sin(dtheta*(iM-i-1))
+    x[:, -1], y[:, -1] = circle_points(rad_o, rad_o, iM, imid)
 
     x, y = interior_of_ogrid(iM, jM, imid, x, y, clust_opt, Eta, beta)
 
     return x, y
 
 
+def circle_points(center, radius, iM, imid):
+    """Return the points i = 1..iM on a circle around (center, 0.0).
+
+    The points i < imid are placed clockwise from the angle zero on the
+    lower half of the circle, the remaining points on the upper half.
+    """
+    dtheta = 2.0 * np.pi / (iM-1)  # calculate angular step size
+    i = np.arange(0, iM)
+    lower = i < imid
+    theta = dtheta*np.where(lower, i, iM-i-1)
+    x = center + radius*np.cos(theta)
+    y = np.where(lower, -radius, radius)*np.sin(theta)
+
+    return x, y
+
+
 def interior_of_ogrid(iM, jM, imid, x, y, copt, Eta, beta):
     """Return x, y at all interior grid points."""
-    S = Eta.copy()
     # Calculate the distance, delI between j = jM and j = 1
     # Calculate the angle alpI of each line i from j = 1 to j = j jM
-    delI = []
-    alpha = []
-    for i in range(0, iM):
-        delxx = x[i, 0] - x[i, -1]
-        delyy = y[i, -1] - y[i, 0]
-        delI.append(math.sqrt(delxx*delxx + delyy*delyy))
-        alpha.append(math.atan2(abs(delyy), abs(delxx)))
+    delxx = x[:, 0] - x[:, -1]
+    delyy = y[:, -1] - y[:, 0]
+    delI = np.sqrt(delxx*delxx + delyy*delyy)
+    alpha = np.arctan2(np.abs(delyy), np.abs(delxx))
     # Calculate interior grid point locations using
     #  clustering option = True or False.
-    for i in range(0, iM):
-        for j in range(0, jM):
-            if copt is True:
-                S[i][j] = clustering_parameter(Eta[i, j], Eta[i, -1],
-                                               beta, delI[i])
-            else:
-                S[i][j] = delI[i]*(j)/(jM-1)
+    if copt is True:
+        S = clustering_parameter(Eta, Eta[:, -1:], beta, delI[:, None])
+    else:
+        S = delI[:, None]*np.arange(0, jM)/(jM-1)
 
     if imid % 2 == 0:
         i_lower_mid = int(imid/2)
@@ -150,21 +131,9 @@ def interior_of_ogrid(iM, jM, imid, x, y, copt, Eta, beta):
         i_lower_mid = int((imid+1)/2)
         i_upper_mid = imid + int((iM-imid)/2)
 
-    for j in range(1, jM-1):
-        for i in range(0, iM-1):
-            if i < i_lower_mid:
-                x[i][j] = x[i][0] + S[i][j]*math.cos(alpha[i])
-                y[i][j] = y[i][0] - S[i][j]*math.sin(alpha[i])
-            elif i_lower_mid <= i < imid:
-                x[i][j] = x[i][0] - S[i][j]*math.cos(alpha[i])
-                y[i][j] = y[i][0] - S[i][j]*math.sin(alpha[i])
-            elif imid <= i < i_upper_mid:
-                x[i][j] = x[i][0] - S[i][j]*math.cos(alpha[i])
-                y[i][j] = y[i][0] + S[i][j]*math.sin(alpha[i])
-            elif i_upper_mid <= i < iM:
-                x[i][j] = x[i][0] + S[i][j]*math.cos(alpha[i])
-                y[i][j] = y[i][0] + S[i][j]*math.sin(alpha[i])
-        x[-1][j] = x[0][j]
-        y[-1][j] = y[0][j]
+    cosA = np.cos(alpha)
+    sinA = np.sin(alpha)
+    x, y = ogrid_interior(x, y, S, cosA, sinA, imid, i_lower_mid,
+                          i_upper_mid)
 
     return x, y
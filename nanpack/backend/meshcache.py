@@ -0,0 +1,125 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         meshcache.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+from .exceptions import MeshFileError
+from .meshmetrics import MeshMetrics
+
+# A mesh file starts with a header of HEADER_SIZE bytes,
+#   magic (8 bytes), version, number of arrays (int32), IMAX, JMAX
+#   (int64), mesh key (32 bytes),
+# followed by X, Y and optionally the arrays MeshMetrics.NAMES as
+# little-endian float64 values in C order.
+MAGIC = b"NANPGRID"
+VERSION = 1
+HEADER = struct.Struct("<8s2i2q32s")
+HEADER_SIZE = 64
+DTYPE = np.dtype("<f8")
+
+
+def mesh_key(GeomTemplate, ClustOpt, **params):
+    """Return the SHA-256 digest of the geometry template and parameters.
+
+    params contains all inputs of the mesh generator, i.e. the grid size,
+    the domain size and the clustering and geometric mesh kwargs.
+    """
+    h = hashlib.sha256()
+    h.update(f"{VERSION}:{GeomTemplate.lower()}:{ClustOpt}\n".encode())
+    for key, value in sorted(params.items()):
+        h.update(f"{key}={value!r}\n".encode())
+    return h.digest()
+
+
+def cache_file_name(CacheDir, GeomTemplate, Key):
+    """Return the path of the mesh cache file for the mesh Key."""
+    name = f"{GeomTemplate.lower()}-{Key.hex()[:16]}.grid"
+    return os.path.join(CacheDir, name)
+
+
+def save_mesh(fName, X, Y, Metrics=None, Key=b""):
+    """Write the grid X, Y and the MeshMetrics object to a mesh file.
+
+    The mesh is written to a temporary file which then replaces fName,
+    i.e. a concurrent reader never sees a partially written file.
+    """
+    arrays = [X, Y]
+    if Metrics is not None:
+        arrays += [getattr(Metrics, name) for name in MeshMetrics.NAMES]
+    iM, jM = X.shape
+    header = HEADER.pack(MAGIC, VERSION, len(arrays), iM, jM, Key)
+    tmpName = f"{fName}.{os.getpid()}.tmp"
+    with open(tmpName, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+        for array in arrays:
+            f.write(np.ascontiguousarray(array, dtype=DTYPE).data)
+    os.replace(tmpName, fName)
+
+
+def load_mesh(fName, Key=None):
+    """Return X, Y and the MeshMetrics object (or None) of a mesh file.
+
+    MeshFileError is raised if the file is not a mesh file or if it was
+    written for a different mesh Key.
+    """
+    with open(fName, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+            raise MeshFileError(fName, "not a NAnPack mesh file")
+        (magic, version, nArrays, iM, jM,
+         fileKey) = HEADER.unpack(header[:HEADER.size])
+        if Key is not None and fileKey != Key:
+            raise MeshFileError(fName, "the mesh was generated with\
+ different parameters")
+        data = np.fromfile(f, dtype=DTYPE, count=nArrays*iM*jM)
+    if data.size != nArrays*iM*jM:
+        raise MeshFileError(fName, "the mesh file is truncated")
+    arrays = data.reshape((nArrays, iM, jM))
+    X, Y = arrays[0], arrays[1]
+    Metrics = None
+    if nArrays == 2 + len(MeshMetrics.NAMES):
+        Metrics = MeshMetrics((iM, jM))
+        for name, array in zip(MeshMetrics.NAMES, arrays[2:]):
+            setattr(Metrics, name, array)
+    return X, Y, Metrics
@@ -38,6 +38,97 @@
 #
 #   ***********************************************************************
 
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Number of grids whose metrics are kept by cached_metrics()
+CACHE_SIZE = 4
+_CACHE = OrderedDict()
+
+
+def derivative(F, axis, h=1.0, out=None):
+    """Return the derivative of F along the axis of the computational grid.
+
+    Second-order central differences are used at the interior points and
+    second-order one-sided differences at the first and the last point
+    along the axis. The result is written into out if given.
+    """
+    if out is None:
+        out = np.empty(F.shape)
+    Fa = np.moveaxis(F, axis, 0)
+    Da = np.moveaxis(out, axis, 0)
+    np.subtract(Fa[2:], Fa[0:-2], out=Da[1:-1])
+    Da[1:-1] /= 2.0
+    Da[1:-1] /= h
+    Da[0] = (-3.0*Fa[0] + 4.0*Fa[1] - Fa[2]) / 2.0 / h
+    Da[-1] = (3.0*Fa[-1] - 4.0*Fa[-2] + Fa[-3]) / 2.0 / h
+    return out
+
+
+class MeshMetrics:
+    """Metrics and Jacobian of the transformation of a 2D grid.
+
+    The derivatives XXi, YXi, XEta, YEta of the physical coordinates,
+    the metrics XiX, XiY, EtaX, EtaY and the Jacobian JJ are allocated
+    once in the constructor. Compute(X, Y) evaluates them in place for
+    a grid of the given shape, using the differences of derivative().
+
+    Call signature:
+        MeshMetrics(shape, dXi, dEta)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax, jMax) of the grid.
+    dXi: float
+        Grid step size along the Xi-axis of the computational grid.
+    dEta: float
+        Grid step size along the Eta-axis of the computational grid.
+    Derived: dict
+        Arrays derived from the metrics by the solvers, such as the
+        coefficients of the transformed Laplacian, stored with the
+        metrics so that they are computed once per grid.
+    """
+
+    # Arrays of the derivatives, metrics and Jacobian
+    NAMES = ["XXi", "YXi", "XEta", "YEta", "XiX", "XiY", "EtaX", "EtaY",
+             "JJ"]
+
+    def __init__(self, shape, dXi=1.0, dEta=1.0):
+        """Class constructor for the MeshMetrics class."""
+        self.shape = tuple(shape)
+        self.dXi = dXi
+        self.dEta = dEta
+        self.Derived = {}
+        for name in self.NAMES:
+            setattr(self, name, np.empty(self.shape))
+
+    def Compute(self, X, Y):
+        """Evaluate the metrics and Jacobian of the grid X, Y in place."""
+        derivative(X, 0, self.dXi, self.XXi)
+        derivative(Y, 0, self.dXi, self.YXi)
+        derivative(X, 1, self.dEta, self.XEta)
+        derivative(Y, 1, self.dEta, self.YEta)
+        # JJ = 1/(XXi*YEta - YXi*XEta)
+        JJ = self.JJ
+        np.multiply(self.XXi, self.YEta, out=JJ)
+        np.multiply(self.YXi, self.XEta, out=self.XiX)
+        JJ -= self.XiX
+        np.divide(1.0, JJ, out=JJ)
+        np.multiply(JJ, self.YEta, out=self.XiX)
+        np.multiply(JJ, self.XEta, out=self.XiY)
+        np.negative(self.XiY, out=self.XiY)
+        np.multiply(JJ, self.YXi, out=self.EtaX)
+        np.negative(self.EtaX, out=self.EtaX)
+        np.multiply(JJ, self.XXi, out=self.EtaY)
+        return self
+
+    def Metrics(self):
+        """Return the tuple XiX, XiY, EtaX, EtaY, JJ."""
+        return self.XiX, self.XiY, self.EtaX, self.EtaY, self.JJ
+
 
 def metrics_1d(X, dXi=1.0):
     """Return the metrics and Jacobian of the transformation.
@@ -45,21 +136,10 @@ def metrics_1d(X, dXi=1.0):
     XiX, JJ.
     This function is not complete or tested for accuracy. Doc incomplete.
     """
-    iM, = X.shape
-    # Initialize
-    XXi = X.copy()
-    XiX = X.copy()
-    JJ = X.copy()
-    # At interior grid points
-    XXi[1:-1] = (X[2:]-X[0:-2]) / 2.0 / dXi
-    # At boundary X = 0.0
-    XXi[0] = (-3.0*X[0] + 4.0*X[1] - X[2]) / 2.0 / dXi
-    # At boundary X = L
-    XXi[-1] = (3.0*X[-1] - 4.0*X[-2] + X[-3]) / 2.0 / dXi
+    XXi = derivative(X, 0, dXi)
     # Evaluate metrics and Jacobian
-    for i in range(0, iM):
-        JJ[i] = 1.0 / XXi[i]
-        XiX[i] = JJ[i]
+    JJ = np.divide(1.0, XXi, out=XXi)
+    XiX = JJ.copy()
     return XiX, JJ
 
 
@@ -68,86 +148,64 @@ def metrics_2d(X, Y, dXi=1.0, dEta=1.0):
 
     XiX, XiY, EtaX, EtaY, JJ. Documentation incomplete.
     """
-    iM, jM = X.shape
-    # Initialize
-    XXi = X.copy()
-    YXi = X.copy()
-    XEta = X.copy()
-    YEta = X.copy()
-    XiX = X.copy()
-    XiY = X.copy()
-    EtaX = X.copy()
-    EtaY = X.copy()
-    JJ = X.copy()
-    # At interior grid points
-    XXi[1:-1, 1:-1] = (X[2:, 1:-1]-X[0:-2, 1:-1]) / 2.0 / dXi
-    YXi[1:-1, 1:-1] = (Y[2:, 1:-1]-Y[0:-2, 1:-1]) / 2.0 / dXi
-    XEta[1:-1, 1:-1] = (X[1:-1, 2:]-X[1:-1, 0:-2]) / 2.0 / dEta
-    YEta[1:-1, 1:-1] = (Y[1:-1, 2:]-Y[1:-1, 0:-2]) / 2.0 / dEta
-    # At boundary X = 0.0
-    XXi[0, 1:-1] = (
-        (-3.0*X[0, 1:-1] + 4.0*X[1, 1:-1] - X[2, 1:-1]) / 2.0 / dXi
-        )
-    YXi[0, 1:-1] = (
-        (-3.0*Y[0, 1:-1] + 4.0*Y[1, 1:-1] - Y[2, 1:-1]) / 2.0 / dXi
-        )
-    XEta[0, 1:-1] = (X[0, 2:]-X[0, 0:-2]) / 2.0 / dEta
-    YEta[0, 1:-1] = (Y[0, 2:]-Y[0, 0:-2]) / 2.0 / dEta
-    # At boundary X = L
-    XXi[-1, 1:-1] = (
-        (3.0*X[-1, 1:-1] - 4.0*X[-2, 1:-1] + X[-3, 1:-1]) / 2.0 / dXi
-        )
-    YXi[-1, 1:-1] = (
-        (3.0*Y[-1, 1:-1] - 4.0*Y[-2, 1:-1] + Y[-3, 1:-1]) / 2.0 / dXi
-        )
-    XEta[-1, 1:-1] = (X[-1, 2:]-X[-1, 0:-2]) / 2.0 / dEta
-    YEta[-1, 1:-1] = (Y[-1, 2:]-Y[-1, 0:-2]) / 2.0 / dEta
-    # At boundary Y = 0.0
-    XXi[1:-1, 0] = (X[2:, 0]-X[0:-2, 0]) / 2.0 / dXi
-    YXi[1:-1, 0] = (Y[2:, 0]-Y[0:-2, 0]) / 2.0 / dXi
-    XEta[1:-1, 0] = (
-        (-3.0*X[1:-1, 0] + 4.0*X[1:-1, 1] - X[1:-1, 2]) / 2.0 / dEta
-        )
-    YEta[1:-1, 0] = (
-        (-3.0*Y[1:-1, 0] + 4.0*Y[1:-1, 1] - Y[1:-1, 2]) / 2.0 / dEta
-        )
-    # At boundary Y = H
-    XXi[1:-1, -1] = (X[2:, -1]-X[0:-2, -1]) / 2.0 / dXi
-    YXi[1:-1, -1] = (Y[2:, -1]-Y[0:-2, -1]) / 2.0 / dXi
-
-    XEta[1:-1, -1] = (
-        (3.0*X[1:-1, -1] - 4.0*X[1:-1, -2] + X[1:-1, -3]) / 2.0 / dEta
-        )
-    YEta[1:-1, -1] = (
-        (3.0*Y[1:-1, -1] - 4.0*Y[1:-1, -2] + Y[1:-1, -3]) / 2.0 / dEta
-        )
-    # At vertices
-    # X=0.0, Y=0.0
-    XXi[0, 0] = (-3.0*X[0, 0] + 4.0*X[1, 0] - X[2, 0]) / 2.0 / dXi
-    YXi[0, 0] = (-3.0*Y[0, 0] + 4.0*Y[1, 0] - Y[2, 0]) / 2.0 / dXi
-    XEta[0, 0] = (-3.0*X[0, 0] + 4.0*X[0, 1] - X[0, 2]) / 2.0 / dEta
-    YEta[0, 0] = (-3.0*Y[0, 0] + 4.0*Y[0, 1] - Y[0, 2]) / 2.0 / dEta
-    # X=L, Y=0.0
-    XXi[-1, 0] = (3.0*X[-1, 0] - 4.0*X[-2, 0] + X[-3, 0]) / 2.0 / dXi
-    YXi[-1, 0] = (3.0*Y[-1, 0] - 4.0*Y[-2, 0] + Y[-3, 0]) / 2.0 / dXi
-    XEta[-1, 0] = (-3.0*X[-1, 0] + 4.0*X[-1, 1] - X[-1, 2]) / 2.0 / dEta
-    YEta[-1, 0] = (-3.0*Y[-1, 0] + 4.0*Y[-1, 1] - Y[-1, 2]) / 2.0 / dEta
-    # X=0.0, Y=H
-    XXi[0, -1] = (-3.0*X[0, -1] + 4.0*X[1, -1] - X[2, -1]) / 2.0 / dXi
-    YXi[0, -1] = (-3.0*Y[0, -1] + 4.0*Y[1, -1] - Y[2, -1]) / 2.0 / dXi
-    XEta[0, -1] = (3.0*X[0, -1] - 4.0*X[0, -2] + X[0, -3]) / 2.0 / dEta
-    YEta[0, -1] = (3.0*Y[0, -1] - 4.0*Y[0, -2] + Y[0, -3]) / 2.0 / dEta
-    # X=L, Y=H
-    XXi[-1, -1] = (3.0*X[-1, -1] - 4.0*X[-2, -1] + X[-3, -1]) / 2.0 / dXi
-    YXi[-1, -1] = (3.0*Y[-1, -1] - 4.0*Y[-2, -1] + Y[-3, -1]) / 2.0 / dXi
-    XEta[-1, -1] = (3.0*X[-1, -1] - 4.0*X[-1, -2] + X[-1, -3]) / 2.0 / dEta
-    YEta[-1, -1] = (3.0*Y[-1, -1] - 4.0*Y[-1, -2] + Y[-1, -3]) / 2.0 / dEta
-    # Evaluate metrics and Jacobian
-    for i in range(0, iM):
-        for j in range(0, jM):
-            JJ[i][j] = 1.0 / (XXi[i][j]*YEta[i][j] - YXi[i][j]*XEta[i][j])
-            XiX[i][j] = JJ[i][j] * YEta[i][j]
-            XiY[i][j] = -JJ[i][j] * XEta[i][j]
-            EtaX[i][j] = -JJ[i][j] * YXi[i][j]
-            EtaY[i][j] = JJ[i][j] * XXi[i][j]
-    return XiX, XiY, EtaX, EtaY, JJ
+    return MeshMetrics(X.shape, dXi, dEta).Compute(X, Y).Metrics()
+
+
+def grid_digest(*arrays, **params):
+    """Return a hex digest of the grid coordinates and parameters."""
+    h = hashlib.blake2b(digest_size=20)
+    for A in arrays:
+        A = np.ascontiguousarray(A, dtype=float)
+        h.update(repr(A.shape).encode())
+        h.update(A)
+    h.update(repr(sorted(params.items())).encode())
+    return h.hexdigest()
+
+
+def cached_metrics(X, Y=None, dXi=1.0, dEta=1.0):
+    """Return the metrics of the grid, computed once per grid.
+
+    The result is stored under the digest of the grid coordinates, i.e.
+    repeated calls with an unchanged grid only hash the coordinates. The
+    metrics of the last CACHE_SIZE grids are kept. The returned arrays
+    are read-only since they are shared between the calls.
+
+    Returns the MeshMetrics object of a 2D grid, or the tuple XiX, JJ if
+    Y is None.
+    """
+    if Y is None:
+        key = grid_digest(X, dXi=dXi)
+    else:
+        key = grid_digest(X, Y, dXi=dXi, dEta=dEta)
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
+    if Y is None:
+        result = metrics_1d(X, dXi)
+        arrays = result
+    else:
+        result = MeshMetrics(X.shape, dXi, dEta).Compute(X, Y)
+        arrays = [getattr(result, name) for name in MeshMetrics.NAMES]
+    for A in arrays:
+        A.flags.writeable = False
+    _store(key, result)
+    return result
+
+
+def store_metrics(X, Y, Metrics):
+    """Add the MeshMetrics object of the grid X, Y to the cache.
+
+    This is used for the metrics read from a mesh file, the arrays are
+    made read-only as in cached_metrics().
+    """
+    for name in MeshMetrics.NAMES:
+        getattr(Metrics, name).flags.writeable = False
+    _store(grid_digest(X, Y, dXi=Metrics.dXi, dEta=Metrics.dEta), Metrics)
+
+
+def _store(key, result):
+    """Store the result under key and drop the oldest entries."""
+    _CACHE[key] = result
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
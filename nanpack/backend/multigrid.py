@@ -0,0 +1,160 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         multigrid.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from .relaxation import red_black_sweep, zebra_line_sweep
+
+# Smoothers available to the multigrid cycles. Each one performs a
+# single sweep in place on U for the five-point equation with the
+# right-hand side F.
+SMOOTHERS = {"Red-Black": red_black_sweep,
+             "Zebra-Line": zebra_line_sweep}
+
+
+def can_coarsen(shape):
+    """Return True if a grid of this shape has a coarser grid.
+
+    The coarse grid is made of every other point of the fine grid, which
+    requires an even number of cells along both axes.
+    """
+    iM, jM = shape
+    return (iM-1) % 2 == 0 and (jM-1) % 2 == 0 and min(iM, jM) > 3
+
+
+def residual(U, B2, F=None):
+    """Return the residual of the five-point equation at all points.
+
+    R = F - [U(i+1,j) + U(i-1,j) + B2*(U(i,j+1) + U(i,j-1))
+    - 2(1+B2)U(i,j)], and R = 0 at the boundary points.
+    """
+    R = np.zeros_like(U)
+    R[1:-1, 1:-1] = -(U[2:, 1:-1] + U[0:-2, 1:-1]
+                      + B2*(U[1:-1, 2:] + U[1:-1, 0:-2])
+                      - 2.0*(1.0 + B2)*U[1:-1, 1:-1])
+    if F is not None:
+        R[1:-1, 1:-1] += F[1:-1, 1:-1]
+    return R
+
+
+def restrict(R):
+    """Return the full-weighting restriction of R to the coarse grid."""
+    iM, jM = R.shape
+    Rc = np.zeros(((iM-1)//2 + 1, (jM-1)//2 + 1))
+    Rc[1:-1, 1:-1] = (
+        4.0*R[2:-2:2, 2:-2:2]
+        + 2.0*(R[1:-3:2, 2:-2:2] + R[3:-1:2, 2:-2:2]
+               + R[2:-2:2, 1:-3:2] + R[2:-2:2, 3:-1:2])
+        + R[1:-3:2, 1:-3:2] + R[3:-1:2, 1:-3:2]
+        + R[1:-3:2, 3:-1:2] + R[3:-1:2, 3:-1:2]
+        ) / 16.0
+    return Rc
+
+
+def prolong(Ec, shape):
+    """Return the bilinear interpolation of Ec to the fine grid."""
+    E = np.zeros(shape)
+    E[::2, ::2] = Ec
+    E[1::2, ::2] = 0.5*(Ec[:-1, :] + Ec[1:, :])
+    E[::2, 1::2] = 0.5*(Ec[:, :-1] + Ec[:, 1:])
+    E[1::2, 1::2] = 0.25*(Ec[:-1, :-1] + Ec[1:, :-1]
+                          + Ec[:-1, 1:] + Ec[1:, 1:])
+    return E
+
+
+def coarse_solve(U, B2, F, tol=1e-10):
+    """Solve the equation on the coarsest grid by red-black SOR sweeps.
+
+    The sweeps are repeated until the largest residual drops below tol
+    relative to the largest right-hand side or boundary value.
+    """
+    iM, jM = U.shape
+    omega = 2.0/(1.0 + np.sin(np.pi/(max(iM, jM) - 1)))
+    scale = max(1.0, np.abs(U).max())
+    if F is not None:
+        scale = max(scale, np.abs(F).max())
+    for k in range(50*max(iM, jM)):
+        red_black_sweep(U, B2, omega, F)
+        if k % 10 == 0 and np.abs(residual(U, B2, F)).max() < tol*scale:
+            break
+    return U
+
+
+def v_cycle(U, B2, F, nPre, nPost, smooth):
+    """Perform one V-cycle on U in place and return U.
+
+    The boundary values of U are held fixed. On the coarse grids the
+    equation is solved for the correction with homogeneous boundary
+    values. Since the coarse grid step is twice the fine grid step the
+    restricted residual is multiplied by 4 to obtain the coarse grid
+    right-hand side of the scaled five-point equation.
+    """
+    if not can_coarsen(U.shape):
+        return coarse_solve(U, B2, F)
+    for k in range(nPre):
+        smooth(U, B2, F=F)
+    Fc = 4.0*restrict(residual(U, B2, F))
+    Ec = v_cycle(np.zeros_like(Fc), B2, Fc, nPre, nPost, smooth)
+    U[1:-1, 1:-1] += prolong(Ec, U.shape)[1:-1, 1:-1]
+    for k in range(nPost):
+        smooth(U, B2, F=F)
+    return U
+
+
+def full_multigrid(U, B2, F, nPre, nPost, nCycles, smooth):
+    """Perform one full multigrid (FMG) cycle on U in place and return U.
+
+    The problem is first solved on the coarsest grid using the boundary
+    values injected from the fine grid. The solution is then interpolated
+    to the next finer grid as the initial guess for nCycles V-cycles,
+    and so on up to the finest grid.
+    """
+    if not can_coarsen(U.shape):
+        return coarse_solve(U, B2, F)
+    Uc = U[::2, ::2].copy()
+    Fc = None
+    if F is not None:
+        # Injection keeps the scaling consistent: F = dX*dX*f
+        Fc = 4.0*F[::2, ::2]
+    Uc = full_multigrid(Uc, B2, Fc, nPre, nPost, nCycles, smooth)
+    U[1:-1, 1:-1] = prolong(Uc, U.shape)[1:-1, 1:-1]
+    for k in range(nCycles):
+        v_cycle(U, B2, F, nPre, nPost, smooth)
+    return U
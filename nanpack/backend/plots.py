@@ -39,6 +39,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from .solutionio import is_binary_solution, load_solution
+
 
 def Plot1D(dataFiles, uAxis, legend, markers, useFileCol,
           title, xlbl, ylbl):
@@ -54,6 +56,9 @@ def Plot1D(dataFiles, uAxis, legend, markers, useFileCol,
 
     # Use dictionary to create multiple line plots from saved files
     for i in range(countFiles):
+        if is_binary_solution(dataFiles[i]):
+            (data[f"x{i}"],), data[f"u{i}"] = load_solution(dataFiles[i])
+            continue
         data[f"x{i}"] = np.loadtxt(dataFiles[i], unpack=True, skiprows=3,
                                    usecols=0)
         data[f"u{i}"] = np.loadtxt(dataFiles[i], unpack=True, skiprows=3,
@@ -90,23 +95,13 @@ def Plot2D(dataFile, title, xlbl, ylbl, cbarlbl, ptype, cMap, shade,
     """Plot results within 2D domain."""
     print("Preparing data to plot results...")
 
-    with open(dataFile) as f:
-        grid = f.readline().split(",")
-    iM = int((grid[0].split("= "))[1])
-    jM = int((grid[1].split("= "))[1])
+    # Read data from saved text or binary file
+    (X, Y), U = load_solution(dataFile)
 
     # Assign font family and create axis for plotting
     plt.rc('font', family='sans-serif', size=10)
     fig, ax = plt.subplots(dpi=150)
 
-    # Read data from saved file
-    x, y, u = np.loadtxt(dataFile, unpack=True, skiprows=3)
-
-    # Reshape data based on iM and jM
-    X = np.reshape(x, (iM, jM))
-    Y = np.reshape(y, (iM, jM))
-    U = np.reshape(u, (iM, jM))
-
     if ptype == "pcolormesh":
         # pcolormesh plot
         plt.pcolormesh(X, Y, U, cmap=cMap, shading=shade)
@@ -145,25 +140,12 @@ def MultiPlot2D(nplots, nrow, ncol, dataFiles, title,
     plt.rc('font', family='sans-serif', size=10)
     fig, ax = plt.subplots(dpi=150)
 
-    data = {}  # Initialize a dictionary
-    DATA = {}
-    iM = []
-    jM = []
-    for i in range(nplots):
-        with open(dataFiles[i]) as f:
-            grid = f.readline().split(",")
-        iM.append(int((grid[0].split("= "))[1]))
-        jM.append(int((grid[1].split("= "))[1]))
+    DATA = {}  # Initialize a dictionary
 
-    # Use dictionary to create multiple plots
+    # Use dictionary to create multiple plots from text or binary files
     for i in range(nplots):
-        data[f"x{i}"], data[f"y{i}"], data[f"u{i}"] = (
-            np.loadtxt(dataFiles[i], unpack=True, skiprows=3))
-
-        # Reshape data based on iM and jM
-        DATA[f"X{i}"] = np.reshape(data[f"x{i}"], (iM[i], jM[i]))
-        DATA[f"Y{i}"] = np.reshape(data[f"y{i}"], (iM[i], jM[i]))
-        DATA[f"U{i}"] = np.reshape(data[f"u{i}"], (iM[i], jM[i]))
+        (DATA[f"X{i}"], DATA[f"Y{i}"]), DATA[f"U{i}"] = (
+            load_solution(dataFiles[i]))
 
     for i in range(nplots):
         plt.subplot(nrow, ncol, i+1)
@@ -38,7 +38,9 @@
 #   ***********************************************************************
 
 import configparser
+import os
 from .exceptions import InputFileError
+from .checkpoint import config_hash
 
 
 class ReadConfig:
@@ -62,15 +64,22 @@ class ReadConfig:
 
         Parameters
         ----------
-        InFileName: str
+        InFileName: str or configparser.ConfigParser
 
-            Path to configuration file.
+            Path to configuration file, or the configuration already
+            read or built in the memory.
         """
-        self.File = InFileName
-        self.config = configparser.ConfigParser()
-        dataset = self.config.read(InFileName)
-        if not dataset:
-            raise InputFileError("FileNotFound", InFileName)
+        if isinstance(InFileName, configparser.ConfigParser):
+            self.File = "<configparser.ConfigParser>"
+            self.config = InFileName
+        else:
+            self.File = InFileName
+            self.config = configparser.ConfigParser()
+            dataset = self.config.read(InFileName)
+            if not dataset:
+                raise InputFileError("FileNotFound", InFileName)
+        # Identifies the simulation setup stored in checkpoint files
+        self.ConfigHash = config_hash(self.config)
 
         self.ExpId = self.config['SETUP']['EXPID']
         self.UnitSystem = self.config['SETUP']['UNITS_SYSTEM']
@@ -86,11 +95,13 @@ class ReadConfig:
         self.GridfromFile = self.config['MESH']['GRID_FROM_FILE?']
         if self.GridfromFile.upper() == 'YES':
             self.GridFName = self.config['MESH']['GRID_FNAME']
-            if self.GridFName.lower() == 'none':
+            if not os.path.isfile(self.GridFName):
                 raise InputFileError("FileNotFound", self.GridFName)
-            else:
-                print("Functionality not available at this time")
-                print("Proceeding using other inputs.")
+        self.GridCacheDir = self.config['MESH'].get('GRID_CACHE_DIR',
+                                                    fallback=None)
+        if self.GridCacheDir is not None and \
+                self.GridCacheDir.lower() == 'none':
+            self.GridCacheDir = None
         self.GridAutoCalc = self.config['MESH']['GRID_AUTO_CALC?']
         if self.GridAutoCalc.upper() == 'YES':
             self.dX = float(self.config['MESH']['dX'])
@@ -101,26 +112,9 @@ class ReadConfig:
 
         self.StartOpt = self.config['IC']['START_OPT']
         if self.StartOpt.upper() == 'RESTART':
-            print("Functionality does not exists in this version.")
-            pass
-        if 1 == 0:
             self.RestartFile = self.config['IC']['RESTART_FILE']
-            print("Accessing initial condition settings: Completed.")
             if self.RestartFile.lower() == "none":
                 raise InputFileError("FileNotFound", self.RestartFile)
-                ch = int(input("Do you want to proceed with:\
-\n\t1. COLD START conditions, or\n\t2. Use a system default\
- RESTART filename?\nENTER 1 or 2.\n"))
-                if ch == 1:
-                    # Initialize with zero
-                    self.StartOpt = "COLD-START"
-                elif ch == 2:
-                    # Use defualt file name
-                    # InitFile = './output/restart.dat'
-                    print("This functionality is not available at this\
- time.")
-                    print("Proceeding to solve using cold-start\
- conditions.")
         # *********** BOUNDARY CONDITIONS *************
         self.BCfromFile = self.config['BC']['BC_FROM_FILE?']
         self.BCFileName = self.config['BC']['BC_FILE_NAME']
@@ -137,13 +131,19 @@ class ReadConfig:
         self.nMax = int(self.config['STOP']['nMAX'])
         # ************* OUTPUT INFORMATION *************
         self.HistFileName = self.config['OUTPUT']['HIST_FILE_NAME']
-        self.RestartFile = self.config['OUTPUT']['RESTART_FNAME']
+        self.CheckpointFile = self.config['OUTPUT']['RESTART_FNAME']
         self.OutFileName = self.config['OUTPUT']['RESULT_FNAME']
         self.nWrite = int(self.config['OUTPUT']['WRITE_EVERY'])
+        if not self.CheckpointFile.lower() == 'none':
+            self.nCheckpoint = int(self.config['OUTPUT'].get(
+                'CHECKPOINT_EVERY', fallback=str(self.nWrite)))
         self.nDisplay = int(self.config['OUTPUT']['DISPLAY_EVERY'])
         self.SaveforAnim = self.config['OUTPUT']['SAVE_FOR_ANIM?']
         if self.SaveforAnim.upper() == 'YES':
             self.nAnime = int(self.config['OUTPUT']['SAVE_EVERY'])
+            root, ext = os.path.splitext(self.OutFileName)
+            self.AnimFileName = self.config['OUTPUT'].get(
+                'ANIM_FNAME', fallback=root + '_snapshots.bin')
         self.Save1DOut = self.config['OUTPUT']['SAVE_1D_OUTPUT?']
         if self.Save1DOut.upper() == 'YES':
             nodeX = None
@@ -0,0 +1,127 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         relaxation.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from ..tridiagonal import BatchTridiagonalSolver
+
+# Starting (i, j) indices of the two interleaved sub-grids of each color
+# of the red-black (checkerboard) ordering. Red points have i+j even.
+RED = ((1, 1), (2, 2))
+BLACK = ((1, 2), (2, 1))
+
+
+def red_black_sweep(U, B2, omega=1.0, F=None):
+    """Perform one red-black Gauss-Seidel/SOR sweep on U in place.
+
+    All the red points are updated first using the old black values and
+    then all the black points are updated using the new red values. Each
+    color is updated with strided array slices, which still gives a true
+    Gauss-Seidel (omega = 1) or SOR (omega != 1) iteration, only with a
+    different ordering of the grid points than the lexicographic one.
+
+    F is the optional right-hand side of the five-point equation
+    U(i+1,j) + U(i-1,j) + B2*(U(i,j+1) + U(i,j-1)) - 2(1+B2)U(i,j) = F,
+    i.e. dX*dX times the source term of the Poisson's equation.
+    """
+    A = 0.5/(1.0 + B2)
+    for color in (RED, BLACK):
+        for si, sj in color:
+            _update_points(U, A, B2, omega, F, si, sj)
+    return U
+
+
+def symmetric_red_black_sweep(U, B2, omega=1.0, F=None):
+    """Perform one symmetric red-black SOR (SSOR) sweep on U in place.
+
+    A forward sweep (red, black) is followed by a backward sweep (black,
+    red). Used as a preconditioner this gives a symmetric operator.
+    """
+    A = 0.5/(1.0 + B2)
+    for color in (RED, BLACK, BLACK, RED):
+        for si, sj in color:
+            _update_points(U, A, B2, omega, F, si, sj)
+    return U
+
+
+def zebra_line_sweep(U, B2, F=None):
+    """Perform one zebra line Gauss-Seidel sweep on U in place.
+
+    The constant i lines are relaxed as in LineGaussSeidel_i(), first
+    all the odd lines and then all the even lines. The lines of one
+    color only depend on the lines of the other color and are therefore
+    solved together with the batched tridiagonal solver.
+    """
+    iM, jM = U.shape
+    A = np.full(jM, B2)
+    B = np.full(jM, -2.0*(1.0 + B2))
+    C = np.full(jM, B2)
+    for si in (1, 2):
+        I = slice(si, iM-1, 2)
+        Ie = slice(si+1, iM, 2)
+        Iw = slice(si-1, iM-2, 2)
+        UU = U[I, :].copy()
+        if UU.shape[0] == 0:
+            continue
+        D = np.zeros_like(UU)
+        D[:, 1:-1] = -(U[Ie, 1:-1] + U[Iw, 1:-1])
+        if F is not None:
+            D[:, 1:-1] += F[I, 1:-1]
+        UU = BatchTridiagonalSolver(A, B, C, D, UU)
+        U[I, 1:-1] = UU[:, 1:-1]
+    return U
+
+
+def _update_points(U, A, B2, omega, F, si, sj):
+    """Update the interior points U[si::2, sj::2] of one sub-grid."""
+    iM, jM = U.shape
+    I = slice(si, iM-1, 2)
+    J = slice(sj, jM-1, 2)
+    Ie = slice(si+1, iM, 2)
+    Iw = slice(si-1, iM-2, 2)
+    Jn = slice(sj+1, jM, 2)
+    Js = slice(sj-1, jM-2, 2)
+    Unew = A*(U[Ie, J] + U[Iw, J] + B2*(U[I, Jn] + U[I, Js]))
+    if F is not None:
+        Unew -= A*F[I, J]
+    if omega == 1.0:
+        U[I, J] = Unew
+    else:
+        U[I, J] = (1.0 - omega)*U[I, J] + omega*Unew
@@ -0,0 +1,194 @@
+"""Residual norms and strided residual monitoring."""
+#   ***********************************************************************
+#
+#   FILE         residual.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import math
+
+import numpy as np
+
+from .fetchoptions import FetchOptions
+from .exceptions import ResidualNormInputError, ResidualTypeInputError
+
+
+def check_residual_options(Norm, Residual):
+    """Raise an exception if Norm or Residual is not a valid option."""
+    f = FetchOptions()
+    if Norm not in f.ResidualNormOptions():
+        raise ResidualNormInputError(Norm)
+    if Residual not in f.ResidualTypeOptions():
+        raise ResidualTypeInputError(Residual)
+
+
+def interior(ndim):
+    """Return the index of the interior points of a 1D or 2D array."""
+    return (slice(1, -1),)*ndim
+
+
+def difference_residual(U, Uold, out):
+    """Store U - Uold at the interior points in out."""
+    index = interior(U.ndim)
+    return np.subtract(U[index], Uold[index], out=out)
+
+
+def laplace_residual(U, Beta, out, work=None):
+    """Store the residual of the five-point Laplace equation in out.
+
+    The residual is U[i+1] - 2U[i] + U[i-1] in 1D and
+    U[i+1,j] + U[i-1,j] + Beta**2 (U[i,j+1] + U[i,j-1])
+    - 2(1 + Beta**2) U[i,j] in 2D, i.e. dX**2 times the residual of
+    the discretized equation. work is an array of
+    the shape of out, required in 2D if Beta != 1.
+    """
+    if U.ndim == 1:
+        np.add(U[2:], U[:-2], out=out)
+        out -= U[1:-1]
+        out -= U[1:-1]
+        return out
+    Beta2 = Beta*Beta
+    np.add(U[2:, 1:-1], U[:-2, 1:-1], out=out)
+    if Beta2 == 1.0:
+        out += U[1:-1, 2:]
+        out += U[1:-1, :-2]
+        for k in range(4):
+            out -= U[1:-1, 1:-1]
+        return out
+    np.add(U[1:-1, 2:], U[1:-1, :-2], out=work)
+    work *= Beta2
+    out += work
+    np.multiply(U[1:-1, 1:-1], 2.0*(1.0 + Beta2), out=work)
+    out -= work
+    return out
+
+
+def residual_norm(R, Norm):
+    """Return the L1, L2 or Linf norm of R, R is overwritten."""
+    if Norm == "L2":
+        R = R.reshape(-1)
+        return math.sqrt(np.dot(R, R))
+    np.abs(R, out=R)
+    if Norm == "L1":
+        return R.sum()
+    return R.max()
+
+
+class ResidualMonitor:
+    """Evaluate the residual norm every nCheck steps without temporaries.
+
+    The residual is computed in work arrays allocated once. With
+    Adaptive=True, the interval between the evaluations is estimated
+    from the convergence rate of the last two evaluations, i.e. the
+    residual is evaluated rarely while it is far from Tol and more
+    often close to convergence.
+
+    Call signature:
+        ResidualMonitor(shape, Norm="L1", Residual="Difference",
+                        nCheck=1, Beta=1.0, Adaptive=False, Tol=None,
+                        nCheckMax=100)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape of the dependent variable.
+    Norm: str, Default="L1"
+        "L1", "L2" or "Linf" norm of the residual at the interior points.
+    Residual: str, Default="Difference"
+        "Difference" for U - Uold, "Laplace" for the residual of the
+        five-point Laplace equation which does not require Uold.
+    nCheck: int, Default=1
+        Number of steps between the evaluations, initial number if
+        Adaptive.
+    Beta: float, Default=1.0
+        Ratio of the grid step sizes dX/dY for the Laplace residual.
+    Adaptive: bool, Default=False
+        Adapt the number of steps between the evaluations.
+    Tol: float, Default=None
+        Convergence criteria used by the adaptive interval.
+    nCheckMax: int, Default=100
+        Maximum number of steps between the adaptive evaluations.
+    """
+
+    def __init__(self, shape, Norm="L1", Residual="Difference", nCheck=1,
+                 Beta=1.0, Adaptive=False, Tol=None, nCheckMax=100):
+        """Class constructor for the ResidualMonitor class."""
+        check_residual_options(Norm, Residual)
+        self.Norm = Norm
+        self.Residual = Residual
+        self.nCheck = nCheck
+        self.Beta = Beta
+        self.Adaptive = Adaptive
+        self.Tol = Tol
+        self.nCheckMax = nCheckMax
+        self.nNext = nCheck
+        self.Last = None  # (n, norm) of the last evaluation
+        shapeR = tuple(max(m - 2, 0) for m in shape)
+        self._R = np.empty(shapeR)
+        self._work = None
+        if Residual == "Laplace" and len(shape) == 2 and Beta != 1.0:
+            self._work = np.empty(shapeR)
+
+    def Due(self, n):
+        """Return True if the residual is to be evaluated at step n."""
+        return n >= self.nNext
+
+    def Evaluate(self, n, U, Uold=None):
+        """Return the residual norm at step n and schedule the next one."""
+        if self.Residual == "Difference":
+            difference_residual(U, Uold, self._R)
+        else:
+            laplace_residual(U, self.Beta, self._R, self._work)
+        Value = residual_norm(self._R, self.Norm)
+        interval = self.nCheck
+        if self.Adaptive and self.Last is not None:
+            interval = self._AdaptiveInterval(n, Value)
+        self.Last = (n, Value)
+        self.nNext = n + interval
+
+        return Value
+
+    def _AdaptiveInterval(self, n, Value):
+        """Return the number of steps to the next evaluation."""
+        nLast, Last = self.Last
+        if self.Tol is None or not 0.0 < Value < Last or n <= nLast:
+            return self.nCheck
+        if Value <= self.Tol:
+            return 1
+        # Residual ~ Value*rate**k after k steps
+        logRate = math.log(Value/Last)/(n - nLast)
+        nSteps = math.log(self.Tol/Value)/logRate
+        return int(min(max(nSteps/2.0, 1.0), self.nCheckMax))
@@ -0,0 +1,223 @@
+"""Append-only archive of solution snapshots stored in one binary file."""
+#   ***********************************************************************
+#
+#   FILE         snapshots.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import os
+import struct
+
+import numpy as np
+
+# The archive file starts with a header of HEADER_SIZE bytes,
+#   magic (8 bytes), version, dimension (int32),
+#   IMAX, JMAX, count (int64), dX, dY (float64),
+# followed by fixed size records, one per snapshot,
+#   n (int64), time (float64), U (IMAX*JMAX float64, C order).
+# Record k therefore starts at HEADER_SIZE + k*(record size) and any
+# snapshot can be memory mapped without reading the preceding ones. The
+# file is grown by CHUNK records at a time; only the first "count"
+# records are valid, and count is updated after the record is written.
+MAGIC = b"NANPSNAP"
+VERSION = 1
+HEADER = struct.Struct("<8sii3q2d")
+HEADER_SIZE = 64
+COUNT_OFFSET = 32
+CHUNK = 16
+
+
+class SnapshotArchive:
+    """Append-only store of the solution at selected steps of a run.
+
+    Call signature:
+        SnapshotArchive(fName, mode="r", shape=None, dX=1.0, dY=None)
+
+    Attributes
+    ----------
+    fName: str
+        Path of the archive file.
+    mode: str, Default="r"
+        "r" to read, "w" to create a new archive (an existing file is
+        overwritten) or "a" to append to an existing archive, which is
+        created if it does not exist.
+    shape: tuple, Default=None
+        Shape of the solution U, required to create an archive.
+    dX, dY: float
+        Grid step sizes stored with the snapshots.
+    """
+
+    def __init__(self, fName, mode="r", shape=None, dX=1.0, dY=None):
+        """Class constructor for the SnapshotArchive class."""
+        if mode not in ["r", "w", "a"]:
+            raise ValueError(f"Invalid mode {mode} for SnapshotArchive.")
+        self.fName = fName
+        self.mode = mode
+        self._file = None
+        if mode == "w" or (mode == "a" and not os.path.exists(fName)):
+            if shape is None:
+                raise ValueError("shape is required to create a snapshot\
+ archive.")
+            self._Create(shape, dX, dY)
+        else:
+            self._ReadHeader()
+        if mode != "r":
+            self._file = open(fName, "r+b")
+            self._file.seek(0, os.SEEK_END)
+            self._allocated = ((self._file.tell() - HEADER_SIZE)
+                               // self._dtype.itemsize)
+
+    def __len__(self):
+        """Return the number of snapshots in the archive."""
+        return self.count
+
+    def __enter__(self):
+        """Return the archive for use in a with statement."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive at the end of a with statement."""
+        self.Close()
+
+    def Append(self, n, Time, U):
+        """Append the solution U at step n and physical time Time."""
+        if self._file is None:
+            raise ValueError("Snapshot archive is opened for reading.")
+        if U.shape != self.shape:
+            raise ValueError(f"Snapshot shape {U.shape} does not match the\
+ archive shape {self.shape}.")
+        record = np.zeros((), dtype=self._dtype)
+        record["n"] = n
+        record["time"] = Time
+        record["U"] = U
+        if self.count == self._allocated:
+            # Reserve the space for the next chunk of snapshots
+            self._allocated += CHUNK
+            self._file.truncate(HEADER_SIZE
+                                + self._allocated*self._dtype.itemsize)
+        self._file.seek(HEADER_SIZE + self.count*self._dtype.itemsize)
+        self._file.write(record.tobytes())
+        self.count += 1
+        self._file.seek(COUNT_OFFSET)
+        self._file.write(struct.pack("<q", self.count))
+
+    def Flush(self):
+        """Write the buffered snapshots to the disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def Close(self):
+        """Close the archive file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def Steps(self):
+        """Return the step numbers of the snapshots."""
+        return np.array(self._Records()["n"])
+
+    @property
+    def Times(self):
+        """Return the physical times of the snapshots."""
+        return np.array(self._Records()["time"])
+
+    def Read(self, k):
+        """Return snapshot k as a read-only memory mapped array.
+
+        Only the pages of this snapshot are read from the disk when
+        the values are accessed.
+        """
+        if not -self.count <= k < self.count:
+            raise IndexError(f"Snapshot {k} is not in the archive of\
+ {self.count} snapshots.")
+        k = k % self.count
+        self.Flush()
+        return np.memmap(self.fName, dtype=np.dtype("<f8"), mode="r",
+                         offset=(HEADER_SIZE + k*self._dtype.itemsize
+                                 + 16),
+                         shape=self.shape)
+
+    def ReadStep(self, n):
+        """Return the snapshot saved at step n, see Read()."""
+        k = np.flatnonzero(self._Records()["n"] == n)
+        if k.size == 0:
+            raise KeyError(f"No snapshot saved at step {n}.")
+        return self.Read(int(k[-1]))
+
+    def _Create(self, shape, dX, dY):
+        """Write the header of a new archive."""
+        self._SetShape(tuple(shape), dX, dY)
+        self.count = 0
+        iM, jM = self._Dims()
+        header = HEADER.pack(MAGIC, VERSION, len(self.shape), iM, jM, 0,
+                             self.dX, self.dY)
+        with open(self.fName, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\x00"))
+
+    def _ReadHeader(self):
+        """Read the header of an existing archive."""
+        with open(self.fName, "rb") as f:
+            header = f.read(HEADER.size)
+        magic, version, dim, iM, jM, count, dX, dY = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{self.fName} is not a NAnPack snapshot\
+ archive.")
+        shape = (iM,) if dim == 1 else (iM, jM)
+        self._SetShape(shape, dX, dY)
+        self.count = count
+
+    def _SetShape(self, shape, dX, dY):
+        """Set the shape, grid steps and record layout of the archive."""
+        self.shape = shape
+        self.dX = dX
+        self.dY = 0.0 if dY is None else dY
+        self._dtype = np.dtype([("n", "<i8"), ("time", "<f8"),
+                                ("U", "<f8", shape)])
+
+    def _Dims(self):
+        """Return IMAX and JMAX, JMAX = 1 for 1D solutions."""
+        if len(self.shape) == 1:
+            return self.shape[0], 1
+        return self.shape
+
+    def _Records(self):
+        """Return all valid records as a read-only memory mapped array."""
+        self.Flush()
+        if self.count == 0:
+            return np.zeros(0, dtype=self._dtype)
+        return np.memmap(self.fName, dtype=self._dtype, mode="r",
+                         offset=HEADER_SIZE, shape=(self.count,))
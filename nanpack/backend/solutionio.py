@@ -0,0 +1,152 @@
+"""Binary solution files and readers for the text and binary formats."""
+#   ***********************************************************************
+#
+#   FILE         solutionio.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import struct
+
+import numpy as np
+
+from .fetchoptions import FetchOptions
+from .exceptions import OutputFormatInputError
+
+# A binary solution file starts with a header of HEADER_SIZE bytes,
+#   magic (8 bytes), version, dimension (int32),
+#   IMAX, JMAX, n (int64), dX, dY (float64),
+# followed by the solution U as little-endian float64 values in C order
+# (row i after row i). JMAX = 1 and dY = 0.0 for 1D solutions. The data
+# can therefore be opened with np.memmap without reading the file.
+MAGIC = b"NANPACK\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sii3q2d")
+HEADER_SIZE = 64
+DTYPE = np.dtype("<f8")
+
+
+def check_output_format(Format):
+    """Raise OutputFormatInputError if Format is not a valid option."""
+    if Format not in FetchOptions().OutputFormatOptions():
+        raise OutputFormatInputError(Format)
+
+
+def save_solution_binary(fName, U, n, dX, dY=None):
+    """Save the 1d or 2d solution U to a binary file."""
+    shapeU = U.shape
+    if len(shapeU) == 1:
+        iM, = shapeU
+        jM = 1
+    else:
+        iM, jM = shapeU
+    if dY is None:
+        dY = 0.0
+    header = HEADER.pack(MAGIC, VERSION, len(shapeU), iM, jM, n,
+                         dX, dY)
+    data = np.ascontiguousarray(U, dtype=DTYPE)
+    with open(fName, "wb") as OutFile:
+        OutFile.write(header.ljust(HEADER_SIZE, b"\x00"))
+        OutFile.write(data.data)
+
+
+def is_binary_solution(fName):
+    """Return True if fName is a binary solution file."""
+    with open(fName, "rb") as InFile:
+        return InFile.read(len(MAGIC)) == MAGIC
+
+
+def read_binary_header(fName):
+    """Return the header of a binary solution file as a dictionary."""
+    with open(fName, "rb") as InFile:
+        header = InFile.read(HEADER.size)
+    magic, version, dim, iM, jM, n, dX, dY = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{fName} is not a NAnPack binary solution file.")
+    shape = (iM,) if dim == 1 else (iM, jM)
+    return {"Version": version, "Dimension": dim, "Shape": shape,
+            "IMAX": iM, "JMAX": jM, "n": n, "dX": dX, "dY": dY}
+
+
+def read_binary_solution(fName, mode="r"):
+    """Return the solution in a binary file as np.memmap and its header.
+
+    The values are not read into memory until they are accessed. Use
+    mode "r+" to modify the file in place or "c" for copy-on-write.
+    """
+    info = read_binary_header(fName)
+    U = np.memmap(fName, dtype=DTYPE, mode=mode, offset=HEADER_SIZE,
+                  shape=info["Shape"])
+    return U, info
+
+
+def read_text_solution(fName):
+    """Return the solution and grid in a text solution file.
+
+    The file is written by WriteSolutionToFile() or save_solution(), i.e.
+    3 header lines followed by the columns X, U (1D) or X, Y, U (2D).
+    """
+    with open(fName) as f:
+        grid = f.readline().split(",")
+    iM = int((grid[0].split("= "))[1])
+    data = np.loadtxt(fName, unpack=True, skiprows=3)
+    if len(grid) == 1:
+        x, u = data
+        return (x,), u
+    jM = int((grid[1].split("= "))[1])
+    x, y, u = data
+    X = np.reshape(x, (iM, jM))
+    Y = np.reshape(y, (iM, jM))
+    U = np.reshape(u, (iM, jM))
+    return (X, Y), U
+
+
+def load_solution(fName):
+    """Return the grid and solution stored in a text or binary file.
+
+    Returns ((X,), U) for 1D and ((X, Y), U) for 2D solutions. For binary
+    files U is a read-only np.memmap and X, Y are broadcast views, so no
+    data is copied.
+    """
+    if not is_binary_solution(fName):
+        return read_text_solution(fName)
+    U, info = read_binary_solution(fName)
+    x = info["dX"]*np.arange(info["IMAX"])
+    if info["Dimension"] == 1:
+        return (x,), U
+    y = info["dY"]*np.arange(info["JMAX"])
+    X = np.broadcast_to(x[:, np.newaxis], U.shape)
+    Y = np.broadcast_to(y[np.newaxis, :], U.shape)
+    return (X, Y), U
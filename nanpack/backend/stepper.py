@@ -0,0 +1,162 @@
+"""Not a public module."""
+#   ***********************************************************************
+#
+#   FILE         stepper.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+
+class Stepper:
+    """Base class of the solver objects with persistent work arrays.
+
+    A solver object is created once for a given shape of the dependent
+    variable and allocates all its stage and work arrays in the
+    constructor. Each call to Step() then advances the solution by one
+    time step (or iteration) without allocating new arrays, writing the
+    result into an output array provided by the caller.
+
+    The derived classes implement _Advance(Uo, U) which computes the
+    interior values of U from Uo. The boundary values of U are copied
+    from Uo by Step() as in the solver functions. If the boundary
+    conditions BC are given, see StageBC(), they are applied to U at the
+    end of Step(); the multi-stage schemes also apply them to each stage
+    with self.BC(Uk).
+    """
+
+    # Set to True in the derived class if _Advance() gives the correct
+    # result when U and Uo are the same array.
+    InPlace = False
+
+    def __init__(self, shape, BC=None):
+        """Class constructor for the Stepper class."""
+        self.shape = tuple(shape)
+        self.BC = StageBC(BC)
+        self._Ucopy = None  # copy of Uo for in-place steps
+        self._Upong = None  # second buffer for the ping-pong steps
+
+    def Step(self, Uo, U=None):
+        """Advance the solution by one time step.
+
+        Parameters
+        ----------
+        Uo: ndarray[float], =1d or 2d
+            The dependent variable at time level, n within the entire
+            domain.
+        U: ndarray[float], =1d or 2d, Default = None
+            Output array for the dependent variable at time level, n+1.
+            A new array is created if None. U may be the same array as Uo
+            for an in-place update.
+
+        Returns
+        -------
+        U: ndarray[float], =1d or 2d
+            The dependent variable at time level, n+1 within the entire
+            domain.
+        """
+        if Uo.shape != self.shape:
+            raise Exception(f"Shape {Uo.shape} of the dependent variable\
+ does not match the solver shape {self.shape}.")
+        if U is None:
+            U = Uo.copy()
+        elif U is Uo:
+            if not self.InPlace:
+                if self._Ucopy is None:
+                    self._Ucopy = np.empty(self.shape)
+                self._Ucopy[...] = Uo
+                Uo = self._Ucopy
+        else:
+            CopyBoundary(Uo, U)
+        self._Advance(Uo, U)
+        self.BC(U)
+
+        return U
+
+    def Run(self, U, nSteps):
+        """Advance the solution in place by nSteps time steps.
+
+        The steps alternate between U and an internal buffer of the same
+        shape (ping-pong buffers) so that no copies are made between the
+        steps. The final solution is returned in U.
+        """
+        if self._Upong is None:
+            self._Upong = np.empty(self.shape)
+        Uo, Unew = U, self._Upong
+        for n in range(nSteps):
+            self.Step(Uo, Unew)
+            Uo, Unew = Unew, Uo
+        if Uo is not U:
+            U[...] = Uo
+
+        return U
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        raise NotImplementedError
+
+
+def CopyBoundary(Uo, U):
+    """Copy the boundary values of Uo into U."""
+    for axis in range(Uo.ndim):
+        index = [slice(None)]*Uo.ndim
+        for edge in (0, -1):
+            index[axis] = edge
+            U[tuple(index)] = Uo[tuple(index)]
+    return U
+
+
+def StageBC(BC):
+    """Return a function which applies the boundary conditions BC to U.
+
+    BC may be None (the boundary values are not modified), an object
+    with the method Apply(U), e.g. BCPlan or BCPlan1D, or a function
+    BC(U) which assigns the boundary values of U in place.
+    """
+    if BC is None:
+        return _KeepBoundary
+    elif hasattr(BC, "Apply"):
+        return BC.Apply
+    elif callable(BC):
+        return BC
+    else:
+        raise TypeError(f"Boundary conditions {BC!r} is neither a\
+ function nor an object with the method Apply(U).")
+
+
+def _KeepBoundary(U):
+    """Leave the boundary values of U unchanged."""
+    return U
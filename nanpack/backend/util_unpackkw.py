@@ -52,12 +52,14 @@ def writesolution_kwargs(**kwargs):
     nmax = kwargs.get("nMax", None)
     dx = kwargs.get("dX", None)
     dy = kwargs.get("dY", None)
+    fmt = kwargs.get("Format", "Text")
     var_dict = {
         "nWrite": nwrite,
         "FileName": fname,
         "nMax": nmax,
         "dX": dx,
-        "dY": dy
+        "dY": dy,
+        "Format": fmt
         }
     return var_dict
 
@@ -38,6 +38,7 @@
 #   ***********************************************************************
 
 from .util_unpackkw import writesolution_kwargs, write1dsolution_kwargs
+from .solutionio import check_output_format, save_solution_binary
 
 
 def save_metrics_2d(x, y, xix, xiy, etax, etay, jj, f_name):
@@ -77,6 +78,7 @@ def save_solution(CfgClsObj, n, U, **kwargs):
         fName = kwargs.get("FileName", None)
         if fName is None:
             fName = CfgClsObj.OutFileName
+        Format = kwargs.get("Format", "Text")
     else:
         kw = writesolution_kwargs(**kwargs)
         nMax = kw["nMax"]
@@ -84,8 +86,12 @@ def save_solution(CfgClsObj, n, U, **kwargs):
         fName = kw["FileName"]
         dX = kw["dX"]
         dY = kw["dY"]
+        Format = kw["Format"]
+    check_output_format(Format)
 
-    if n % nWrite == 0 or n == nMax:
+    if Format == "Binary" and (n % nWrite == 0 or n == nMax):
+        save_solution_binary(fName, U, n, dX, dY)
+    elif n % nWrite == 0 or n == nMax:
         OutFile = open(fName, "w")
         shapeU = U.shape  # Obtain shape for Dimension
         if len(shapeU) == 1:  # Dimension = 1D
@@ -209,9 +215,9 @@ def save_convergence_hist(CfgClsObj, n, error, **kwargs):
         totTime = kw["SimTime"]
     # Write convergence data to file
     if n == 0 or n == 1:
-        HistFile = open(fName, "w")
-        print(f'{"ITER":>7} {"ERROR":>15}', file=HistFile)
-        print(f'{"----":>7} {"-----":>15}', file=HistFile)
+        with open(fName, "w") as HistFile:
+            print(f'{"ITER":>7} {"ERROR":>15}', file=HistFile)
+            print(f'{"----":>7} {"-----":>15}', file=HistFile)
     if n % nDisplay == 0 or n == nMax or error < ConvCrit:
         HistFile = open(fName, "a")
         print(f'{n:>7} {error:>15.8f}', file=HistFile)
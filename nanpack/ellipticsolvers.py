@@ -55,18 +55,27 @@ conduction equation, which is expressed as:
 #
 #   ***********************************************************************
 
-from .backend.exceptions import DimensionError
-from .tridiagonal import TridiagonalSolver
+import numpy as np
 
+from .backend.exceptions import DimensionError, SweepOrderingInputError
+from .backend.exceptions import MultigridSmootherInputError
+from .backend.exceptions import PreconditionerInputError
+from .backend.fetchoptions import FetchOptions
+from .backend.relaxation import red_black_sweep
+from .backend.kernels import pgs_sweep, psor_sweep
+from .backend import multigrid as mg
+from .backend.krylov import pcg
+from .tridiagonal import TridiagonalSolver, BatchTridiagonalSolver
 
-def PointGaussSeidel(Uo, Beta):
+
+def PointGaussSeidel(Uo, Beta, Ordering="Lexicographic"):
     """Return the numerical solution of dependent variable in the model eq.
 
     This routine uses the Point-Gauss Seidel method
     to obtain the solution of the Laplace's equation.
 
     Call signature:
-        PointGaussSeidel(Uo, Beta)
+        PointGaussSeidel(Uo, Beta, Ordering)
 
     Parameters
     ----------
@@ -75,6 +84,13 @@ def PointGaussSeidel(Uo, Beta):
     Beta: float
         Coefficient in the Laplace's finite difference approximation.
         Beta = dX/dY
+    Ordering: str, Default = "Lexicographic"
+        Order in which the grid points are visited.
+        "Lexicographic": row by row, as in Hoffmann Vol. 1.
+        "Red-Black": checkerboard ordering, all points with (i+j) even are
+        updated first followed by all points with (i+j) odd. Each color is
+        updated in a single vectorized operation, which is much faster
+        than the lexicographic ordering on large grids.
 
     Returns
     -------
@@ -84,15 +100,22 @@ def PointGaussSeidel(Uo, Beta):
     shapeU = Uo.shape  # Obtain Dimension
     if len(shapeU) == 1:
         raise DimensionError("1D", "Laplace's", "Point Gauss-Seidel")
+    _CheckOrdering(Ordering, "PointGaussSeidel")
     # Proceed to numerical solution
     U = Uo.copy()  # Initialize U
     iMax, jMax = shapeU
     B2 = Beta*Beta
     A = 0.5/(1.0 + B2)
+    if Ordering == "Red-Black":
+        # Points of one color depend only on points of the other color
+        # so that each half sweep is free of the (i-1,j), (i,j-1)
+        # dependency mentioned below.
+        return red_black_sweep(U, B2)
 
     # Python numpy array slicing operation cannot be used in PGS method
     # because PGS utilizes solution at k+1 level at points (i-1,j) and
-    # (i,j-1) which can only be taken into account using FOR loops.
+    # (i,j-1) which can only be taken into account using FOR loops, or
+    # along the anti-diagonals i+j = const, see backend.kernels.
     # Numpy slicing operation below will result in Jacobi iteration method.
     # U[1:-1,1:-1] = A*(U[2:,1:-1] + U[0:-2,1:-1] +\
     #                   B2*(U[1:-1,2:] + U[1:-1,0:-2]))
@@ -102,11 +125,7 @@ def PointGaussSeidel(Uo, Beta):
     # use
     # values of dependent variable from advanced time step (k+1) at points
     # (i-1,j) or (i,j-1).
-    for i in range(1, iMax-1):
-        for j in range(1, jMax-1):
-            U[i][j] = A*(U[i+1][j] + U[i-1][j]
-                         +
-                         B2*(U[i][j+1] + U[i][j-1]))
+    U = pgs_sweep(U, A, B2)
 
     return U
 
@@ -217,14 +236,14 @@ def LineGaussSeidel_j(Uo, Beta):
     return U
 
 
-def PSOR(Uo, Beta, RelaxParam=1.78):
+def PSOR(Uo, Beta, RelaxParam=1.78, Ordering="Lexicographic"):
     """Return the numerical solution of dependent variable in the model eq.
 
     This routine uses the Point Successive Over-Relaxation (PSOR) method
     to obtain the solution of the Laplace's equation.
 
     Call signature:
-        PSOR(Uo, Beta, RelaxParam)
+        PSOR(Uo, Beta, RelaxParam, Ordering)
 
     Parameters
     ----------
@@ -243,6 +262,13 @@ def PSOR(Uo, Beta, RelaxParam=1.78):
         RelaxParam = 1.78 was found to be an optimum value for PSOR method
         for the problem with a rectangular domain having uniform grid step
         with the Dirichlet BC imposed (see Hoffmann Vol. 1, pg 164, 170).
+    Ordering: str, Default = "Lexicographic"
+        Order in which the grid points are visited.
+        "Lexicographic": row by row, as in Hoffmann Vol. 1.
+        "Red-Black": checkerboard ordering, all points with (i+j) even are
+        updated first followed by all points with (i+j) odd. Each color is
+        updated in a single vectorized operation, which is much faster
+        than the lexicographic ordering on large grids.
     Returns
     -------
     U: ndarray[float], =2d
@@ -251,14 +277,18 @@ def PSOR(Uo, Beta, RelaxParam=1.78):
     shapeU = Uo.shape  # Obtain Dimension
     if len(shapeU) == 1:
         raise DimensionError("1D", "Laplace's", "Point S Over-Relaxation.")
+    _CheckOrdering(Ordering, "PSOR")
     # Proceed to numerical solution
     U = Uo.copy()  # Initialize U
     iMax, jMax = shapeU
     B2 = Beta*Beta
     A = 0.5/(1.0 + B2)
+    if Ordering == "Red-Black":
+        return red_black_sweep(U, B2, RelaxParam)
     # Python numpy array slicing operation cannot be used in PSOR method
     # because PGS utilizes solution at k+1 level at points (i-1,j) and
-    # (i,j-1) which can only be taken into account using FOR loops.
+    # (i,j-1) which can only be taken into account using FOR loops, or
+    # along the anti-diagonals i+j = const, see backend.kernels.
     # Numpy slicing operation is given below but it is not PSOR method.
     # U[1:-1,1:-1] = (1.0 - RelaxParam)*Uo[1:-1,1:-1] +\
     #                 RelaxParam*A*(Uo[2:,1:-1] + Uo[0:-2,1:-1] +\
@@ -269,13 +299,7 @@ def PSOR(Uo, Beta, RelaxParam=1.78):
     # use the
     # values of dependent variable from advanced time step (k+1) at points
     # (i-1,j) or (i,j-1).
-    for i in range(1, iMax-1):
-        for j in range(1, jMax-1):
-            U[i][j] = (
-                (1 - RelaxParam)*U[i][j]
-                + RelaxParam*A*(U[i+1][j] + U[i-1][j]
-                                + B2*(U[i][j+1] + U[i][j-1]))
-                )
+    U = psor_sweep(U, A, B2, RelaxParam)
 
     return U
 
@@ -592,3 +616,303 @@ def ADISOR(Uo, Beta, RelaxParam=1.27):
             U[i][j] = UU[j]
 
     return U
+
+
+def MultigridV(Uo, Beta, nPre=2, nPost=2, Smoother="Red-Black", RHS=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine performs one V-cycle of the geometric multigrid method
+    to obtain the solution of the Laplace's (or Poisson's) equation.
+    The error which is not reduced efficiently by the relaxation on the
+    given grid is corrected on a hierarchy of coarser grids obtained by
+    removing every other grid point. The convergence rate per cycle is
+    independent of the grid size.
+
+    The grid must have an even number of cells, i.e. (iMax-1) and
+    (jMax-1) divisible by 2, on as many levels as possible, e.g.
+    iMax = 2^k*m + 1 for a small m. The boundary values of Uo are
+    not modified (Dirichlet BC).
+
+    Call signature:
+        MultigridV(Uo, Beta, nPre, nPost, Smoother, RHS)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the domain.
+    Beta: float
+        Coefficient in the Laplace's finite difference approximation.
+        Beta = dX/dY
+    nPre: int, Default = 2
+        Number of smoothing sweeps before the coarse grid correction.
+    nPost: int, Default = 2
+        Number of smoothing sweeps after the coarse grid correction.
+    Smoother: str, Default = "Red-Black"
+        Relaxation method used as the smoother on each grid level.
+        "Red-Black": red-black Point Gauss-Seidel.
+        "Zebra-Line": Line Gauss-Seidel along constant i lines in
+        alternating (odd/even) order, better suited when Beta > 1.
+    RHS: ndarray[float], =2d, Default = None
+        Right-hand side of the Poisson's equation multiplied by dX*dX,
+        i.e. dX*dX*f(x,y). The Laplace's equation is solved if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable at time level, n+1 within the domain.
+    """
+    shapeU = Uo.shape  # Obtain Dimension
+    if len(shapeU) == 1:
+        raise DimensionError("1D", "Laplace's", "Multigrid")
+    smooth = _GetSmoother(Smoother, "MultigridV")
+    # Proceed to numerical solution
+    U = Uo.copy()  # Initialize U
+    B2 = Beta*Beta
+    U = mg.v_cycle(U, B2, RHS, nPre, nPost, smooth)
+
+    return U
+
+
+def FullMultigrid(Uo, Beta, nPre=2, nPost=2, nCycles=1,
+                  Smoother="Red-Black", RHS=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the full multigrid (FMG) method to obtain the
+    solution of the Laplace's (or Poisson's) equation. The equation is
+    first solved on the coarsest grid and the solution is interpolated
+    to the next finer grid where it is used as the initial guess for
+    nCycles V-cycles. This is repeated up to the given grid so that a
+    solution accurate to the level of the truncation error is typically
+    obtained in a single call. Only the boundary values of Uo are used.
+
+    See MultigridV() for the grid size requirements.
+
+    Call signature:
+        FullMultigrid(Uo, Beta, nPre, nPost, nCycles, Smoother, RHS)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the domain.
+    Beta: float
+        Coefficient in the Laplace's finite difference approximation.
+        Beta = dX/dY
+    nPre: int, Default = 2
+        Number of smoothing sweeps before the coarse grid correction.
+    nPost: int, Default = 2
+        Number of smoothing sweeps after the coarse grid correction.
+    nCycles: int, Default = 1
+        Number of V-cycles performed on each grid level.
+    Smoother: str, Default = "Red-Black"
+        Relaxation method used as the smoother on each grid level.
+        See MultigridV().
+    RHS: ndarray[float], =2d, Default = None
+        Right-hand side of the Poisson's equation multiplied by dX*dX,
+        i.e. dX*dX*f(x,y). The Laplace's equation is solved if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable within the domain.
+    """
+    shapeU = Uo.shape  # Obtain Dimension
+    if len(shapeU) == 1:
+        raise DimensionError("1D", "Laplace's", "Full Multigrid")
+    smooth = _GetSmoother(Smoother, "FullMultigrid")
+    # Proceed to numerical solution
+    U = Uo.copy()  # Initialize U
+    B2 = Beta*Beta
+    U = mg.full_multigrid(U, B2, RHS, nPre, nPost, nCycles, smooth)
+
+    return U
+
+
+def ConjugateGradient(Uo, Beta, Precond="SSOR", RelaxParam=1.0,
+                      Tol=1e-8, nMax=None, RHS=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the preconditioned Conjugate Gradient (PCG) method
+    to obtain the solution of the Laplace's (or Poisson's) equation.
+    The five-point finite difference operator is applied matrix-free on
+    the interior grid points and the boundary values of Uo, e.g. as
+    assigned by BC2D(), are treated as Dirichlet conditions. Unlike the
+    relaxation methods, the equation is solved to the tolerance Tol in a
+    single call; the number of iterations grows as O(sqrt(N)) for N
+    grid points.
+
+    Call signature:
+        ConjugateGradient(Uo, Beta, Precond, RelaxParam, Tol, nMax, RHS)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the domain. The
+        interior values are used as the initial guess.
+    Beta: float
+        Coefficient in the Laplace's finite difference approximation.
+        Beta = dX/dY
+    Precond: str, Default = "SSOR"
+        Preconditioner.
+        "SSOR": one symmetric red-black SOR sweep.
+        "Jacobi": diagonal scaling.
+        "None": no preconditioning.
+    RelaxParam: float, Default = 1.0
+        Relaxation Parameter of the SSOR preconditioner. Specify values
+        between 0 and 2.0.
+    Tol: float, Default = 1e-8
+        Convergence criterion, reduction of the L2 norm of the residual
+        relative to the right-hand side of the linear system.
+    nMax: int, Default = None
+        Maximum number of iterations. Defaults to the number of interior
+        grid points.
+    RHS: ndarray[float], =2d, Default = None
+        Right-hand side of the Poisson's equation multiplied by dX*dX,
+        i.e. dX*dX*f(x,y). The Laplace's equation is solved if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable within the domain.
+    """
+    shapeU = Uo.shape  # Obtain Dimension
+    if len(shapeU) == 1:
+        raise DimensionError("1D", "Laplace's", "Conjugate Gradient")
+    if Precond not in FetchOptions().PreconditionerOptions():
+        raise PreconditionerInputError(Precond, "ConjugateGradient")
+    # Proceed to numerical solution
+    U = Uo.astype(float)  # Initialize U
+    iMax, jMax = shapeU
+    B2 = Beta*Beta
+    if nMax is None:
+        nMax = (iMax-2)*(jMax-2)
+    U, n = pcg(U, B2, RHS, Precond, RelaxParam, Tol, nMax)
+
+    return U
+
+
+def CurvilinearPSOR(Uo, X, Y, RelaxParam=1.5, Periodic=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the Point Successive Over-Relaxation method with the
+    red-black ordering to obtain the solution of the Laplace's equation
+    on the curvilinear grid X, Y, e.g. a grid of meshing.StructuredMesh().
+    The Laplacian is evaluated in the computational coordinates with the
+    nine-point stencil of backend.curvilinear.LaplaceOperator, whose
+    coefficients are computed once per grid from the cached metrics. The
+    mixed derivative terms of a color are evaluated before its update.
+
+    Call signature:
+        CurvilinearPSOR(Uo, X, Y, RelaxParam, Periodic)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the domain.
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    RelaxParam: float, Default = 1.5
+        Relaxation Parameter of the PSOR method. Specify values between
+        0 and 2.0.
+    Periodic: bool, Default = None
+        True if the lines i = 1 and i = iMax of the grid are the same
+        (O-grid). Detected from X, Y if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable at time level, n+1 within the domain.
+    """
+    from .backend.curvilinear import laplace_operator
+    if len(Uo.shape) == 1:
+        raise DimensionError("1D", "Laplace's", "Point S Over-Relaxation")
+    # Proceed to numerical solution
+    U = Uo.copy()  # Initialize U
+    Op = laplace_operator(X, Y, Periodic)
+    Uc = U[Op.I, 1:-1]
+    for Color in (Op.Red, ~Op.Red):
+        Ux = Op.Extend(U)
+        Unew = Op.XiTerms(Ux) + Op.EtaTerms(U) + Op.Cross(Ux)
+        Unew /= Op.aP
+        Uc[Color] += RelaxParam*(Unew[Color] - Uc[Color])
+        if Op.periodic:
+            U[-1] = U[0]
+
+    return U
+
+
+def CurvilinearLSOR(Uo, X, Y, RelaxParam=1.2, Periodic=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the Line Successive Over-Relaxation method along
+    constant i lines (from the boundary j = 1 to j = jMax) to obtain the
+    solution of the Laplace's equation on the curvilinear grid X, Y. The
+    odd and then the even lines are solved, all lines of one set together
+    by BatchTridiagonalSolver(). The lines i are normal to the walls of
+    the O-grid and blunt body templates, along which the grid points are
+    clustered, so that this method converges much faster than
+    CurvilinearPSOR() on those grids.
+
+    Call signature:
+        CurvilinearLSOR(Uo, X, Y, RelaxParam, Periodic)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the domain.
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    RelaxParam: float, Default = 1.2
+        Relaxation Parameter of the LSOR method. Specify values between
+        0 and 2.0.
+    Periodic: bool, Default = None
+        True if the lines i = 1 and i = iMax of the grid are the same
+        (O-grid). Detected from X, Y if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable at time level, n+1 within the domain.
+    """
+    from .backend.curvilinear import laplace_operator
+    if len(Uo.shape) == 1:
+        raise DimensionError("1D", "Laplace's", "Line S Over-Relaxation")
+    # Proceed to numerical solution
+    U = Uo.copy()  # Initialize U
+    Op = laplace_operator(X, Y, Periodic)
+    nI, nJ = Op.JJ.shape
+    Lines = np.arange(U.shape[0])[Op.I]
+    for start in (0, 1):
+        k = slice(start, nI, 2)
+        Ux = Op.Extend(U)
+        A = np.zeros((len(Lines[k]), nJ+2))
+        B = np.ones((len(Lines[k]), nJ+2))
+        C = np.zeros((len(Lines[k]), nJ+2))
+        D = np.zeros((len(Lines[k]), nJ+2))
+        A[:, 1:-1] = Op.aS[k]
+        B[:, 1:-1] = -Op.aP[k]
+        C[:, 1:-1] = Op.aN[k]
+        D[:, 1:-1] = -(Op.XiTerms(Ux) + Op.Cross(Ux))[k]
+        UU = U[Lines[k]]
+        BatchTridiagonalSolver(A, B, C, D, UU)
+        U[Lines[k], 1:-1] += RelaxParam*(UU[:, 1:-1] - U[Lines[k], 1:-1])
+        if Op.periodic:
+            U[-1] = U[0]
+
+    return U
+
+
+def _CheckOrdering(Ordering, method):
+    """Raise an exception if the sweep ordering is not supported."""
+    if Ordering not in FetchOptions().SweepOrderingOptions():
+        raise SweepOrderingInputError(Ordering, method)
+
+
+def _GetSmoother(Smoother, method):
+    """Return the smoother function for the multigrid methods."""
+    if Smoother not in FetchOptions().MultigridSmootherOptions():
+        raise MultigridSmootherInputError(Smoother, method)
+    return mg.SMOOTHERS[Smoother]
@@ -51,6 +51,17 @@ def fetch(what):
         Provide a text string. Choose one from the below list.
         - "model" for allowed model inputs
         - "limiter-functions" for available TVD limiter function inputs
+        - "sweep-ordering" for available point iterative sweep orderings
+        - "multigrid-smoothers" for available multigrid smoothers
+        - "preconditioners" for available conjugate gradient
+          preconditioners
+        - "backends" for available backends of the sequential kernels
+        - "output-formats" for available solution file formats
+        - "log-formats" for available convergence log formats
+        - "simulation-hooks" for available events of the simulation hooks
+        - "residual-norms" for available norms of the residual
+        - "residual-types" for available residual definitions
+        - "bc-types" for available types of boundary conditions
     """
     f = fopt.FetchOptions()
     if what.lower() == "model":
@@ -59,6 +70,36 @@ def fetch(what):
     elif what.lower() == "limiter-functions":
         print(*f.TVDLimiterFunctionOptions(), sep="\n")
 
+    elif what.lower() == "sweep-ordering":
+        print(*f.SweepOrderingOptions(), sep="\n")
+
+    elif what.lower() == "multigrid-smoothers":
+        print(*f.MultigridSmootherOptions(), sep="\n")
+
+    elif what.lower() == "preconditioners":
+        print(*f.PreconditionerOptions(), sep="\n")
+
+    elif what.lower() == "backends":
+        print(*f.BackendOptions(), sep="\n")
+
+    elif what.lower() == "output-formats":
+        print(*f.OutputFormatOptions(), sep="\n")
+
+    elif what.lower() == "log-formats":
+        print(*f.LogFormatOptions(), sep="\n")
+
+    elif what.lower() == "simulation-hooks":
+        print(*f.SimulationHookOptions(), sep="\n")
+
+    elif what.lower() == "residual-norms":
+        print(*f.ResidualNormOptions(), sep="\n")
+
+    elif what.lower() == "residual-types":
+        print(*f.ResidualTypeOptions(), sep="\n")
+
+    elif what.lower() == "bc-types":
+        print(*f.BCTypeOptions(), sep="\n")
+
 
 if __name__ == "__main__":
     import sys
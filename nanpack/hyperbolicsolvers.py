@@ -77,8 +77,10 @@ or,
 #   NAnPack Learner's Edition.
 #
 #   ***********************************************************************
+import numpy as np
 from .tridiagonal import TridiagonalSolver
-from .backend.exceptions import DimensionError
+from .backend.exceptions import DimensionError, NumericalMethodError
+from .backend.stepper import Stepper, StageBC
 
 
 def ExplicitFirstUpwind(cfg, Uo, Courant):
@@ -308,10 +310,10 @@ def LaxWendroffMultiStep(cfg, Uo, Courant):
     if cfg.Model.upper() == "FO_WAVE":
         U = Uo.copy()  # Initialize U
         Uhalf = Uo.copy()
-        iMax, = shapeU
-        for i in range(1, iMax-1):
-            Uhalf[i] = 0.5*(Uo[i+1]+Uo[i]) - 0.5*Courant*(Uo[i+1]-Uo[i])
-            U[i] = Uo[i] - Courant*(Uhalf[i]-Uhalf[i-1])
+        # Uhalf(i) is the value at i+1/2, the first point keeps Uo(0).
+        Uhalf[1:-1] = (0.5*(Uo[2:]+Uo[1:-1])
+                       - 0.5*Courant*(Uo[2:]-Uo[1:-1]))
+        U[1:-1] = Uo[1:-1] - Courant*(Uhalf[1:-1]-Uhalf[0:-2])
         return U
 
     elif cfg.Model.upper() == "INV_BURGERS":
@@ -319,7 +321,7 @@ def LaxWendroffMultiStep(cfg, Uo, Courant):
  equation in this version.")
 
 
-def MacCormack(cfg, Uo, Courant, diffX=None):
+def MacCormack(cfg, Uo, Courant, diffX=None, BC=None):
     """Return the numerical solution of dependent variable in the model eq.
 
     This routine uses the explicit MacCormack method
@@ -327,7 +329,7 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
     first-order 1D wave equation or inviscid/viscous Burgers equation.
 
     Call signature:
-        MacCormack(cfg, Uo, Courant, diffX)
+        MacCormack(cfg, Uo, Courant, diffX, BC)
 
     Parameters
     ----------
@@ -340,6 +342,11 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
         The dependent variable at time level, n within the domain.
     Courant: float
         Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after the predictor step, e.g.
+        BCPlan1D(("PERIODIC", None), ("PERIODIC", None), dX) or a
+        function BC(U) which assigns the boundary values in place.
+        The boundary values of Uo are used if None.
 
     Returns
     -------
@@ -351,28 +358,86 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
     if len(shapeU) == 2:
         raise DimensionError("2D", "inviscid Bergers", "MacCormack")
 
-    iMax, = shapeU
-    U = Uo.copy()  # Initialize U
-    Utemp = Uo.copy()
-    if cfg.Model.upper() == "FO_WAVE":
-        for i in range(1, iMax-1):
-            Utemp[i] = Uo[i] - Courant*(Uo[i+1]-Uo[i])  # Predictor step
-            U[i] = 0.5*((Uo[i]+Utemp[i])
-                        - Courant*(Utemp[i]-Utemp[i-1]))  # Corrector step
+    if cfg.Model.upper() not in ["FO_WAVE", "INV_BURGERS"]:
+        U = Uo.copy()
+        return U
 
-    elif cfg.Model.upper() == "INV_BURGERS":
-        E = Uo*Uo/2
-        Etemp = Utemp*Utemp/2
-        for i in range(1, iMax-1):
-            Utemp[i] = Uo[i] - Courant*(E[i+1]-E[i])  # Predictor step
-            Etemp[i] = Utemp[i]*Utemp[i]/2
-            U[i] = 0.5*((Uo[i]+Utemp[i])
-                        - Courant*(Etemp[i]-Etemp[i-1]))  # Corrector step
+    # The predictor step is evaluated over the whole domain followed by
+    # the corrector step, see MacCormackSolver.
+    U = MacCormackSolver(cfg, shapeU, Courant, BC).Step(Uo)
 
     return U
 
 
-def FourthOrderRungeKutta(cfg, Uo, Courant):
+class MacCormackSolver(Stepper):
+    """MacCormack method with persistent work arrays.
+
+    This class computes the same solution as the function MacCormack(),
+    but the predictor and corrector steps are evaluated with array
+    slices into work arrays allocated once in the constructor.
+    Step(Uo, U) writes the solution into U, which may be Uo itself or a
+    second buffer for ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    cfg:
+        Class object of RunConfig class or a user-defined class with the
+        attribute Model = "FO_WAVE" or "INV_BURGERS".
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after the predictor step.
+    """
+
+    def __init__(self, cfg, shape, Courant, BC=None):
+        """Class constructor for the MacCormackSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "inviscid Bergers", "MacCormack")
+        super().__init__(shape, BC)
+        self.Model = _CheckModel(cfg, "MacCormack")
+        self.Courant = Courant
+        iMax, = shape
+        self._Utemp = np.empty(iMax)
+        self._E = np.empty(iMax)
+        self._Etemp = np.empty(iMax)
+        self._T = np.empty(iMax-2)
+        self._S = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        Courant = self.Courant
+        Utemp = self._Utemp
+        T = self._T
+        S = self._S
+        Utemp[0] = Uo[0]
+        Utemp[-1] = Uo[-1]
+        if self.Model == "FO_WAVE":
+            F = Uo
+            Ftemp = Utemp
+        elif self.Model == "INV_BURGERS":
+            F = self._E
+            Ftemp = self._Etemp
+            np.multiply(Uo, Uo, out=F)
+            F /= 2
+        # Predictor step
+        np.subtract(F[2:], F[1:-1], out=T)
+        T *= Courant
+        np.subtract(Uo[1:-1], T, out=Utemp[1:-1])
+        self.BC(Utemp)
+        if self.Model == "INV_BURGERS":
+            np.multiply(Utemp[0:-1], Utemp[0:-1], out=Ftemp[0:-1])
+            Ftemp[0:-1] /= 2
+        # Corrector step
+        np.subtract(Ftemp[1:-1], Ftemp[0:-2], out=T)
+        T *= Courant
+        np.add(Uo[1:-1], Utemp[1:-1], out=S)
+        S -= T
+        np.multiply(S, 0.5, out=U[1:-1])
+
+
+def FourthOrderRungeKutta(cfg, Uo, Courant, BC=None):
     """Return the numerical solution of dependent variable in the model eq.
 
     This routine uses the explicit four-stage Runge-Kutta method
@@ -380,7 +445,7 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
     first-order 1D wave equation or inviscid Burgers equation.
 
     Call signature:
-        FourthOrderRungeKutta(cfg, Uo, Courant)
+        FourthOrderRungeKutta(cfg, Uo, Courant, BC)
 
     Parameters
     ----------
@@ -393,6 +458,11 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
         The dependent variable at time level, n within the domain.
     Courant: float
         Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage, e.g.
+        BCPlan1D(("PERIODIC", None), ("PERIODIC", None), dX) or a
+        function BC(U) which assigns the boundary values in place.
+        The boundary values of Uo are used if None.
 
     Returns
     -------
@@ -404,6 +474,7 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
     if len(shapeU) == 2:
         raise DimensionError("2D", "inviscid Bergers", "4th order RK")
 
+    ApplyBC = StageBC(BC)
     U = Uo.copy()  # Initialize U
     if cfg.Model.upper() == "FO_WAVE":
         U1 = Uo.copy()
@@ -411,10 +482,13 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
         U3 = Uo.copy()
         # 1st stage
         U1[1:-1] = Uo[1:-1] - 0.5*Courant*(Uo[2:]-Uo[0:-2])/2.0
+        ApplyBC(U1)
         # 2nd stage
         U2[1:-1] = Uo[1:-1] - 0.5*Courant*(U1[2:]-U1[0:-2])/2.0
+        ApplyBC(U2)
         # 3rd stage
         U3[1:-1] = Uo[1:-1] - Courant*(U2[2:]-U2[0:-2])/2.0
+        ApplyBC(U3)
         # 4th stage
         U[1:-1] = (
             Uo[1:-1]
@@ -432,12 +506,15 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
         U3 = Uo.copy()
         E1 = Uo*Uo/2
         U1[1:-1] = Uo[1:-1] - 0.5*Courant*(E1[2:]-E1[0:-2])/2.0
+        ApplyBC(U1)
         # 2nd stage
         E2 = U1*U1/2
         U2[1:-1] = Uo[1:-1] - 0.5*Courant*(E2[2:]-E2[0:-2])/2.0
+        ApplyBC(U2)
         # 3rd stage
         E3 = U2*U2/2
         U3[1:-1] = Uo[1:-1] - Courant*(E3[2:]-E3[0:-2])/2.0
+        ApplyBC(U3)
         # 4th stage
         E4 = U3*U3/2
         U[1:-1] = (
@@ -448,11 +525,90 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
                + ((1.0/3)*(E3[2:] - E3[0:-2]))
                + ((1.0/6)*(E4[2:] - E4[0:-2])))
             )
+    ApplyBC(U)
 
     return U
 
 
-def ModifiedRungeKutta(cfg, Uo, Courant):
+class FourthOrderRungeKuttaSolver(Stepper):
+    """Four-stage Runge-Kutta method with persistent stage arrays.
+
+    This class computes the same solution as the function
+    FourthOrderRungeKutta(), but the stage arrays U1, U2, U3 (and the
+    fluxes of the inviscid Burgers equation) are allocated once in the
+    constructor and reused at every time step. Step(Uo, U) writes the
+    solution into U, which may be Uo itself or a second buffer for
+    ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    cfg:
+        Class object of RunConfig class or a user-defined class with the
+        attribute Model = "FO_WAVE" or "INV_BURGERS".
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage.
+    """
+
+    # Uo is only read before U is written in the last stage
+    InPlace = True
+
+    def __init__(self, cfg, shape, Courant, BC=None):
+        """Class constructor for the FourthOrderRungeKuttaSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "inviscid Bergers", "4th order RK")
+        super().__init__(shape, BC)
+        self.Model = _CheckModel(cfg, "Fourth-order Runge-Kutta")
+        self.Courant = Courant
+        iMax, = shape
+        self._U = [np.empty(iMax) for k in range(3)]  # U1, U2, U3
+        self._E = [np.empty(iMax) for k in range(4)]  # E1, E2, E3, E4
+        self._T = np.empty(iMax-2)
+        self._S = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        Courant = self.Courant
+        T = self._T
+        S = self._S
+        U1, U2, U3 = self._U
+        for Uk in self._U:
+            Uk[0] = Uo[0]
+            Uk[-1] = Uo[-1]
+        if self.Model == "FO_WAVE":
+            F = [Uo, U1, U2, U3]
+        elif self.Model == "INV_BURGERS":
+            F = self._E
+        # Stages 1 to 3
+        for Uprev, Uk, Fk, coef in [(Uo, U1, F[0], 0.5*Courant),
+                                    (U1, U2, F[1], 0.5*Courant),
+                                    (U2, U3, F[2], Courant)]:
+            if self.Model == "INV_BURGERS":
+                np.multiply(Uprev, Uprev, out=Fk)
+                Fk /= 2
+            np.subtract(Fk[2:], Fk[0:-2], out=T)
+            T *= coef
+            T /= 2.0
+            np.subtract(Uo[1:-1], T, out=Uk[1:-1])
+            self.BC(Uk)
+        if self.Model == "INV_BURGERS":
+            np.multiply(U3, U3, out=F[3])
+            F[3] /= 2
+        # 4th stage
+        for k, w in enumerate([1.0/6, 1.0/3, 1.0/3, 1.0/6]):
+            Tk = S if k == 0 else T
+            np.subtract(F[k][2:], F[k][0:-2], out=Tk)
+            Tk *= w
+            if k > 0:
+                S += T
+        S *= 0.5*Courant
+        np.subtract(Uo[1:-1], S, out=U[1:-1])
+
+
+def ModifiedRungeKutta(cfg, Uo, Courant, BC=None):
     """Return the numerical solution of dependent variable in the model eq.
 
     This routine uses the explicit four-stage Modified Runge-Kutta method
@@ -460,7 +616,7 @@ def ModifiedRungeKutta(cfg, Uo, Courant):
     first-order 1D wave equation or inviscid/viscous Burgers equation.
 
     Call signature:
-        ModifiedRungeKutta(cfg, Uo, Courant, diffX)
+        ModifiedRungeKutta(cfg, Uo, Courant, BC)
 
     Parameters
     ----------
@@ -473,6 +629,11 @@ def ModifiedRungeKutta(cfg, Uo, Courant):
         The dependent variable at time level, n within the domain.
     Courant: float
         Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage, e.g.
+        BCPlan1D(("PERIODIC", None), ("PERIODIC", None), dX) or a
+        function BC(U) which assigns the boundary values in place.
+        The boundary values of Uo are used if None.
 
     Returns
     -------
@@ -484,42 +645,95 @@ def ModifiedRungeKutta(cfg, Uo, Courant):
     if len(shapeU) == 2:
         raise DimensionError("2D", "inviscid Bergers", "Modified RK")
 
+    ApplyBC = StageBC(BC)
     U = Uo.copy()  # Initialize U
     if cfg.Model.upper() == "FO_WAVE":
         # 1st stage
         U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/8.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 2nd stage
         U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/6.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 3rd stage
         U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/4.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 4th stage
         U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/2.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
 
     elif cfg.Model.upper() == "INV_BURGERS":
         # 1st stage
         E = Uo*Uo/2
         U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/8.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 2nd stage
         E = U*U/2
         U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/6.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 3rd stage
         E = U*U/2
         U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/4.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
         # 4th stage
         E = U*U/2
         U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/2.0
-        # -- update BC here (required when Neumann BC is used)
+        ApplyBC(U)
 
     return U
 
 
+class ModifiedRungeKuttaSolver(Stepper):
+    """Four-stage Modified Runge-Kutta method with persistent work arrays.
+
+    This class computes the same solution as the function
+    ModifiedRungeKutta() without allocating new arrays at every time
+    step. Step(Uo, U) writes the solution into U, which may be Uo itself
+    or a second buffer for ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    cfg:
+        Class object of RunConfig class or a user-defined class with the
+        attribute Model = "FO_WAVE" or "INV_BURGERS".
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage.
+    """
+
+    def __init__(self, cfg, shape, Courant, BC=None):
+        """Class constructor for the ModifiedRungeKuttaSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "inviscid Bergers", "Modified RK")
+        super().__init__(shape, BC)
+        self.Model = _CheckModel(cfg, "Modified Runge-Kutta")
+        self.Courant = Courant
+        iMax, = shape
+        self._E = np.empty(iMax)
+        self._T = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        T = self._T
+        E = self._E
+        Uk = Uo
+        for Divisor in [8.0, 6.0, 4.0, 2.0]:
+            if self.Model == "FO_WAVE":
+                F = Uk
+            elif self.Model == "INV_BURGERS":
+                F = E
+                np.multiply(Uk, Uk, out=F)
+                F /= 2
+            np.subtract(F[2:], F[0:-2], out=T)
+            T *= self.Courant
+            T /= Divisor
+            np.subtract(Uo[1:-1], T, out=U[1:-1])
+            self.BC(U)
+            Uk = U
+
+
 def EulersBTCS(cfg, Uo, Courant):
     """Return the numerical solution of dependent variable in the model eq.
 
@@ -784,8 +998,8 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
         The dependent variable calculated at time level, n+1 within the
         entire domain.
     """
-    from .tvdfunctions import CalculateTVD
-    import backend.fetchoptions as fo
+    from .tvdfunctions import CalculateTVDArray
+    from .backend import fetchoptions as fo
     from .backend.exceptions import TVDLimiterFunctionInputError
 
     shapeU = Uo.shape  # Obtain Dimension
@@ -806,16 +1020,19 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
     if LimiterFunc not in limfunc_options:
         raise TVDLimiterFunctionInputError(LimiterFunc)
 
-    for i in range(2, iMax-2):
-        phiPlus, phiMinus = CalculateTVD(i, Uo, E, Eps, Courant,
-                                         Limiter, LimiterFunc)
+    # The flux limiter function at all the interior points 2...iMax-3
+    phiPlus, phiMinus = CalculateTVDArray(Uo, E, Eps, Courant,
+                                          Limiter, LimiterFunc)
+    i = slice(2, iMax-2)
+    iP1 = slice(3, iMax-1)
+    iM1 = slice(1, iMax-3)
 
-        # Equation 6-124 and 6-125 in Hoffmann Vol. 1
-        hPlus = 0.5 * (E[i+1]+E[i]+phiPlus)
-        hMinus = 0.5 * (E[i]+E[i-1]+phiMinus)
+    # Equation 6-124 and 6-125 in Hoffmann Vol. 1
+    hPlus = 0.5 * (E[iP1]+E[i]+phiPlus)
+    hMinus = 0.5 * (E[i]+E[iM1]+phiMinus)
 
-        # Equation 6-123
-        U[i] = Uo[i] - Courant*(hPlus-hMinus)
+    # Equation 6-123
+    U[i] = Uo[i] - Courant*(hPlus-hMinus)
 
     return U
 
@@ -891,3 +1108,11 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
  equation in this version.")
 
     return U'''
+
+
+def _CheckModel(cfg, method):
+    """Return the model name if it is supported by the solver classes."""
+    Model = cfg.Model.upper()
+    if Model not in ["FO_WAVE", "INV_BURGERS"]:
+        raise NumericalMethodError(method, cfg.Model)
+    return Model
@@ -37,6 +37,12 @@
 #   NAnPack Learner's Edition.
 #
 #   ***********************************************************************
+
+import numpy as np
+
+from .backend.exceptions import TVDLimiterInputError
+from .backend.exceptions import TVDLimiterFunctionInputError
+
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 #                   DEFINE DICTIONARIES FOR LIMITERS                 +
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -48,65 +54,45 @@
 def LimiterforHYU(dU1, dU2, Limiter):
     """Return a limiter for the Modified Harten-Yee Upwind TVD.
 
-    A dictionary is used to call the required limiter based on user input
-    for the Modified Harten-Yee Upwind TVD scheme.
+    The registry LIMITERS is used to call the required limiter based on
+    user input for the Modified Harten-Yee Upwind TVD scheme.
 
     The third function parameter "Limiter" is used as a key to the
-    dictionary and the
+    registry and the
     first two function arguments are provided as input arguments to the
     selected limiter method.
     """
-    lim = {
-        "G1": LimiterG1forHYU,
-        "G2": LimiterG2forHYU,
-        "G3": LimiterG3forHYU,
-        "G4": LimiterG4forHYU,
-        "G5": LimiterG5forHYU
-        }
-
-    SelectedFunction = lim.get(Limiter)
+    SelectedFunction = LIMITERS["Modified-Harten-Yee-Upwind"].get(Limiter)
     return SelectedFunction(dU1, dU2)
 
 
 def LimiterforRSU(r, Limiter):
     """Return a function for the Roe-Sweby Upwind TVD scheme.
 
-    A dictionary is used to call the required limiter based on user input
-    for the Modified Harten-Yee Upwind TVD scheme.
+    The registry LIMITERS is used to call the required limiter based on
+    user input for the Modified Harten-Yee Upwind TVD scheme.
 
     The second function parameter "Limiter" is used as a key to the
-    dictionary and the
+    registry and the
     firstfunction argument is provided as an input argument to the
     selected limiter method.
     """
-    lim = {
-        "G1": LimiterG1forRSU,
-        "G2": LimiterG2forRSU,
-        "G3": LimiterG3forRSU
-        }
-
-    SelectedFunction = lim.get(Limiter)
+    SelectedFunction = LIMITERS["Roe-Sweby-Upwind"].get(Limiter)
     return SelectedFunction(r)
 
 
 def LimiterforDYS(dU1, dU2, dU3, Limiter):
     """Return a function for the Davis-Yee Symmetric TVD.
 
-    A dictionary is used to call the required limiter based on user input
-    for the Modified Harten-Yee Upwind TVD scheme.
+    The registry LIMITERS is used to call the required limiter based on
+    user input for the Modified Harten-Yee Upwind TVD scheme.
 
     The fourth function parameter "Limiter" is used as a key to the
-    dictionary and the
+    registry and the
     first three function arguments are provided as input arguments to the
     selected limiter method.
     """
-    lim = {
-        "G1": LimiterG1forDYS,
-        "G2": LimiterG2forDYS,
-        "G3": LimiterG3forDYS
-        }
-
-    SelectedFunction = lim.get(Limiter)
+    SelectedFunction = LIMITERS["Davis-Yee-Symmetric"].get(Limiter)
     return SelectedFunction(dU1, dU2, dU3)
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -267,8 +253,11 @@ def LimiterG2forRSU(r):
     function given by Equation 6-137.
     Calculated using Equation 6-139 in CFD Vol. 1 by Hoffmann.
     """
-    # Equation 6-139
-    G = (r + abs(r))/(1.0 + r)
+    # Equation 6-139, G = 0 for r <= 0 which also avoids 0/0 at r = -1
+    if r > 0:
+        G = (r + abs(r))/(1.0 + r)
+    else:
+        G = 0.0
 
     return G
 
@@ -348,3 +337,259 @@ def LimiterG3forDYS(dU1, dU2, dU3):
         S*max(0.0, min(term21, term22)) - term3
 
     return G
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#               ARRAY LIMITER FUNCTIONS FOR TVD               +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# Element-wise versions of the limiters above. The arguments are
+# ndarrays (or floats) holding the differences at every grid point so
+# that the limiter is evaluated for the whole domain in one call.
+
+
+def LimiterGforHYUArray(alpha1, alpha2, dU1, dU2, Courant, Ep):
+    """Return the Harten-Yee Upwind TVD limiter for arrays.
+
+    Array version of the function LimiterGforHYU(), Equation 6-130 in
+    CFD Vol. 1 by Hoffmann.
+    """
+    import nanpack.utils as utils
+
+    # Calculate si(alpha) in sigma and S
+    siAlpha1 = utils.EntropyCorrectionFunctionArray(alpha1, Ep)
+    siAlpha2 = utils.EntropyCorrectionFunctionArray(alpha2, Ep)
+    # Calculate sigma
+    sigma1 = 0.5*(siAlpha1 - Courant*alpha1*alpha1)
+    sigma2 = 0.5*(siAlpha2 - Courant*alpha2*alpha2)
+    S = np.sign(dU1)
+    # Equation 6-130
+    term1 = sigma1*np.abs(dU1)
+    term2 = S*sigma2*dU2
+    G = S*np.maximum(0.0, np.minimum(term1, term2))
+
+    return G
+
+
+def LimiterG1forHYUArray(dU1, dU2):
+    """Return the array version of LimiterG1forHYU(), Equation 6-132."""
+    S = np.sign(dU2)
+    # Equation 6-132
+    term1 = np.abs(dU2)
+    term2 = S*dU1
+    G = S*np.maximum(0.0, np.minimum(term1, term2))
+
+    return G
+
+
+def LimiterG2forHYUArray(dU1, dU2):
+    """Return the array version of LimiterG2forHYU(), Equation 6-133."""
+    term1 = dU1*dU2
+    term2 = np.abs(term1)
+    denom = dU1 + dU2
+    # Equation 6-133, G = 0 where the denominator vanishes
+    G = np.zeros(np.shape(denom))
+    np.divide(term1 + term2, denom, out=G, where=denom != 0)
+
+    return G
+
+
+def LimiterG3forHYUArray(dU1, dU2):
+    """Return the array version of LimiterG3forHYU(), Equation 6-134."""
+    omeg = 1.e-7  # use between 1.e-7 and 1.e-5
+    term1 = dU2*(dU1*dU1 + omeg)
+    term2 = dU1*(dU2*dU2 + omeg)
+    denom = dU1*dU1 + dU2*dU2 + 2.0*omeg
+
+    # Equation 6-134
+    G = (term1 + term2)/denom
+
+    return G
+
+
+def LimiterG4forHYUArray(dU1, dU2):
+    """Return the array version of LimiterG4forHYU(), Equation 6-135."""
+    S = np.sign(dU2)
+    term1 = np.abs(2.0*dU2)
+    term2 = S*2.0*dU1
+    term3 = S*0.5*(dU1 + dU2)
+
+    # Equation 6-135
+    G = S*np.maximum(0.0, np.minimum(np.minimum(term1, term2), term3))
+
+    return G
+
+
+def LimiterG5forHYUArray(dU1, dU2):
+    """Return the array version of LimiterG5forHYU(), Equation 6-136."""
+    S = np.sign(dU1)
+    term1 = 2.0*np.abs(dU1)
+    term2 = S*dU2
+    term3 = np.abs(dU1)
+    term4 = 2.0*S*dU2
+
+    # Equation 6-136
+    G = S*np.maximum(np.maximum(0.0, np.minimum(term1, term2)),
+                     np.minimum(term3, term4))
+
+    return G
+
+
+def LimiterG1forRSUArray(r):
+    """Return the array version of LimiterG1forRSU(), Equation 6-138."""
+    # Equation 6-138
+    G = np.maximum(0.0, np.minimum(1.0, r))
+
+    return G
+
+
+def LimiterG2forRSUArray(r):
+    """Return the array version of LimiterG2forRSU(), Equation 6-139."""
+    # Equation 6-139, G = 0 for r <= 0 which also avoids 0/0 at r = -1
+    G = np.zeros(np.shape(r))
+    np.divide(r + np.abs(r), 1.0 + r, out=G, where=r > 0)
+
+    return G
+
+
+def LimiterG3forRSUArray(r):
+    """Return the array version of LimiterG3forRSU(), Equation 6-140."""
+    # Equation 6-140
+    G = np.maximum(np.maximum(0.0, np.minimum(2.0*r, 1.0)),
+                   np.minimum(r, 2.0))
+
+    return G
+
+
+def LimiterG1forDYSArray(dU1, dU2, dU3):
+    """Return the array version of LimiterG1forDYS(), Equation 6-142."""
+    S = np.sign(dU1)
+    term1 = np.abs(2.0*dU1)
+    term2 = S*2.0*dU2
+    term3 = S*2.0*dU3
+    term4 = S*0.5*(dU1 + dU3)
+    # Equation 6-142
+    G = S*np.maximum(0.0, np.minimum(np.minimum(term1, term2),
+                                     np.minimum(term3, term4)))
+
+    return G
+
+
+def LimiterG2forDYSArray(dU1, dU2, dU3):
+    """Return the array version of LimiterG2forDYS(), Equation 6-143."""
+    S = np.sign(dU1)
+    term1 = np.abs(dU1)
+    term2 = S*dU2
+    term3 = S*dU3
+    # Equation 6-143
+    G = S*np.maximum(0.0, np.minimum(np.minimum(term1, term2), term3))
+
+    return G
+
+
+def LimiterG3forDYSArray(dU1, dU2, dU3):
+    """Return the array version of LimiterG3forDYS(), Equation 6-144."""
+    S = np.sign(dU1)
+    term1 = np.abs(dU1)  # term 1 in both minmods
+    term12 = S*dU2  # term 2 in 1st minmod
+    term22 = S*dU3  # term 2 in 2nd minmod
+    term3 = S*dU2
+    # Equation 6-144
+    G = S*np.maximum(0.0, np.minimum(term1, term12)) +\
+        S*np.maximum(0.0, np.minimum(term1, term22)) - term3
+
+    return G
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#                       REGISTRY OF TVD LIMITERS                     +
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# The limiters are registered for each TVD limiter function so that a
+# solver resolves the limiter method once, see GetLimiter(), instead of
+# looking it up again at every grid point.
+
+LIMITERS = {
+    "Harten-Yee-Upwind": {
+        "G": LimiterGforHYU
+        },
+    "Modified-Harten-Yee-Upwind": {
+        "G1": LimiterG1forHYU,
+        "G2": LimiterG2forHYU,
+        "G3": LimiterG3forHYU,
+        "G4": LimiterG4forHYU,
+        "G5": LimiterG5forHYU
+        },
+    "Roe-Sweby-Upwind": {
+        "G1": LimiterG1forRSU,
+        "G2": LimiterG2forRSU,
+        "G3": LimiterG3forRSU
+        },
+    "Davis-Yee-Symmetric": {
+        "G1": LimiterG1forDYS,
+        "G2": LimiterG2forDYS,
+        "G3": LimiterG3forDYS
+        }
+    }
+
+ARRAY_LIMITERS = {
+    "Harten-Yee-Upwind": {
+        "G": LimiterGforHYUArray
+        },
+    "Modified-Harten-Yee-Upwind": {
+        "G1": LimiterG1forHYUArray,
+        "G2": LimiterG2forHYUArray,
+        "G3": LimiterG3forHYUArray,
+        "G4": LimiterG4forHYUArray,
+        "G5": LimiterG5forHYUArray
+        },
+    "Roe-Sweby-Upwind": {
+        "G1": LimiterG1forRSUArray,
+        "G2": LimiterG2forRSUArray,
+        "G3": LimiterG3forRSUArray
+        },
+    "Davis-Yee-Symmetric": {
+        "G1": LimiterG1forDYSArray,
+        "G2": LimiterG2forDYSArray,
+        "G3": LimiterG3forDYSArray
+        }
+    }
+
+_SCHEME_NAMES = {
+    "Harten-Yee-Upwind": "Harten-Yee Upwind TVD",
+    "Modified-Harten-Yee-Upwind": "Modified Harten-Yee Upwind TVD",
+    "Roe-Sweby-Upwind": "Roe-Sweby Upwind TVD",
+    "Davis-Yee-Symmetric": "Davis-Yee Symmetric TVD"
+    }
+
+
+def GetLimiter(LimFunction, Limiter, Array=True):
+    """Return the limiter method registered for a TVD limiter function.
+
+    Call signature:
+        GetLimiter(LimFunction, Limiter, Array=True)
+
+    Parameters
+    ----------
+    LimFunction: str
+        The TVD limiter function. Options available are
+        "Harten-Yee-Upwind", "Modified-Harten-Yee-Upwind",
+        "Roe-Sweby-Upwind", "Davis-Yee-Symmetric".
+    Limiter: str
+        The limiter for the TVD function, "G" for Harten-Yee Upwind,
+        "G1"..."G5" for Modified Harten-Yee Upwind and "G1"..."G3" for
+        Roe-Sweby Upwind and Davis-Yee Symmetric.
+    Array: bool, Default=True
+        If True, return the array version of the limiter which accepts
+        ndarrays and returns ndarrays, otherwise the scalar version.
+
+    Returns
+    -------
+    SelectedFunction: function
+        The limiter method.
+    """
+    registry = ARRAY_LIMITERS if Array else LIMITERS
+    if LimFunction not in registry:
+        raise TVDLimiterFunctionInputError(LimFunction)
+    if Limiter not in registry[LimFunction]:
+        raise TVDLimiterInputError(Limiter, _SCHEME_NAMES[LimFunction])
+
+    return registry[LimFunction][Limiter]
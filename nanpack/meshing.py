@@ -148,17 +148,12 @@ def RectangularMesh(dX, iMax, dY=None, jMax=None):
     print("Uniform rectangular grid generation in cartesian\
  coordinate system: Completed.")
     if isinstance(dY, float) and isinstance(jMax, int):
-        X = np.zeros((iMax, jMax), dtype="float")
-        Y = np.zeros((iMax, jMax), dtype="float")
-        for i in range(0, iMax):
-            for j in range(0, jMax):
-                X[i][j] = i*dX
-                Y[i][j] = j*dY
+        X, Y = np.meshgrid(np.arange(0, iMax, dtype="float")*dX,
+                           np.arange(0, jMax, dtype="float")*dY,
+                           indexing="ij")
         return X, Y
     else:
-        X = np.zeros(iMax, dtype="float")
-        for i in range(0, iMax):
-            X[i] = i*dX
+        X = np.arange(0, iMax, dtype="float")*dX
         return X
 
 
@@ -177,9 +172,7 @@ def StructuredMesh1D(ClustLoc, ClustOpt=True, Alpha=None, Beta=None,
     else:
         dX = CfgClsObj.dX
         iM = CfgClsObj.iM
-    Xi = np.zeros((iM), dtype="float")
-    for i in range(0, iM):
-        Xi[i] = i*dXi
+    Xi = np.arange(0, iM)*dXi
     if ClustOpt is False:
         X = RectangularMesh(dX, iM)
     else:
@@ -195,14 +188,23 @@ def _getMesh1D(clust_loc, Xi, dX, iM, alpha, beta):
 
 
 def StructuredMesh(GeomTemplate, ClustOpt=True, CfgClsObj=None,
-                   **mesh_kwargs):
+                   CacheDir=None, Elliptic=False, **mesh_kwargs):
     """Return a rectangular uniform/non-uniform rectangular mesh.
 
     Documentation incomplete. This routine is under construction.
+
+    If CacheDir is given (or CfgClsObj.GridCacheDir, set by the key
+    GRID_CACHE_DIR in the MESH section), the mesh and its metrics are
+    stored in a file of the directory CacheDir named after the hash of
+    GeomTemplate, ClustOpt, the grid size and all mesh kwargs. Later
+    calls with the same inputs read the mesh from this file and
+    CalcMeshMetrics() returns the stored metrics.
+
+    If Elliptic is True, the interior points of the mesh are calculated
+    with EllipticMesh() from the boundary points of the template.
     """
     print("Calculating X and Y locations of all grid points within\
  the mesh.")
-    rect_grid_types = ["flat-plate", "duct", "cavity"]
     if CfgClsObj is None:
         dX = mesh_kwargs.get("dX", None)
         dY = mesh_kwargs.get("dY", None)
@@ -213,11 +215,55 @@ def StructuredMesh(GeomTemplate, ClustOpt=True, CfgClsObj=None,
         dY = CfgClsObj.dY
         iM = CfgClsObj.iM
         jM = CfgClsObj.jM
+        if CacheDir is None:
+            CacheDir = getattr(CfgClsObj, "GridCacheDir", None)
+    if CacheDir is not None:
+        return _CachedMesh(CacheDir, GeomTemplate, ClustOpt, CfgClsObj,
+                           dX, dY, iM, jM, Elliptic, **mesh_kwargs)
+    return _GenerateMesh(GeomTemplate, ClustOpt, CfgClsObj, dX, dY, iM, jM,
+                         Elliptic, **mesh_kwargs)
+
+
+def _GenerateMesh(GeomTemplate, ClustOpt, CfgClsObj, dX, dY, iM, jM,
+                  Elliptic=False, **mesh_kwargs):
+    """Return the mesh generated with the geometry template."""
+    rect_grid_types = ["flat-plate", "duct", "cavity"]
     if GeomTemplate.lower() in rect_grid_types and ClustOpt is False:
         X, Y = RectangularMesh(dX, iM, dY, jM)
     else:
         X, Y = getMesh(iM, jM, GeomTemplate, ClustOpt, CfgClsObj,
                        **mesh_kwargs)
+    if Elliptic:
+        X, Y = EllipticMesh(X, Y)
+    return X, Y
+
+
+def _CachedMesh(CacheDir, GeomTemplate, ClustOpt, CfgClsObj, dX, dY, iM,
+                jM, Elliptic=False, **mesh_kwargs):
+    """Return the mesh from the cache directory or generate and store it."""
+    import os
+    from .backend import meshcache
+    from .backend.meshmetrics import cached_metrics, store_metrics
+
+    params = dict(mesh_kwargs, dX=dX, dY=dY, iM=iM, jM=jM)
+    if CfgClsObj is not None:
+        params["Length"] = getattr(CfgClsObj, "Length", None)
+        params["Height"] = getattr(CfgClsObj, "Height", None)
+    if Elliptic:
+        params["Elliptic"] = True
+    Key = meshcache.mesh_key(GeomTemplate, ClustOpt, **params)
+    fName = meshcache.cache_file_name(CacheDir, GeomTemplate, Key)
+    if os.path.isfile(fName):
+        X, Y, Metrics = meshcache.load_mesh(fName, Key)
+        if Metrics is not None:
+            store_metrics(X, Y, Metrics)
+        print(f'Reading the mesh from the cache file "{fName}".')
+        return X, Y
+    X, Y = _GenerateMesh(GeomTemplate, ClustOpt, CfgClsObj, dX, dY, iM, jM,
+                         Elliptic, **mesh_kwargs)
+    os.makedirs(CacheDir, exist_ok=True)
+    meshcache.save_mesh(fName, X, Y, cached_metrics(X, Y), Key)
+    print(f'Storing the mesh in the cache file "{fName}".')
     return X, Y
 
 
@@ -229,22 +275,142 @@ def getMesh(iM, jM, geo_temp, clust_option, CfgObject, **mesh_kw):
     return X, Y
 
 
+def EllipticMesh(X, Y, Periodic=None, Control=True, Omega=1.5, Tol=1e-5,
+                 nMax=1000):
+    """Return the elliptic grid with the boundary points of the grid X, Y.
+
+    The interior points are the solution of the Winslow equations
+        alpha(x_xixi + phi x_xi) - 2 beta x_xieta
+        + gamma(x_etaeta + psi x_eta) = 0,
+    and the same for y, in which alpha, beta and gamma are the
+    coefficients of the inverted Laplace equations (Thompson, Thames and
+    Mastin). The equations are solved by the line relaxation along the
+    lines i, in which the lines of one color are solved at once with
+    BatchTridiagonalSolver(), on a sequence of coarser grids first. The
+    interior points of X, Y are the initial guess, usually the algebraic
+    grid of a template of StructuredMesh().
+
+    Call signature:
+        EllipticMesh(X, Y, Periodic=None, Control=True, Omega=1.5,
+                     Tol=1e-5, nMax=1000)
+
+    Parameters
+    ----------
+    X: ndarray[float], =2d
+        X coordinates of the grid points, shape (iM, jM).
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points, shape (iM, jM).
+    Periodic: bool, Default = None
+        True for the O-grids, in which the lines i = 1 and i = iM are
+        the same. Detected from X, Y if None.
+    Control: bool, Default = True
+        Use the control functions phi, psi evaluated from the initial grid
+        so that the clustering of the grid points along the lines i
+        (normal to the wall) is kept. The Laplace equations (phi = psi = 0)
+        are solved if False.
+    Omega: float, Default = 1.5
+        Relaxation factor of the line relaxation.
+    Tol: float, Default = 1e-5
+        Largest change of the grid points in a sweep, relative to the
+        size of the grid, at convergence.
+    nMax: int, Default = 1000
+        Maximum number of sweeps.
+
+    Returns
+    -------
+    X: ndarray[float], =2d
+        X coordinates of the elliptic grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the elliptic grid points.
+    """
+    from .backend.mesh_elliptic import elliptic_mesh
+    X, Y, n = elliptic_mesh(X, Y, Periodic, Control, Omega, Tol, nMax)
+    print(f"Elliptic grid generation: Completed in {n} sweeps.")
+    return X, Y
+
+
 def CalcMeshMetrics(X, Y):
-    """Calculate metrics and Jacobian of the transformation."""
-    from .backend.meshmetrics import metrics_2d
-    XiX, XiY, EtaX, EtaY, JJ = metrics_2d(X, Y)
+    """Calculate metrics and Jacobian of the transformation.
+
+    The metrics are computed once per grid and reused by the later calls
+    with the same X, Y. The returned arrays are read-only.
+    """
+    from .backend.meshmetrics import cached_metrics
+    XiX, XiY, EtaX, EtaY, JJ = cached_metrics(X, Y).Metrics()
     print("Grid metrics and Jacobian evaluation: Completed.")
     return XiX, XiY, EtaX, EtaY, JJ
 
 
 def CalcMeshMetrics1D(X):
-    """Calculate metrics and Jacobian of the transformation."""
+    """Calculate metrics and Jacobian of the transformation.
+
+    The metrics are computed once per grid and reused by the later calls
+    with the same X. The returned arrays are read-only.
+    """
     from .backend import meshmetrics
-    XiX, JJ = meshmetrics.metrics_1d(X)
+    XiX, JJ = meshmetrics.cached_metrics(X)
     print("Grid metrics and Jacobian evaluation: Completed.")
     return XiX, JJ
 
 
+def WriteMeshToFile(X, Y, FileName, Metrics=True):
+    """Write the grid X, Y and its metrics to a binary mesh file.
+
+    The file can be read with ReadMeshFromFile() or with the config keys
+    GRID_FROM_FILE? = YES and GRID_FNAME.
+
+    Call signature:
+        WriteMeshToFile(X, Y, FileName, Metrics=True)
+
+    Parameters
+    ----------
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    FileName: str
+        Path of the mesh file.
+    Metrics: bool, Default = True
+        Store the metrics and Jacobian of the transformation as well.
+    """
+    from .backend.meshcache import save_mesh
+    from .backend.meshmetrics import cached_metrics
+
+    save_mesh(FileName, X, Y, cached_metrics(X, Y) if Metrics else None)
+    print(f'Writing the mesh to the file "{FileName}": Completed.')
+
+
+def ReadMeshFromFile(FileName):
+    """Return the grid X, Y stored by WriteMeshToFile().
+
+    The metrics stored in the file are returned by the later calls of
+    CalcMeshMetrics(X, Y) without computing them again.
+
+    Call signature:
+        ReadMeshFromFile(FileName)
+
+    Parameters
+    ----------
+    FileName: str
+        Path of the mesh file.
+
+    Returns
+    -------
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    """
+    from .backend.meshcache import load_mesh
+    from .backend.meshmetrics import store_metrics
+
+    X, Y, Metrics = load_mesh(FileName)
+    if Metrics is not None:
+        store_metrics(X, Y, Metrics)
+    print(f'Reading the mesh from the file "{FileName}": Completed.')
+    return X, Y
+
+
 def PlotMeshMetrics(XiX, XiY, EtaX, EtaY, x=None, y=None):
     """Plot metrics data."""
     from .backend.plotmetrics import plot_metrics_2d
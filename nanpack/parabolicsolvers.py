@@ -54,8 +54,11 @@ conduction equation, which is expressed in 1D as:
 #
 #   ***********************************************************************
 
+import numpy as np
 from .backend.exceptions import DimensionError
-from .tridiagonal import TridiagonalSolver
+from .backend.stepper import Stepper
+from .tridiagonal import TridiagonalSolver, BatchTridiagonalSolver
+from .tridiagonal import CyclicBatchTridiagonalSolver
 
 
 def FTCS(Uo, diffX, diffY=None):
@@ -100,6 +103,68 @@ def FTCS(Uo, diffX, diffY=None):
     return U
 
 
+class FTCSSolver(Stepper):
+    """Forward Time/Central Space method with persistent work arrays.
+
+    This class computes the same solution as the function FTCS(), but
+    without allocating new arrays at every time step. Step(Uo, U) writes
+    the solution into U, which may be Uo itself or a second buffer for
+    ping-pong stepping, see Run().
+
+    Example:
+        ftcs = FTCSSolver(U.shape, diffX, diffY)
+        for n in range(nMax):
+            Uold, U = U, Uold
+            ftcs.Step(Uold, U)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape of the dependent variable, (iMax,) or (iMax, jMax).
+    diffX : float
+        Diffusion number for x-component of the parabolic/diffusion
+        equation.
+    diffY : float, Default=None for 1-D applications
+        Diffusion number for y-component of the parabolic/diffusion
+        equation.
+    """
+
+    def __init__(self, shape, diffX, diffY=None):
+        """Class constructor for the FTCSSolver class."""
+        super().__init__(shape)
+        self.diffX = diffX
+        self.diffY = diffY
+        interior = tuple(n-2 for n in self.shape)
+        self._T = np.empty(interior)  # temporaries for the RHS
+        self._L = np.empty(interior)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        T = self._T
+        L = self._L
+        if len(self.shape) == 1:
+            # Uo[2:] - 2.0*Uo[1:-1] + Uo[0:-2]
+            np.multiply(Uo[1:-1], 2.0, out=T)
+            np.subtract(Uo[2:], T, out=L)
+            L += Uo[0:-2]
+            L *= self.diffX
+            np.add(Uo[1:-1], L, out=U[1:-1])
+
+        elif len(self.shape) == 2:
+            Uc = Uo[1:-1, 1:-1]
+            # diffX*(Uo[2:, 1:-1] - 2.0*Uc + Uo[0:-2, 1:-1])
+            np.multiply(Uc, 2.0, out=T)
+            np.subtract(Uo[2:, 1:-1], T, out=L)
+            L += Uo[0:-2, 1:-1]
+            L *= self.diffX
+            np.add(Uc, L, out=L)
+            # diffY*(Uo[1:-1, 2:] - 2.0*Uc + Uo[1:-1, 0:-2])
+            np.subtract(Uo[1:-1, 2:], T, out=T)
+            T += Uo[1:-1, 0:-2]
+            T *= self.diffY
+            np.add(L, T, out=U[1:-1, 1:-1])
+
+
 def DuFortFrankel(Uo, Uo2, diffX, diffY=None):
     """Return the numerical solution of dependent variable in the model eq.
 
@@ -267,55 +332,365 @@ def ADI(Uo, diffX, diffY):
         print("Alternating Direction Implicit method is for 2D applicat\
  ions only.")
         raise DimensionError("1D", "diffusion", "ADI")
-    iMax, jMax = shapeU
-    U = Uo.copy()  # Initialize U
-    Uhalf = Uo.copy()  # Uhalf is U at time level (n + 1/2)
-
-    d1 = 0.5*diffX
-    d2 = 0.5*diffY
-
-    # *****************************************************************
-    # This block of codes solves for U
-    # at time level n + 1/2 (i.e. = Uhalf) along constant j line
-    # Eq. 5.24 using Tridiagonal system Appendix B in
-    # Hoffmann CFD Vol.1
-    # *****************************************************************
-    A = [-d1 for i in range(iMax)]
-    B = [(1.0 + 2.0*d1) for i in range(iMax)]
-    C = [-d1 for i in range(iMax)]
-    D = [0 for i in range(iMax)]
-    UU = [0 for i in range(iMax)]
-    for j in range(1, jMax-1):
-        UU[0] = Uo[0][j]
-        UU[-1] = Uo[iMax-1][j]
-        for i in range(1, iMax-1):
-            D[i] = d2*Uo[i][j+1] + (1.0 - 2.0*d2)*Uo[i][j] +\
-                   d2*Uo[i][j-1]
-        UU = TridiagonalSolver(iMax, A, B, C, D, UU)
-        for i in range(1, iMax-1):
-            # Alternating Direction Implicit method in x-direction
-            Uhalf[i][j] = UU[i]
-
-    # *****************************************************************
-    # This block of codes solves for U at time level n + 1
-    # along constant i line
-    # Eq. 5.25 using Tridiagonal system Appendix B in
-    # Hoffmann CFD Vol.1
-    # *****************************************************************
-    A = [-d2 for j in range(jMax)]
-    B = [(1.0 + 2.0*d2) for j in range(jMax)]
-    C = [-d2 for j in range(jMax)]
-    D = [0 for j in range(jMax)]
-    UU = [0 for j in range(jMax)]
-    for i in range(1, iMax-1):
-        UU[0] = Uo[i][0]
-        UU[-1] = Uo[i][jMax-1]
-        for j in range(1, jMax-1):
-            D[j] = d1*Uhalf[i+1][j] + (1.0 - 2.0*d1)*Uhalf[i][j] +\
-                   d1*Uhalf[i-1][j]
-        UU = TridiagonalSolver(jMax, A, B, C, D, UU)
-        for j in range(1, jMax-1):
-            # Alternating Direction Implicit method in y-direction
-            U[i][j] = UU[j]
+    U = ADISolver(shapeU, diffX, diffY).Step(Uo)
+
+    return U
+
+
+class ADISolver(Stepper):
+    """Alternating Direction Implicit method with persistent work arrays.
+
+    This class computes the same solution as the function ADI(), but all
+    coefficient and work arrays are allocated once when the object is
+    created and then reused at every time step. The right-hand side of
+    each half step is built with array slices and all grid lines of the
+    half step are solved together by BatchTridiagonalSolver(). Use it in
+    place of ADI() for transient runs with many time steps. Step(Uo, U)
+    writes the solution into U, which may be Uo itself or a second
+    buffer for ping-pong stepping, see Run().
+
+    Example:
+        adi = ADISolver(U.shape, diffX, diffY)
+        for n in range(nMax):
+            Uold, U = U, Uold
+            adi.Step(Uold, U)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax, jMax) of the dependent variable.
+    diffX: float
+        Diffusion number for x-component of the parabolic/diffusion
+        equation.
+    diffY: float
+        Diffusion number for y-component of the parabolic/diffusion
+        equation.
+    """
+
+    def __init__(self, shape, diffX, diffY):
+        """Class constructor for the ADISolver class.
+
+        Parameters
+        ----------
+        shape: tuple
+            Shape (iMax, jMax) of the dependent variable.
+        diffX: float
+            Diffusion number for x-component of the parabolic/diffusion
+            equation.
+        diffY: float
+            Diffusion number for y-component of the parabolic/diffusion
+            equation.
+        """
+        if len(shape) == 1:
+            print("Alternating Direction Implicit method is for 2D applicat\
+ ions only.")
+            raise DimensionError("1D", "diffusion", "ADI")
+        super().__init__(shape)
+        iMax, jMax = shape
+        self.diffX = diffX
+        self.diffY = diffY
+        d1 = 0.5*diffX
+        d2 = 0.5*diffY
+        self._d1 = d1
+        self._d2 = d2
+
+        # Coefficients of Eq. 5.24 (along constant j lines) and
+        # Eq. 5.25 (along constant i lines) in Hoffmann CFD Vol.1
+        self._Ax = np.full(iMax, -d1)
+        self._Bx = np.full(iMax, 1.0 + 2.0*d1)
+        self._Cx = np.full(iMax, -d1)
+        self._Ay = np.full(jMax, -d2)
+        self._By = np.full(jMax, 1.0 + 2.0*d2)
+        self._Cy = np.full(jMax, -d2)
+
+        # Work arrays of the sweep along constant j lines. They are stored
+        # as (iMax, jMax-2) so that the lines are the columns of the
+        # arrays and are passed to the tridiagonal solver transposed.
+        self._Dx = np.zeros((iMax, jMax-2))
+        self._UUx = np.zeros((iMax, jMax-2))
+        self._Hx = np.empty((iMax, jMax-2))
+        self._Gx = np.empty((iMax, jMax-2))
+        # Work arrays of the sweep along constant i lines
+        self._Dy = np.zeros((iMax-2, jMax))
+        self._UUy = np.zeros((iMax-2, jMax))
+        self._Hy = np.empty((jMax, iMax-2))
+        self._Gy = np.empty((jMax, iMax-2))
+        self._Tx = np.empty((iMax-2, jMax-2))  # temporary for the RHS
+        self._Uhalf = np.zeros(shape)  # U at time level (n + 1/2)
+
+    # Uo is copied into the work arrays before U is written
+    InPlace = True
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        d1 = self._d1
+        d2 = self._d2
+        Uhalf = self._Uhalf
+        T = self._Tx
+
+        # *****************************************************************
+        # Solve for U at time level n + 1/2 (i.e. = Uhalf) along constant
+        # j line, Eq. 5.24 using Tridiagonal system Appendix B in
+        # Hoffmann CFD Vol.1
+        # *****************************************************************
+        D = self._Dx
+        np.multiply(Uo[1:-1, 2:], d2, out=D[1:-1])
+        np.multiply(Uo[1:-1, 1:-1], 1.0 - 2.0*d2, out=T)
+        D[1:-1] += T
+        np.multiply(Uo[1:-1, 0:-2], d2, out=T)
+        D[1:-1] += T
+        UU = self._UUx
+        UU[...] = Uo[:, 1:-1]
+        BatchTridiagonalSolver(self._Ax, self._Bx, self._Cx, D.T, UU.T,
+                               self._Hx, self._Gx)
+        # Alternating Direction Implicit method in x-direction
+        Uhalf[0] = Uo[0]
+        Uhalf[-1] = Uo[-1]
+        Uhalf[1:-1, 1:-1] = UU[1:-1]
+
+        # *****************************************************************
+        # Solve for U at time level n + 1 along constant i line
+        # Eq. 5.25 using Tridiagonal system Appendix B in
+        # Hoffmann CFD Vol.1
+        # *****************************************************************
+        D = self._Dy[:, 1:-1]
+        np.multiply(Uhalf[2:, 1:-1], d1, out=D)
+        np.multiply(Uhalf[1:-1, 1:-1], 1.0 - 2.0*d1, out=T)
+        D += T
+        np.multiply(Uhalf[0:-2, 1:-1], d1, out=T)
+        D += T
+        UU = self._UUy
+        UU[...] = Uo[1:-1, :]
+        BatchTridiagonalSolver(self._Ay, self._By, self._Cy, self._Dy, UU,
+                               self._Hy, self._Gy)
+        # Alternating Direction Implicit method in y-direction
+        U[1:-1, 1:-1] = UU[:, 1:-1]
+
+
+def CurvilinearFTCS(Uo, X, Y, DiffT, Periodic=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the explicit Forward Time/Central Space method
+    to obtain the solution of the 2D diffusion equation on the
+    curvilinear grid X, Y, e.g. a grid of meshing.StructuredMesh(). The
+    Laplacian is evaluated in the computational coordinates with the
+    metrics of the grid, see CurvilinearFTCSSolver.
+
+    Call signature:
+        CurvilinearFTCS(Uo, X, Y, DiffT, Periodic)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the entire domain.
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    DiffT: float
+        Product of the diffusivity and the time step size, e.g.
+        kinematic viscosity * dT.
+    Periodic: bool, Default = None
+        True if the lines i = 1 and i = iMax of the grid are the same
+        (O-grid). Detected from X, Y if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable at time level, n+1 within the entire domain.
+    """
+    U = CurvilinearFTCSSolver(X, Y, DiffT, Periodic).Step(Uo)
+
+    return U
+
+
+class CurvilinearFTCSSolver(Stepper):
+    """Forward Time/Central Space method on a curvilinear grid.
+
+    The diffusion equation is solved on the grid X, Y in the computational
+    coordinates, in which the grid points are uniformly spaced. The
+    coefficients of the transformed Laplacian are computed once per grid
+    from the cached metrics of meshing.CalcMeshMetrics(), see
+    backend.curvilinear.LaplaceOperator. On a periodic grid (O-grid) the
+    points of the line i = 1 are solved with the line i = iMax-1 as their
+    neighbour and copied to the line i = iMax.
+
+    The method is stable if DiffT <= MaxDiffT on grids that are close to
+    orthogonal.
+
+    Example:
+        ftcs = CurvilinearFTCSSolver(X, Y, nu*dT)
+        for n in range(nMax):
+            Uold, U = U, Uold
+            ftcs.Step(Uold, U)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax, jMax) of the grid and the dependent variable.
+    DiffT: float
+        Product of the diffusivity and the time step size.
+    MaxDiffT: float
+        Largest stable value of DiffT.
+    """
+
+    def __init__(self, X, Y, DiffT, Periodic=None, BC=None):
+        """Class constructor for the CurvilinearFTCSSolver class."""
+        from .backend.curvilinear import laplace_operator
+        super().__init__(X.shape, BC)
+        self.DiffT = DiffT
+        self._Op = laplace_operator(X, Y, Periodic)
+        self.MaxDiffT = self._Op.MaxDiffT()
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        Op = self._Op
+        L = Op.Laplacian(Uo)
+        L *= self.DiffT
+        np.add(Uo[Op.I, 1:-1], L, out=U[Op.I, 1:-1])
+        if Op.periodic:
+            U[-1] = U[0]
+
+
+def CurvilinearADI(Uo, X, Y, DiffT, Periodic=None):
+    """Return the numerical solution of dependent variable in the model eq.
+
+    This routine uses the Alternating Direction Implicit method
+    to obtain the solution of the 2D diffusion equation on the
+    curvilinear grid X, Y, see CurvilinearADISolver.
+
+    Call signature:
+        CurvilinearADI(Uo, X, Y, DiffT, Periodic)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =2d
+        The dependent variable at time level, n within the entire domain.
+    X: ndarray[float], =2d
+        X coordinates of the grid points.
+    Y: ndarray[float], =2d
+        Y coordinates of the grid points.
+    DiffT: float
+        Product of the diffusivity and the time step size, e.g.
+        kinematic viscosity * dT.
+    Periodic: bool, Default = None
+        True if the lines i = 1 and i = iMax of the grid are the same
+        (O-grid). Detected from X, Y if None.
+
+    Returns
+    -------
+    U: ndarray[float], =2d
+        The dependent variable at time level, n+1 within the entire domain.
+    """
+    U = CurvilinearADISolver(X, Y, DiffT, Periodic).Step(Uo)
 
     return U
+
+
+class CurvilinearADISolver(Stepper):
+    """Alternating Direction Implicit method on a curvilinear grid.
+
+    The transformed Laplacian of backend.curvilinear.LaplaceOperator is
+    split into the terms along Xi, the terms along Eta and the mixed
+    derivatives. The first half step is implicit along the lines j (the
+    Xi terms) and the second half step along the lines i (the Eta
+    terms), as in ADISolver; the mixed derivatives are explicit and use
+    the latest solution. All lines of a half step are solved together,
+    with CyclicBatchTridiagonalSolver() along the lines j of a periodic
+    grid (O-grid). The coefficients are computed once in the constructor.
+
+    Example:
+        adi = CurvilinearADISolver(X, Y, nu*dT)
+        for n in range(nMax):
+            Uold, U = U, Uold
+            adi.Step(Uold, U)
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax, jMax) of the grid and the dependent variable.
+    DiffT: float
+        Product of the diffusivity and the time step size.
+    """
+
+    # Uo is copied into the work arrays before U is written
+    InPlace = True
+
+    def __init__(self, X, Y, DiffT, Periodic=None, BC=None):
+        """Class constructor for the CurvilinearADISolver class."""
+        from .backend.curvilinear import laplace_operator
+        super().__init__(X.shape, BC)
+        iMax, jMax = self.shape
+        self.DiffT = DiffT
+        Op = laplace_operator(X, Y, Periodic)
+        self._Op = Op
+        dJ = 0.5*DiffT*Op.JJ
+        nI = Op.JJ.shape[0]
+
+        # Coefficients along the lines j, stored as (jMax-2, nI) so that
+        # the lines are the rows of the arrays.
+        Ax = (-dJ*Op.aW).T
+        Bx = (1.0 + dJ*(Op.aE + Op.aW)).T
+        Cx = (-dJ*Op.aE).T
+        if Op.periodic:
+            self._Ax, self._Bx, self._Cx = Ax, Bx, Cx
+            self._UUx = np.empty((jMax-2, nI))
+        else:
+            self._Ax = np.zeros((jMax-2, iMax))
+            self._Bx = np.ones((jMax-2, iMax))
+            self._Cx = np.zeros((jMax-2, iMax))
+            self._Ax[:, 1:-1] = Ax
+            self._Bx[:, 1:-1] = Bx
+            self._Cx[:, 1:-1] = Cx
+            self._UUx = np.empty((jMax-2, iMax))
+            self._Dx = np.zeros((jMax-2, iMax))
+        # Coefficients along the lines i
+        self._Ay = np.zeros((nI, jMax))
+        self._By = np.ones((nI, jMax))
+        self._Cy = np.zeros((nI, jMax))
+        self._Ay[:, 1:-1] = -dJ*Op.aS
+        self._By[:, 1:-1] = 1.0 + dJ*(Op.aN + Op.aS)
+        self._Cy[:, 1:-1] = -dJ*Op.aN
+        self._Dy = np.zeros((nI, jMax))
+        self._dJ = dJ
+        self._Uhalf = np.zeros(self.shape)  # U at time level (n + 1/2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        Op = self._Op
+        dJ = self._dJ
+        Uhalf = self._Uhalf
+        Uhalf[...] = Uo
+
+        # Solve for U at time level n + 1/2 along the lines j
+        Uc = Uo[Op.I, 1:-1]
+        R = Op.EtaTerms(Uo) + Op.Cross(Op.Extend(Uo))
+        R -= (Op.aN + Op.aS)*Uc
+        R *= dJ
+        R += Uc
+        UU = self._UUx
+        if Op.periodic:
+            CyclicBatchTridiagonalSolver(self._Ax, self._Bx, self._Cx, R.T,
+                                         UU)
+            Uhalf[:-1, 1:-1] = UU.T
+            Uhalf[-1] = Uhalf[0]
+        else:
+            self._Dx[:, 1:-1] = R.T
+            UU[...] = Uo[:, 1:-1].T
+            BatchTridiagonalSolver(self._Ax, self._Bx, self._Cx, self._Dx,
+                                   UU)
+            Uhalf[1:-1, 1:-1] = UU[:, 1:-1].T
+
+        # Solve for U at time level n + 1 along the lines i
+        Hx = Op.Extend(Uhalf)
+        Hc = Uhalf[Op.I, 1:-1]
+        R = Op.XiTerms(Hx) + Op.Cross(Hx)
+        R -= (Op.aE + Op.aW)*Hc
+        R *= dJ
+        R += Hc
+        self._Dy[:, 1:-1] = R
+        UU = Uo[Op.I].copy()
+        BatchTridiagonalSolver(self._Ay, self._By, self._Cy, self._Dy, UU)
+        U[Op.I, 1:-1] = UU[:, 1:-1]
+        if Op.periodic:
+            U[-1] = U[0]
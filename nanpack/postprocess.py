@@ -38,6 +38,10 @@
 #
 #   ***********************************************************************
 
+from .backend.asyncwriter import AsyncWriter  # noqa: F401
+from .backend.convergencelog import ConvergenceLog  # noqa: F401
+from .backend.residual import ResidualMonitor  # noqa: F401
+
 
 def DimensionalizeSolution(Ustar, RefLength, Diff):
     """Return the dimensional values of the velocity.
@@ -181,8 +185,7 @@ def LInfNormError(U, Uold):
         return Error
 
     elif len(shapeU) == 1:  # Dimension = 1D
-        Abs_err = abs(Uold[1:] - U[1:]).sum(axis=1)
-        Error = max(Abs_err)
+        Error = abs(Uold[1:] - U[1:]).max()
         return Error
 
 
@@ -214,6 +217,48 @@ def AbsoluteError(U, Uold):
         return Error
 
 
+def ResidualNorm(U, Uold=None, Norm="L1", Residual="Difference",
+                 Beta=1.0):
+    """Return a norm of the residual at the interior points.
+
+    With Norm="L1" and Residual="Difference", the value is equal to
+    AbsoluteError(). The "Laplace" residual is evaluated from U alone,
+    i.e. the solution at the previous iteration is not required. To
+    evaluate the residual every few iterations without allocating
+    arrays, use ResidualMonitor.
+
+    Call Signature:
+        ResidualNorm(U, Uold=None, Norm="L1", Residual="Difference",
+                     Beta=1.0)
+
+    Parameters
+    ----------
+    U: ndarray[float], =1d, 2d
+        The dependent variable at the current iteration level.
+    Uold: ndarray[float], =1d, 2d, Default=None
+        The dependent variable at the previous iteration level, required
+        for Residual="Difference".
+    Norm: str, Default="L1"
+        "L1", "L2" or "Linf".
+    Residual: str, Default="Difference"
+        "Difference" for U - Uold, or "Laplace" for the residual of the
+        five-point Laplace equation,
+        U[i+1,j] + U[i-1,j] + Beta**2 (U[i,j+1] + U[i,j-1])
+        - 2(1 + Beta**2) U[i,j].
+    Beta: float, Default=1.0
+        Ratio of the grid step sizes dX/dY for the Laplace residual.
+
+    Returns
+    -------
+    Error: float
+        Norm of the residual.
+    """
+    from .backend.residual import ResidualMonitor
+
+    return ResidualMonitor(U.shape, Norm, Residual, Beta=Beta).Evaluate(
+        0, U, Uold)
+
+
 def MonitorConvergence(CfgClsObj, n, Error):
     """Display error data to monitor solution convergence.
 
@@ -244,11 +289,13 @@ def MonitorConvergence(CfgClsObj, n, Error):
         print(f"{n:>7} {Error:>15.8f}")
 
 
-def WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None):
+def WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None,
+                        Format="Text"):
     """Write simulation results of the entire domain to output file.
 
     Call Signature:
-        WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None)
+        WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None,
+                            Format="Text")
 
     Parameters
     ----------
@@ -267,8 +314,25 @@ def WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None):
         configuration file.
     OutFileName: str, Default=None.
         File name to store numerical solutions.
+    dX: float
+        Grid step size along the x-axis.
+    dY: float, Default=None
+        Grid step size along the y-axis for 2D solutions.
+    Format: str, Default="Text"
+        "Text" writes one formatted line per grid point. "Binary" writes
+        a small header with IMAX, JMAX, n, dX, dY followed by the raw
+        float64 values of U in a single write, which is much faster for
+        large grids. Binary files are read back with
+        ReadSolutionFromFile() and are accepted by the plot functions.
     """
-    if n % nWrite == 0 or n == nMax:
+    from .backend.solutionio import check_output_format
+    from .backend.solutionio import save_solution_binary
+
+    check_output_format(Format)
+    if Format == "Binary" and (n % nWrite == 0 or n == nMax):
+        save_solution_binary(OutFileName, U, n, dX, dY)
+
+    elif n % nWrite == 0 or n == nMax:
         OutFile = open(OutFileName, "w")
         shapeU = U.shape  # Obtain shape for Dimension
 
@@ -293,6 +357,144 @@ def WriteSolutionToFile(U, n, nWrite, nMax, OutFileName, dX, dY=None):
         OutFile.close()
 
 
+def ReadSolutionFromFile(InFileName):
+    """Return the solution stored in a text or binary output file.
+
+    Binary files written with WriteSolutionToFile(..., Format="Binary")
+    are opened with np.memmap, i.e. the values are read from the disk
+    only when they are accessed and no copy of the file is made.
+
+    Call Signature:
+        ReadSolutionFromFile(InFileName)
+
+    Parameters
+    ----------
+    InFileName: str
+        File name of the stored numerical solution.
+
+    Returns
+    -------
+    U: ndarray[float], =1d, 2d
+        Solution of the dependent variable stored in the file.
+    """
+    from .backend.solutionio import load_solution
+
+    grid, U = load_solution(InFileName)
+
+    return U
+
+
+def WriteSnapshotToArchive(CfgClsObj, U, n, Archive=None):
+    """Append the solution to the snapshot archive every nAnime steps.
+
+    The snapshots are saved only if SAVE_FOR_ANIM? = YES in the
+    configuration file. All snapshots of a run are appended to a
+    single binary file, AnimFileName, together with the step number
+    and the physical time, see ReadSnapshotsFromFile().
+
+    Call Signature:
+        Archive = WriteSnapshotToArchive(CfgClsObj, U, n, Archive=None)
+
+    Parameters
+    ----------
+    CfgClsObj: class object
+        Object of the class RunConfig.
+    U: ndarray[float], =1d, 2d
+        Solution of the dependent variable to be stored.
+    n: int
+        Iteration level/time step level.
+    Archive: SnapshotArchive, Default=None
+        Archive returned by the previous call. If None, a new archive
+        file is created.
+
+    Returns
+    -------
+    Archive: SnapshotArchive
+        Archive to be passed to the next call. Call Archive.Close()
+        at the end of the simulation.
+    """
+    from .backend.snapshots import SnapshotArchive
+
+    if not CfgClsObj.SaveforAnim.upper() == "YES":
+        return Archive
+    if Archive is None:
+        dY = CfgClsObj.dY if U.ndim == 2 else None
+        Archive = SnapshotArchive(CfgClsObj.AnimFileName, "w",
+                                  shape=U.shape, dX=CfgClsObj.dX, dY=dY)
+    if n % CfgClsObj.nAnime == 0:
+        if CfgClsObj.Model.upper() == "LAPLACE":
+            Time = float(n)
+        else:
+            Time = n*CfgClsObj.dT
+        Archive.Append(n, Time, U)
+
+    return Archive
+
+
+def WriteCheckpointToFile(CfgClsObj, U, n, Uo2=None):
+    """Write a checkpoint to restart the simulation from time step n.
+
+    The checkpoint is written to RESTART_FNAME every CHECKPOINT_EVERY
+    (default WRITE_EVERY) steps and at nMax. The simulation is
+    continued from the last checkpoint with START_OPT = RESTART and
+    RESTART_FILE set to this file, see RunConfig.Initial().
+
+    Call Signature:
+        WriteCheckpointToFile(CfgClsObj, U, n, Uo2=None)
+
+    Parameters
+    ----------
+    CfgClsObj: class object
+        Object of the class RunConfig.
+    U: ndarray[float], =1d, 2d
+        Solution of the dependent variable at time step n.
+    n: int
+        Iteration level/time step level.
+    Uo2: ndarray[float], =1d, 2d, Default=None
+        Solution at time step n-1 for three-level schemes, e.g.
+        DuFortFrankel().
+    """
+    from .backend.checkpoint import save_checkpoint
+
+    if CfgClsObj.CheckpointFile.lower() == "none":
+        return
+    if n % CfgClsObj.nCheckpoint == 0 or n == CfgClsObj.nMax:
+        if CfgClsObj.Model.upper() == "LAPLACE":
+            Time = float(n)
+        else:
+            Time = n*CfgClsObj.dT
+        save_checkpoint(CfgClsObj.CheckpointFile, U, n, Time,
+                        CfgClsObj.ConfigHash, Uo2)
+
+
+def ReadSnapshotsFromFile(InFileName):
+    """Return the snapshot archive stored in the file.
+
+    The archive is indexed by snapshot number; Archive.Steps and
+    Archive.Times are the step numbers and physical times of the
+    snapshots, Archive.Read(k) returns snapshot k and
+    Archive.ReadStep(n) returns the snapshot saved at step n. Each
+    snapshot is memory mapped, i.e. only the requested snapshot is read
+    from the disk.
+
+    Call Signature:
+        ReadSnapshotsFromFile(InFileName)
+
+    Parameters
+    ----------
+    InFileName: str
+        File name of the snapshot archive.
+
+    Returns
+    -------
+    Archive: SnapshotArchive
+        Snapshot archive opened for reading.
+    """
+    from .backend.snapshots import SnapshotArchive
+
+    return SnapshotArchive(InFileName)
+
+
 def WriteConvHistToFile(CfgClsObj, n, Error, HistFName=None):
     """Write convergence history log.
 
@@ -318,9 +520,9 @@ def WriteConvHistToFile(CfgClsObj, n, Error, HistFName=None):
         HistFName = CfgClsObj.HistFileName
     # Write convergence data to file
     if n == 0 or n == 1:
-        HistFile = open(HistFName, "w")
-        print(f'{"ITER":>7} {"ERROR":>15}', file=HistFile)
-        print(f'{"----":>7} {"-----":>15}', file=HistFile)
+        with open(HistFName, "w") as HistFile:
+            print(f'{"ITER":>7} {"ERROR":>15}', file=HistFile)
+            print(f'{"----":>7} {"-----":>15}', file=HistFile)
 
     if n % CfgClsObj.nDisplay == 0 or n == CfgClsObj.nMax:
         HistFile = open(HistFName, "a")
@@ -372,6 +574,30 @@ def WriteConvHistToFile(CfgClsObj, n, Error, HistFName=None):
         HistFile.close()
 
 
+def ReadConvHistFromFile(HistFName):
+    """Return the convergence history stored in a log file.
+
+    Call Signature:
+        ReadConvHistFromFile(HistFName)
+
+    Parameters
+    ----------
+    HistFName: str
+        File name of the log written by WriteConvHistToFile() or
+        ConvergenceLog.
+
+    Returns
+    -------
+    History: ndarray
+        Structured array with the fields "n", "Error", "L1", "L2" and
+        "Linf" for each logged iteration. The norms are NaN if they
+        are not stored in the log.
+    """
+    from .backend.convergencelog import read_convergence_log
+
+    return read_convergence_log(HistFName)
+
+
 def WriteSolutionIn1DFormat(CfgClsObj, U, Out1DFName=None):
     """Write 2D output data in 1D format at locations of X or Y.
 
@@ -71,8 +71,9 @@ class RunConfig(ReadConfig):
 
         Parameters
         ----------
-        InFileName: str
-            Path to configuration file.
+        InFileName: str or configparser.ConfigParser
+            Path to configuration file, or the configuration built in
+            the memory, e.g. by RunSweep().
         """
         self.File = InFileName
 
@@ -117,7 +118,16 @@ class RunConfig(ReadConfig):
         """
         import nanpack.meshing as mesh
 
-        if self.GridAutoCalc.upper() == 'YES':
+        if self.GridfromFile.upper() == 'YES':
+            # The grid size is given by the grid in GRID_FNAME.
+            self.X, self.Y = mesh.ReadMeshFromFile(self.GridFName)
+            self.iMax, self.jMax = self.X.shape
+            self.dX, self.dY = mesh.CalcGridStepsize(self.Dimension,
+                                                     self.Length,
+                                                     self.iMax,
+                                                     self.Height,
+                                                     self.jMax)
+        elif self.GridAutoCalc.upper() == 'YES':
             self.iMax, self.jMax = mesh.CalcGridPoints(self.Dimension,
                                                        self.Length,
                                                        self.dX,
@@ -134,6 +144,10 @@ class RunConfig(ReadConfig):
         """Access intial condition inputs from the IC section.
 
         Returns the dependent variables with the initial values.
+        For START_OPT = RESTART, U is read from the checkpoint file
+        RESTART_FILE, together with Uo2 of three-level schemes (None if
+        not stored), the time step nStart and the time StartTime at
+        which the simulation is continued.
 
         Call signature :
             RunConfig.Initial()
@@ -144,12 +158,25 @@ class RunConfig(ReadConfig):
             Initial conditions for the dependent variable.
         """
         import nanpack.backend.initialize as init
+        from nanpack.backend.checkpoint import load_checkpoint
         # *********** INITIAL CONDITIONS *************
         # Firstly, initialize the dependent variable U which is
         # required before assigning any type of intial conditions,
         # whether cold-start or restart.
         self.U = init.InitialCondition(self.Dimension, self.iMax,
                                        self.jMax)
+        self.Uo2 = None
+        self.nStart = 0
+        self.StartTime = 0.0
+        if self.StartOpt.upper() == 'RESTART':
+            chk = load_checkpoint(self.RestartFile, self.ConfigHash,
+                                  self.U.shape)
+            self.U = chk["U"]
+            self.Uo2 = chk["Uo2"]
+            self.nStart = chk["n"]
+            self.StartTime = chk["Time"]
+            print(f'Assigning RESTART conditions from "{self.RestartFile}"\
+ at time step {self.nStart}.')
         return self.U
 
     def BCinit(self):
@@ -170,8 +197,9 @@ class RunConfig(ReadConfig):
         # *********** BOUNDARY CONDITIONS *************
         if self.BCfromFile.upper() == 'YES':
             self.BC = bound.ReadBCfromFile(self.BCFileName)
-            # Call function to assign 2D BC
-            self.U = bound.BC2D(self.U, self.BC, self.dX, self.dY)
+            # Compile the BC once and assign 2D BC
+            self.BCPlan = bound.BCPlan(self.BC, self.dX, self.dY)
+            self.U = self.BCPlan.Apply(self.U)
             print("Boundary conditions assignment: Completed.")
         elif self.BCfromFile.upper() == 'NO':
             self.U = self.U
@@ -255,6 +283,68 @@ def BC2D(U, BC, dX, dY):
     return u
 
 
+def CompileBC(BC, dX, dY):
+    """Return the boundary conditions compiled for repeated assignment.
+
+    The returned BCPlan object assigns the same boundary conditions as
+    BC2D() with U = Plan.Apply(U), without parsing the BC settings at
+    every call. BC_TYPE = NEUMANN imposes the outward normal derivative
+    of U at the boundary.
+
+    Call signature:
+        CompileBC(BC, dX, dY)
+
+    Parameters
+    ----------
+    BC: list
+        Boundary conditions settings obtained from ReadBCfromFile(),
+        i.e. RunConfig.BC.
+    dX: float
+        Grid step size along X-axis.
+    dY: float
+        Grid step size along Y-axis.
+
+    Returns
+    -------
+    Plan: BCPlan
+        Compiled boundary conditions.
+    """
+    from .backend.boundary import BCPlan
+
+    return BCPlan(BC, dX, dY)
+
+
+def CompileBC1D(Left, Right, dX):
+    """Return the 1D boundary conditions compiled for repeated assignment.
+
+    The returned BCPlan1D object is accepted as the argument BC of the
+    multi-stage explicit schemes, e.g. FourthOrderRungeKutta(), which
+    apply it to U after each stage. PERIODIC treats U[0] and U[-1] as
+    the ghost points of the periodic domain U[1:-1].
+
+    Call signature:
+        CompileBC1D(Left, Right, dX)
+
+    Parameters
+    ----------
+    Left: str or tuple
+        BC type or a tuple (BC type, value) at the first point, see
+        FetchOptions().BCTypeOptions().
+    Right: str or tuple
+        BC type or a tuple (BC type, value) at the last point.
+    dX: float
+        Grid step size along X-axis.
+
+    Returns
+    -------
+    Plan: BCPlan1D
+        Compiled boundary conditions.
+    """
+    from .backend.boundary import BCPlan1D
+
+    return BCPlan1D(Left, Right, dX)
+
+
 def CourantNumber(CFL, Dimension):
     """Return the Courant Number.(this function needs modification)."""
     if Dimension.upper() == '1D':
@@ -64,8 +64,10 @@ The equation is non-dimensionalized using the following expression:
 #   NAnPack Learner's Edition.
 #
 #   ***********************************************************************
+import numpy as np
 from .tridiagonal import TridiagonalSolver
 from .backend.exceptions import DimensionError
+from .backend.stepper import Stepper, StageBC
 
 
 def FTCS(Uo, Courant, diffX):
@@ -109,6 +111,57 @@ def FTCS(Uo, Courant, diffX):
     return U
 
 
+class FTCSSolver(Stepper):
+    """FTCS method for the viscous Burgers eq. with persistent work arrays.
+
+    This class computes the same solution as the function FTCS() without
+    allocating new arrays at every time step. Step(Uo, U) writes the
+    solution into U, which may be Uo itself or a second buffer for
+    ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    diffX: float
+        Diffusion number for x-component that appears in the diffusion
+        component of the PDE.
+    """
+
+    # Uo is only read before U is written
+    InPlace = True
+
+    def __init__(self, shape, Courant, diffX):
+        """Class constructor for the FTCSSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "viscous Bergers", "FTCS")
+        super().__init__(shape)
+        self.Courant = Courant
+        self.diffX = diffX
+        iMax, = shape
+        self._T = np.empty(iMax-2)
+        self._S = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        T = self._T
+        S = self._S
+        # Convection term with A = Uo
+        np.add(Uo[2:], Uo[0:-2], out=T)
+        T *= 0.5*0.5*self.Courant
+        np.subtract(Uo[2:], Uo[0:-2], out=S)
+        T *= S
+        np.subtract(Uo[1:-1], T, out=T)
+        # Diffusion term
+        np.multiply(Uo[1:-1], 2.0, out=S)
+        np.subtract(Uo[2:], S, out=S)
+        S += Uo[0:-2]
+        S *= self.diffX
+        np.add(T, S, out=U[1:-1])
+
+
 def FTBCS(Uo, Courant, diffX):
     """Return the numerical solution of dependent variable in the model eq.
 
@@ -197,7 +250,7 @@ def DuFortFrankel(Uo, Uo2, Courant, diffX):
     return U
 
 
-def MacCormack(Uo, Courant, diffX):
+def MacCormack(Uo, Courant, diffX, BC=None):
     """Return the numerical solution of dependent variable in the model eq.
 
     This function uses the
@@ -205,7 +258,7 @@ def MacCormack(Uo, Courant, diffX):
     to obtain the solution of the 1D non-linear viscous Burgers equation.
 
     Call signature:
-        MacCormack(Uo, Courant, diffX)
+        MacCormack(Uo, Courant, diffX, BC)
 
     Parameters
     ----------
@@ -217,6 +270,11 @@ def MacCormack(Uo, Courant, diffX):
     diffX: float
         Diffusion number for x-component that appears in the diffusion
         component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after the predictor step, e.g.
+        BCPlan1D(("PERIODIC", None), ("PERIODIC", None), dX) or a
+        function BC(U) which assigns the boundary values in place.
+        The boundary values of Uo are used if None.
 
     Returns
     -------
@@ -228,24 +286,98 @@ def MacCormack(Uo, Courant, diffX):
     if len(shapeU) == 2:
         raise DimensionError("2D", "viscous Bergers", "expl. MacCormack")
 
-    iMax, = shapeU
-    U = Uo.copy()  # Initialize U
-    Utemp = Uo.copy()
-    Etemp = Uo.copy()
-    E = Uo*Uo/2
-
-    for i in range(1, iMax-1):
-        dUo = (-Courant*(E[i+1] - E[i])
-               + diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1]))
-        Utemp[i] = Uo[i] + dUo  # Predictor step
-        Etemp[i] = Utemp[i]*Utemp[i]/2.0
-        dUtemp = (-Courant*(Etemp[i]-Etemp[i-1])
-                  + diffX*(Utemp[i+1] - 2.0*Utemp[i] + Utemp[i-1]))
-        U[i] = 0.5 * (Uo[i]+Utemp[i]+dUtemp)  # Corrector step
+    # The predictor step is evaluated over the whole domain followed by
+    # the corrector step, see MacCormackSolver.
+    U = MacCormackSolver(shapeU, Courant, diffX, BC).Step(Uo)
 
     return U
 
 
+class MacCormackSolver(Stepper):
+    """MacCormack method for the viscous Burgers eq. with work arrays.
+
+    This class computes the same solution as the function MacCormack(),
+    but the predictor and corrector steps are evaluated with array
+    slices into work arrays allocated once in the constructor.
+    Step(Uo, U) writes the solution into U, which may be Uo itself or a
+    second buffer for ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    diffX: float
+        Diffusion number for x-component that appears in the diffusion
+        component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after the predictor step.
+    """
+
+    # Uo is only read before U is written in the corrector step
+    InPlace = True
+
+    def __init__(self, shape, Courant, diffX, BC=None):
+        """Class constructor for the MacCormackSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "viscous Bergers", "expl. MacCormack")
+        super().__init__(shape, BC)
+        self._HasBC = BC is not None
+        self.Courant = Courant
+        self.diffX = diffX
+        iMax, = shape
+        self._Utemp = np.empty(iMax)
+        self._E = np.empty(iMax)
+        self._Etemp = np.empty(iMax)
+        self._T = np.empty(iMax-2)
+        self._S = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        Courant = self.Courant
+        diffX = self.diffX
+        Utemp = self._Utemp
+        E = self._E
+        Etemp = self._Etemp
+        T = self._T
+        S = self._S
+        np.multiply(Uo, Uo, out=E)
+        E /= 2
+        # As in MacCormack(), Etemp at the first point is Uo[0].
+        Utemp[0] = Uo[0]
+        Etemp[0] = Uo[0]
+        # Predictor step
+        np.subtract(E[2:], E[1:-1], out=T)
+        T *= -Courant
+        np.multiply(Uo[1:-1], 2.0, out=S)
+        np.subtract(Uo[2:], S, out=S)
+        S += Uo[0:-2]
+        S *= diffX
+        T += S
+        np.add(Uo[1:-1], T, out=Utemp[1:-1])
+        np.multiply(Utemp[1:-1], Utemp[1:-1], out=Etemp[1:-1])
+        Etemp[1:-1] /= 2.0
+        if self._HasBC:
+            # The flux at the boundary follows the predicted boundary
+            # value instead of the value Uo[0] used above.
+            Utemp[-1] = Uo[-1]
+            self.BC(Utemp)
+            Etemp[0] = Utemp[0]*Utemp[0]/2.0
+        # Corrector step. As in MacCormack(), the diffusion term uses
+        # Utemp(i+1) before its predictor update, i.e. Uo(i+1).
+        np.subtract(Etemp[1:-1], Etemp[0:-2], out=T)
+        T *= -Courant
+        np.multiply(Utemp[1:-1], 2.0, out=S)
+        np.subtract(Uo[2:], S, out=S)
+        S += Utemp[0:-2]
+        S *= diffX
+        T += S
+        np.add(Uo[1:-1], Utemp[1:-1], out=S)
+        S += T
+        np.multiply(S, 0.5, out=U[1:-1])
+
+
 def BTCS(Uo, Courant, diffX):
     """Return the numerical solution of dependent variable in the model eq.
 
@@ -364,7 +496,7 @@ def BTBCS(Uo, Courant, diffX, Accuracy):
     return U
 
 
-def ModifiedRungeKutta(Uo, Courant, diffX):
+def ModifiedRungeKutta(Uo, Courant, diffX, BC=None):
     """Return the numerical solution of dependent variable in the model eq.
 
     This function uses the
@@ -372,7 +504,7 @@ def ModifiedRungeKutta(Uo, Courant, diffX):
     to obtain the solution of the 1D non-linear viscous Burgers equation.
 
     Call signature:
-        ModifiedRungeKutta(Uo, Courant, diffX)
+        ModifiedRungeKutta(Uo, Courant, diffX, BC)
 
     Parameters
     ----------
@@ -384,6 +516,11 @@ def ModifiedRungeKutta(Uo, Courant, diffX):
     diffX: float
         Diffusion number for x-component that appears in the diffusion
         component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage, e.g.
+        BCPlan1D(("PERIODIC", None), ("PERIODIC", None), dX) or a
+        function BC(U) which assigns the boundary values in place.
+        The boundary values of Uo are used if None.
 
     Returns
     -------
@@ -395,32 +532,91 @@ def ModifiedRungeKutta(Uo, Courant, diffX):
     if len(shapeU) == 2:
         raise DimensionError("2D", "viscous Bergers", "Modified RK")
 
+    ApplyBC = StageBC(BC)
     U = Uo.copy()  # Initialize U
 
     # 1st stage
     E = Uo*Uo/2
     U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/8.0
-    # -- update BC here (required when Neumann BC is used)
+    ApplyBC(U)
     # 2nd stage
     E = U*U/2
     U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/6.0
-    # -- update BC here (required when Neumann BC is used)
+    ApplyBC(U)
     # 3rd stage
     E = U*U/2
     U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/4.0
-    # -- update BC here (required when Neumann BC is used)
+    ApplyBC(U)
     # 4th stage
     E = U*U/2
     U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/2.0
-    # -- update BC here (required when Neumann BC is used)
+    ApplyBC(U)
     Unew = U.copy()
     # Add the viscous terms in the viscous Burgers equation
     # after the final stage, (pg 291. CFD Vol 1 Hoffmann].
     U[1:-1] = Unew[1:-1] + diffX*(Unew[2:]-2.0*Unew[1:-1]+Unew[0:-2])
+    ApplyBC(U)
 
     return U
 
 
+class ModifiedRungeKuttaSolver(Stepper):
+    """Modified Runge-Kutta method for the viscous Burgers eq.
+
+    This class computes the same solution as the function
+    ModifiedRungeKutta() without allocating new arrays at every time
+    step. Step(Uo, U) writes the solution into U, which may be Uo itself
+    or a second buffer for ping-pong stepping, see Run().
+
+    Attributes
+    ----------
+    shape: tuple
+        Shape (iMax,) of the dependent variable.
+    Courant: float
+        Courant number that appears in the convection component of the PDE.
+    diffX: float
+        Diffusion number for x-component that appears in the diffusion
+        component of the PDE.
+    BC: function or BCPlan1D, Default = None
+        Boundary conditions applied to U after each stage.
+    """
+
+    def __init__(self, shape, Courant, diffX, BC=None):
+        """Class constructor for the ModifiedRungeKuttaSolver class."""
+        if len(shape) == 2:
+            raise DimensionError("2D", "viscous Bergers", "Modified RK")
+        super().__init__(shape, BC)
+        self.Courant = Courant
+        self.diffX = diffX
+        iMax, = shape
+        self._E = np.empty(iMax)
+        self._T = np.empty(iMax-2)
+        self._S = np.empty(iMax-2)
+
+    def _Advance(self, Uo, U):
+        """Compute the interior values of U from Uo."""
+        E = self._E
+        T = self._T
+        S = self._S
+        Uk = Uo
+        for Divisor in [8.0, 6.0, 4.0, 2.0]:
+            np.multiply(Uk, Uk, out=E)
+            E /= 2
+            np.subtract(E[2:], E[0:-2], out=T)
+            T *= self.Courant
+            T /= Divisor
+            np.subtract(Uo[1:-1], T, out=U[1:-1])
+            self.BC(U)
+            Uk = U
+        # Add the viscous terms in the viscous Burgers equation
+        # after the final stage, (pg 291. CFD Vol 1 Hoffmann].
+        np.multiply(U[1:-1], 2.0, out=S)
+        np.subtract(U[2:], S, out=S)
+        S += U[0:-2]
+        S *= self.diffX
+        U[1:-1] += S
+
+
 def SecondOrderTVD(Uo, Courant, diffX, LimiterFunc, Limiter, Eps=0.01):
     """Return the numerical solution of dependent variable in the model eq.
 
@@ -457,7 +653,7 @@ def SecondOrderTVD(Uo, Courant, diffX, LimiterFunc, Limiter, Eps=0.01):
         The dependent variable at time level, n+1 within the entire domain.
         (Non-dimensionalized quantity)
     """
-    from .tvdfunctions import CalculateTVD
+    from .tvdfunctions import CalculateTVDArray
     from .backend import fetchoptions as fo
     from .backend.exceptions import TVDLimiterFunctionInputError
 
@@ -475,19 +671,22 @@ def SecondOrderTVD(Uo, Courant, diffX, LimiterFunc, Limiter, Eps=0.01):
     if LimiterFunc not in limfunc_options:
         raise TVDLimiterFunctionInputError(LimiterFunc)
 
-    for i in range(2, iMax-2):
-        phiPlus, phiMinus = CalculateTVD(i, Uo, E, Eps, Courant,
-                                         Limiter, LimiterFunc)
+    # The flux limiter function at all the interior points 2...iMax-3
+    phiPlus, phiMinus = CalculateTVDArray(Uo, E, Eps, Courant,
+                                          Limiter, LimiterFunc)
+    i = slice(2, iMax-2)
+    iP1 = slice(3, iMax-1)
+    iM1 = slice(1, iMax-3)
 
-        # Equation 6-124 and 6-125 in Hoffmann Vol. 1
-        hPlus = 0.5 * (E[i+1]+E[i]+phiPlus)
-        hMinus = 0.5 * (E[i]+E[i-1]+phiMinus)
+    # Equation 6-124 and 6-125 in Hoffmann Vol. 1
+    hPlus = 0.5 * (E[iP1]+E[i]+phiPlus)
+    hMinus = 0.5 * (E[i]+E[iM1]+phiMinus)
 
-        # Calculate diffusion terms in the viscous Bergers equation.
-        # Equation 7-58
-        diffusion = diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1])
+    # Calculate diffusion terms in the viscous Bergers equation.
+    # Equation 7-58
+    diffusion = diffX*(Uo[iP1] - 2.0*Uo[i] + Uo[iM1])
 
-        # Equation 6-123
-        U[i] = Uo[i] - Courant*(hPlus-hMinus) + diffusion
+    # Equation 6-123
+    U[i] = Uo[i] - Courant*(hPlus-hMinus) + diffusion
 
     return U
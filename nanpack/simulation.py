@@ -0,0 +1,223 @@
+"""A module to drive the time/iteration loop of a simulation."""
+#   ***********************************************************************
+#
+#   FILE         simulation.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from . import postprocess as pp
+from .backend.fetchoptions import FetchOptions
+from .backend.exceptions import SimulationHookInputError
+from .backend.boundary import BCPlan
+from .backend.stepper import Stepper
+
+
+class Simulation:
+    """Driver of the time-marching or iteration loop of a simulation.
+
+    The driver owns the solution buffers and, at each time step or
+    iteration level, calls the numerical scheme, applies the boundary
+    conditions from the BC file and writes the outputs requested in the
+    configuration file: the solution file, the buffered convergence
+    log, the snapshots for animation and the restart checkpoints.
+    The buffers of the current and previous steps are swapped instead
+    of copied. The error is evaluated by a ResidualMonitor only every
+    nCheck steps and at the steps at which it is displayed.
+
+    Call signature:
+        Simulation(CfgClsObj, nCheck=1, Async=False, HistFormat="Text",
+                   Monitor=None)
+
+    Attributes
+    ----------
+    CfgClsObj: class object
+        Object of the class RunConfig. A restarted simulation continues
+        from the time step CfgClsObj.nStart.
+    nCheck: int, Default=1
+        The error is evaluated after every nCheck steps.
+    Async: bool, Default=False
+        Write the solution files on a background thread, see
+        AsyncWriter.
+    HistFormat: str, Default="Text"
+        Format of the convergence log, see ConvergenceLog.
+    Monitor: ResidualMonitor, Default=None
+        Monitor of the error, e.g. with the Linf norm, the Laplace
+        residual or an adaptive interval. Default is the L1 norm of
+        U - Uold every nCheck steps, i.e. AbsoluteError().
+
+    Example
+    -------
+        cfg = RunConfig(configfile)
+        sim = Simulation(cfg, nCheck=10)
+        U = sim.Run(ep.PointGaussSeidel, Beta)
+    """
+
+    def __init__(self, CfgClsObj, nCheck=1, Async=False,
+                 HistFormat="Text", Monitor=None):
+        """Class constructor for the Simulation class."""
+        self.cfg = CfgClsObj
+        self.nCheck = nCheck
+        self.Async = Async
+        self.HistFormat = HistFormat
+        self.U = np.array(CfgClsObj.U, dtype="float64")
+        self.Uold = np.empty_like(self.U)
+        if Monitor is None:
+            Monitor = pp.ResidualMonitor(self.U.shape, nCheck=nCheck)
+        self.Monitor = Monitor
+        self._bcplan = None
+        self.n = getattr(CfgClsObj, "nStart", 0)
+        self.Time = getattr(CfgClsObj, "StartTime", 0.0)
+        self.Error = 1.0
+        self._hooks = {event: [] for event in
+                       FetchOptions().SimulationHookOptions()}
+
+    def AddHook(self, Event, Func):
+        """Call Func(sim) with the Simulation object at the Event.
+
+        Call signature:
+            Simulation.AddHook(Event, Func)
+
+        Parameters
+        ----------
+        Event: str
+            "PreStep" before each step, "PostStep" after each step
+            and its outputs, "End" after the last step.
+        Func: function
+            Hook function; it may read or modify sim.U, sim.n,
+            sim.Time and sim.Error.
+        """
+        if Event not in self._hooks:
+            raise SimulationHookInputError(Event)
+        self._hooks[Event].append(Func)
+
+    def Run(self, Scheme, *args, ThreeLevel=False, **kwargs):
+        """Advance the solution until convergence or nMax steps.
+
+        Call signature:
+            Simulation.Run(Scheme, *args, ThreeLevel=False, **kwargs)
+
+        Parameters
+        ----------
+        Scheme: function or Stepper
+            Solver function called as Scheme(Uold, *args, **kwargs), or
+            Scheme(Uold, Uo2, *args, **kwargs) for three-level schemes,
+            which returns the solution at the next step. A Stepper
+            object, e.g. FTCSSolver, advances the solution in the
+            driver buffers without allocating new arrays.
+        ThreeLevel: bool, Default=False
+            True for schemes which use the solution at two previous time
+            steps, e.g. DuFortFrankel().
+
+        Returns
+        -------
+        U: ndarray[float], =1d, 2d
+            Solution of the dependent variable at the last step.
+        """
+        cfg = self.cfg
+        Steady = cfg.State.upper() == "STEADY"
+        dT = 1.0 if cfg.Model.upper() == "LAPLACE" else cfg.dT
+        writer = pp.AsyncWriter() if self.Async else pp
+        log = pp.ConvergenceLog(cfg, Format=self.HistFormat)
+        Archive = None
+        if ThreeLevel:
+            # Uold holds the solution at the previous step, the values of
+            # a restart checkpoint or U at the first step
+            Uprev = getattr(cfg, "Uo2", None)
+            self.Uold[...] = self.U if Uprev is None else Uprev
+        try:
+            while self.n < cfg.nMax:
+                self._CallHooks("PreStep")
+                self.n += 1
+                n = self.n
+                # Swap the buffers, the solution functions return a new
+                # array and the Stepper objects write into the old one
+                if isinstance(Scheme, Stepper):
+                    self.U, self.Uold = self.Uold, self.U
+                    Scheme.Step(self.Uold, self.U)
+                elif ThreeLevel:
+                    self.U, self.Uold = (Scheme(self.U, self.Uold, *args,
+                                                **kwargs), self.U)
+                else:
+                    self.U, self.Uold = Scheme(self.U, *args, **kwargs), \
+                        self.U
+                self._ApplyBC()
+                self.Time = self.Time + dT
+
+                if (self.Monitor.Due(n) or n % cfg.nDisplay == 0
+                        or n == cfg.nMax):
+                    self.Error = self.Monitor.Evaluate(n, self.U, self.Uold)
+                    pp.MonitorConvergence(cfg, n, self.Error)
+                    if (n % cfg.nDisplay == 0 or n == cfg.nMax
+                            or self.Error < cfg.ConvCrit):
+                        log.Log(n, self.Error, self.U - self.Uold)
+                writer.WriteSolutionToFile(self.U, n, cfg.nWrite, cfg.nMax,
+                                           cfg.OutFileName, cfg.dX, cfg.dY)
+                Archive = pp.WriteSnapshotToArchive(cfg, self.U, n,
+                                                    Archive)
+                pp.WriteCheckpointToFile(cfg, self.U, n,
+                                         self.Uold if ThreeLevel else None)
+                self._CallHooks("PostStep")
+                if Steady and self.Error < cfg.ConvCrit:
+                    break
+            # Write the solution at the last step of a converged run
+            if not (self.n % cfg.nWrite == 0 or self.n == cfg.nMax):
+                writer.WriteSolutionToFile(self.U, self.n, 1, cfg.nMax,
+                                           cfg.OutFileName, cfg.dX, cfg.dY)
+        finally:
+            log.Close()
+            if Archive is not None:
+                Archive.Close()
+            if self.Async:
+                writer.Close()
+        self._CallHooks("End")
+
+        return self.U
+
+    def _ApplyBC(self):
+        """Apply the boundary conditions read from the BC file."""
+        cfg = self.cfg
+        if cfg.BCfromFile.upper() == "YES" and self.U.ndim == 2:
+            if self._bcplan is None:
+                self._bcplan = getattr(cfg, "BCPlan", None) \
+                    or BCPlan(cfg.BC, cfg.dX, cfg.dY)
+            self._bcplan.Apply(self.U)
+
+    def _CallHooks(self, Event):
+        """Call the hook functions of the Event."""
+        for Func in self._hooks[Event]:
+            Func(self)
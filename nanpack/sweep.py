@@ -0,0 +1,189 @@
+"""A module to run parameter sweeps over simulation configurations."""
+#   ***********************************************************************
+#
+#   FILE         sweep.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import configparser
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Output file names in the OUTPUT section which are moved to the case
+# directory of each sweep case.
+_OUTPUT_KEYS = ["HIST_FILE_NAME",
+                "RESTART_FNAME",
+                "RESULT_FNAME",
+                "SAVE1D_FILENAME",
+                "ANIM_FNAME"]
+
+
+def RunSweep(BaseConfig, ParamGrid, CaseFunction, OutDir="sweep",
+             MaxWorkers=None):
+    """Run a simulation for each combination of the sweep parameters.
+
+    A configuration is built in the memory for each case from the base
+    configuration file and the case parameters. The output files of
+    each case are written to its own directory OutDir/case-NNN which
+    also contains the configuration file of the case. The cases are
+    executed in parallel processes and a summary table of the cases is
+    written to OutDir/summary.dat.
+
+    Call signature:
+        RunSweep(BaseConfig, ParamGrid, CaseFunction, OutDir="sweep",
+                 MaxWorkers=None)
+
+    Parameters
+    ----------
+    BaseConfig: str
+        Path to the base configuration file.
+    ParamGrid: dict
+        Values of the sweep parameters, e.g.
+        {"CONST.CFL": [0.5, 0.8], "SETUP.SCHEME": ["FTCS", "DUFORT"]}.
+        A key SECTION.KEY replaces the value of KEY in SECTION of the
+        configuration file. Any other key, e.g. "Limiter", is set as an
+        attribute of the RunConfig object of the case.
+    CaseFunction: function
+        Function called as CaseFunction(cfg) with the RunConfig object
+        of the case, which returns the number of time steps/iterations
+        and the final error. It must be defined at the top level of a
+        module to be executed in another process.
+    OutDir: str, Default="sweep"
+        Directory of the case directories and the summary table.
+    MaxWorkers: int, Default=None
+        Number of processes, default is the number of processors. If
+        1, the cases are executed in this process.
+
+    Returns
+    -------
+    Summary: list[dict]
+        For each case, the keys "Case", "Params", "Runtime", "Steps",
+        "Error" and "Status" ("OK" or the exception raised by the case).
+    """
+    cases = _BuildCases(BaseConfig, ParamGrid, OutDir)
+    if MaxWorkers == 1:
+        Summary = [_RunCase(case, CaseFunction) for case in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=MaxWorkers) as executor:
+            Summary = list(executor.map(_RunCase, cases,
+                                        itertools.repeat(CaseFunction)))
+    _WriteSummary(Summary, os.path.join(OutDir, "summary.dat"))
+
+    return Summary
+
+
+def _BuildCases(BaseConfig, ParamGrid, OutDir):
+    """Return the case name, directory, parameters and configuration."""
+    base = configparser.ConfigParser()
+    base.optionxform = str  # keep the case of the keys, e.g. dX
+    if not base.read(BaseConfig):
+        from .backend.exceptions import InputFileError
+        raise InputFileError("FileNotFound", BaseConfig)
+    keys = list(ParamGrid)
+    cases = []
+    for k, values in enumerate(itertools.product(*ParamGrid.values())):
+        name = f"case-{k:03d}"
+        caseDir = os.path.join(OutDir, name)
+        os.makedirs(caseDir, exist_ok=True)
+        config = {s: dict(base.items(s, raw=True)) for s in base.sections()}
+        params = dict(zip(keys, values))
+        attrs = {}
+        for key, value in params.items():
+            if "." in key:
+                section, option = key.split(".", 1)
+                # Use the spelling of the key in the base configuration
+                option = next((o for o in config[section]
+                               if o.lower() == option.lower()), option)
+                config[section][option] = str(value)
+            else:
+                attrs[key] = value
+        for option in _OUTPUT_KEYS:
+            fName = config["OUTPUT"].get(option, "none")
+            if fName.lower() != "none":
+                config["OUTPUT"][option] = os.path.join(
+                    caseDir, os.path.basename(fName))
+        _WriteConfig(config, os.path.join(caseDir, "config.ini"))
+        cases.append((name, caseDir, params, attrs, config))
+
+    return cases
+
+
+def _WriteConfig(config, fName):
+    """Write the configuration of a case to a file."""
+    parser = configparser.ConfigParser()
+    parser.optionxform = str
+    parser.read_dict(config)
+    with open(fName, "w") as f:
+        parser.write(f)
+
+
+def _RunCase(case, CaseFunction):
+    """Execute one case and return its summary."""
+    from .preprocess import RunConfig
+
+    name, caseDir, params, attrs, config = case
+    summary = {"Case": name, "Params": params, "Runtime": 0.0,
+               "Steps": None, "Error": None, "Status": "OK"}
+    start = time.perf_counter()
+    try:
+        parser = configparser.ConfigParser()
+        parser.read_dict(config)
+        cfg = RunConfig(parser)
+        for key, value in attrs.items():
+            setattr(cfg, key, value)
+        summary["Steps"], summary["Error"] = CaseFunction(cfg)
+    except Exception as err:
+        summary["Status"] = f"{type(err).__name__}: {err}"
+    summary["Runtime"] = time.perf_counter() - start
+
+    return summary
+
+
+def _WriteSummary(Summary, fName):
+    """Print and write the summary table of the sweep."""
+    lines = [f'{"CASE":<10} {"RUNTIME (s)":>12} {"STEPS":>8}'
+             f' {"ERROR":>15} {"STATUS":<8} PARAMETERS']
+    for row in Summary:
+        steps = "-" if row["Steps"] is None else row["Steps"]
+        error = "-" if row["Error"] is None else f'{row["Error"]:.8e}'
+        params = ", ".join(f"{k}={v}" for k, v in row["Params"].items())
+        lines.append(f'{row["Case"]:<10} {row["Runtime"]:>12.4f}'
+                     f' {steps:>8} {error:>15} {row["Status"]:<8} {params}')
+    print(*lines, sep="\n")
+    with open(fName, "w") as f:
+        print(*lines, sep="\n", file=f)
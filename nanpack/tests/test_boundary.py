@@ -0,0 +1,122 @@
+"""Test the compiled boundary conditions."""
+#   ***********************************************************************
+#
+#   FILE         test_boundary.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import os
+
+import numpy as np
+
+import nanpack.preprocess as pre
+from nanpack.backend.boundary import ReadBCfromFile
+from nanpack.backend.exceptions import InvalidValueError
+
+INPUT = os.path.join(os.path.dirname(__file__), "..", "input")
+
+
+def BCLoop(U, BC, dX, dY):
+    """Assign the Dirichlet conditions point by point."""
+    for Axis1, A1, B1, Axis2, A2, B2, BCType, Ubc in BC:
+        for axis, A, B in [(Axis1, A1, B1), (Axis2, A2, B2)]:
+            if axis == "none":
+                continue
+            delta = dY if axis in ["X-lo", "X-hi"] else dX
+            ijA = int(A/delta)
+            ijB = int(B/delta)
+            iM, jM = U.shape
+            if axis == "X-lo":
+                points = [(0, j) for j in range(ijA, min(ijB+1, jM))]
+            elif axis == "X-hi":
+                points = [(iM-1, j) for j in range(ijA+1, min(ijB, jM))]
+            elif axis == "Y-lo":
+                points = [(i, 0) for i in range(ijA, min(ijB+1, iM))]
+            elif axis == "Y-hi":
+                points = [(i, jM-1) for i in range(ijA+1, min(ijB, iM))]
+            for i, j in points:
+                U[i, j] = Ubc
+    return U
+
+
+def test_bcplan():
+    """Compare the compiled BC with the point by point assignment."""
+    BC = ReadBCfromFile(os.path.join(INPUT, "bc.ini"))
+    rng = np.random.default_rng(19)
+    U = rng.random((21, 31))
+    Plan = pre.CompileBC(BC, 0.1, 0.05)
+    assert np.array_equal(Plan.Apply(U.copy()), BCLoop(U.copy(), BC, 0.1,
+                                                       0.05))
+    assert np.array_equal(pre.BC2D(U.copy(), BC, 0.1, 0.05),
+                          Plan.Apply(U.copy()))
+
+    # Partial segments with a second axis
+    BC[0][1:6] = [0.5, 1.2, "Y-hi", 0.3, 0.9]
+    Plan = pre.CompileBC(BC, 0.1, 0.05)
+    assert np.array_equal(Plan.Apply(U.copy()), BCLoop(U.copy(), BC, 0.1,
+                                                       0.05))
+
+
+def test_neumann():
+    """Impose the outward normal derivative at the boundaries."""
+    BC = ReadBCfromFile(os.path.join(INPUT, "bc.ini"))
+    BC[0][6:] = ["NEUMANN", 2.0]  # Y-lo
+    BC[3][6:] = ["NEUMANN", 0.0]  # X-hi
+    rng = np.random.default_rng(23)
+    U = rng.random((21, 31))
+    dX, dY = 0.1, 0.05
+    V = pre.CompileBC(BC, dX, dY).Apply(U.copy())
+    # -dU/dy at Y-lo and dU/dx at X-hi
+    assert np.allclose(-(V[1:-1, 1] - V[1:-1, 0])/dY, 2.0)
+    assert np.array_equal(V[-1, 1:-1], V[-2, 1:-1])
+    assert np.array_equal(V[1:-1, 1:-1], U[1:-1, 1:-1])
+
+    # Periodic ghost points at Y-lo
+    BC[0][6:] = ["PERIODIC", 0.0]
+    V = pre.CompileBC(BC, dX, dY).Apply(U.copy())
+    assert np.array_equal(V[1:-1, 0], U[1:-1, -2])
+
+    BC[1][6] = "ROBIN"
+    try:
+        pre.CompileBC(BC, dX, dY)
+        raise AssertionError("InvalidValueError not raised.")
+    except InvalidValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_bcplan()
+    test_neumann()
+    print("Boundary conditions test SUCCESS.")
@@ -0,0 +1,133 @@
+"""Test the solvers on curvilinear grids."""
+#   ***********************************************************************
+#
+#   FILE         test_curvilinear.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+from types import SimpleNamespace
+
+import numpy as np
+
+import nanpack.meshing as mesh
+import nanpack.parabolicsolvers as ps
+import nanpack.ellipticsolvers as es
+from nanpack.backend.curvilinear import laplace_operator
+from nanpack.backend.exceptions import DimensionError
+
+
+def Config(iM, jM):
+    """Return the grid size settings."""
+    return SimpleNamespace(iM=iM, jM=jM, dX=None, dY=None)
+
+
+def Iterate(Solver, U, Tol=1e-10, nMax=5000):
+    """Return the converged solution and the number of iterations."""
+    for n in range(1, nMax+1):
+        Unew = Solver(U)
+        if np.abs(Unew - U).max() < Tol:
+            return Unew, n
+        U = Unew
+    raise AssertionError("Solution did not converge.")
+
+
+def test_cartesian():
+    """Recover the Cartesian solvers on a rectangular grid."""
+    X, Y = mesh.RectangularMesh(0.1, 21, 0.05, 17)
+    rng = np.random.default_rng(9)
+    U = rng.uniform(0.0, 1.0, X.shape)
+    nuT = 0.002
+    diffX = nuT/0.1**2
+    diffY = nuT/0.05**2
+    assert np.allclose(ps.CurvilinearFTCS(U, X, Y, nuT),
+                       ps.FTCS(U, diffX, diffY), rtol=0.0, atol=1e-13)
+    assert np.allclose(ps.CurvilinearADI(U, X, Y, nuT),
+                       ps.ADI(U, diffX, diffY), rtol=0.0, atol=1e-13)
+    ftcs = ps.CurvilinearFTCSSolver(X, Y, nuT)
+    assert np.isclose(ftcs.MaxDiffT, 1.0/(2.0/0.1**2 + 2.0/0.05**2))
+    # The coefficients are computed once per grid
+    assert laplace_operator(X, Y) is laplace_operator(X.copy(), Y.copy())
+
+
+def test_ogrid():
+    """Solve the Laplace's equation between two circles (O-grid)."""
+    X, Y = mesh.StructuredMesh("o-grid-cylinder", True, Config(41, 21),
+                               Beta=1.05)
+    Uex = np.log(np.hypot(X - 3.0, Y))
+    Uo = Uex.copy()
+    Uo[:, 1:-1] = 0.0
+
+    U1, n1 = Iterate(lambda U: es.CurvilinearPSOR(U, X, Y), Uo)
+    U2, n2 = Iterate(lambda U: es.CurvilinearLSOR(U, X, Y), Uo)
+    adi = ps.CurvilinearADISolver(X, Y, 0.05)
+    U3, n3 = Iterate(adi.Step, Uo)
+    for U in [U1, U2, U3]:
+        assert np.abs(U - Uex).max() < 1e-3
+        assert np.array_equal(U[0], U[-1])
+        assert np.array_equal(U[:, [0, -1]], Uex[:, [0, -1]])
+    assert np.abs(U1 - U2).max() < 1e-8 and np.abs(U1 - U3).max() < 1e-8
+    # The lines along the clustering are solved implicitly
+    assert n2 < n1/2
+
+    # The explicit method remains stable at the limit
+    ftcs = ps.CurvilinearFTCSSolver(X, Y, 0.0)
+    ftcs.DiffT = 0.95*ftcs.MaxDiffT
+    U = ftcs.Run(Uo.copy(), 2000)
+    assert np.all(U[:, 1:-1] <= Uex[:, -1:]) and np.all(U >= Uex.min())
+
+
+def test_bluntbody():
+    """Solve the Laplace's equation on the blunt body grid."""
+    X, Y = mesh.StructuredMesh("blunt-body-ellipse", True, Config(41, 21),
+                               Beta=1.2)
+    Uex = X + 2.0*Y
+    Uo = Uex.copy()
+    Uo[1:-1, 1:-1] = 0.0
+    U, n = Iterate(lambda U: es.CurvilinearLSOR(U, X, Y), Uo)
+    assert np.abs(U - Uex).max() < 1e-3
+    try:
+        es.CurvilinearPSOR(Uo[0], X, Y)
+        raise AssertionError("DimensionError not raised.")
+    except DimensionError:
+        pass
+
+
+if __name__ == "__main__":
+    test_cartesian()
+    print("Cartesian grid test SUCCESS.")
+    test_ogrid()
+    print("O-grid test SUCCESS.")
+    test_bluntbody()
+    print("Blunt body grid test SUCCESS.")
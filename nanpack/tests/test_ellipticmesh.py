@@ -0,0 +1,142 @@
+"""Test the elliptic grid generation."""
+#   ***********************************************************************
+#
+#   FILE         test_ellipticmesh.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+import nanpack.meshing as mesh
+
+
+def Config(iM, jM):
+    """Return the grid size settings."""
+    return SimpleNamespace(iM=iM, jM=jM, dX=None, dY=None)
+
+
+def CellAreas(X, Y):
+    """Return the areas of the grid cells."""
+    return 0.5*((X[1:, 1:] - X[:-1, :-1])*(Y[:-1, 1:] - Y[1:, :-1])
+                - (Y[1:, 1:] - Y[:-1, :-1])*(X[:-1, 1:] - X[1:, :-1]))
+
+
+def WallSpacing(X, Y):
+    """Return the height of the first cells at the boundary j = 1."""
+    return np.hypot(X[:, 1] - X[:, 0], Y[:, 1] - Y[:, 0])
+
+
+def test_uniform():
+    """Recover the uniform grid from a perturbed one."""
+    X, Y = mesh.RectangularMesh(0.1, 21, 0.05, 17)
+    rng = np.random.default_rng(4)
+    Xp = X.copy()
+    Yp = Y.copy()
+    Xp[1:-1, 1:-1] += 0.02*rng.uniform(-1.0, 1.0, (19, 15))
+    Yp[1:-1, 1:-1] += 0.01*rng.uniform(-1.0, 1.0, (19, 15))
+    Xe, Ye = mesh.EllipticMesh(Xp, Yp, Control=False, Tol=1e-12)
+    assert np.allclose(Xe, X, atol=1e-9)
+    assert np.allclose(Ye, Y, atol=1e-9)
+    # The input arrays are not modified.
+    assert not np.allclose(Xp, X)
+
+
+def test_ogrid():
+    """Keep the boundaries and the wall spacing of the O-grids."""
+    X, Y = mesh.StructuredMesh("o-grid-cylinder", True, Config(81, 41),
+                               Beta=1.05)
+    Xe, Ye = mesh.EllipticMesh(X, Y)
+    for j in [0, -1]:
+        assert np.array_equal(Xe[:, j], X[:, j])
+        assert np.array_equal(Ye[:, j], Y[:, j])
+    assert np.array_equal(Xe[0], Xe[-1]) and np.array_equal(Ye[0], Ye[-1])
+    assert np.all(CellAreas(Xe, Ye) > 0.0)
+    # The control functions keep the clustering of the algebraic grid,
+    # which the Laplace equations do not.
+    ratio = WallSpacing(Xe, Ye)/WallSpacing(X, Y)
+    assert np.all(abs(ratio - 1.0) < 0.05)
+    Xl, Yl = mesh.EllipticMesh(X, Y, Control=False)
+    assert np.all(WallSpacing(Xl, Yl)/WallSpacing(X, Y) > 1.5)
+
+    X, Y = mesh.StructuredMesh("o-grid-airfoil", True, Config(121, 41),
+                               Beta=1.05)
+    Xe, Ye = mesh.EllipticMesh(X, Y)
+    assert np.array_equal(Xe[:, 0], X[:, 0])
+    assert np.array_equal(Xe[0], Xe[-1]) and np.array_equal(Ye[0], Ye[-1])
+    assert np.all(CellAreas(Xe, Ye) > 0.0)
+    assert not np.allclose(Xe, X)
+
+
+def test_bluntbody():
+    """Keep all boundaries of the grids that are not periodic."""
+    X, Y = mesh.StructuredMesh("blunt-body-cone", True, Config(61, 31),
+                               Length=3.0, Beta=1.2)
+    Xe, Ye = mesh.EllipticMesh(X, Y)
+    for Z, Ze in [(X, Xe), (Y, Ye)]:
+        assert np.array_equal(Ze[[0, -1]], Z[[0, -1]])
+        assert np.array_equal(Ze[:, [0, -1]], Z[:, [0, -1]])
+    assert np.all(CellAreas(Xe, Ye) > 0.0)
+    assert not np.allclose(Xe, X)
+
+
+def test_structuredmesh():
+    """Generate and cache the elliptic grid with StructuredMesh()."""
+    X, Y = mesh.StructuredMesh("blunt-body-ellipse", True, Config(41, 21),
+                               Beta=1.2)
+    Xe, Ye = mesh.EllipticMesh(X, Y)
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(2):
+            Xs, Ys = mesh.StructuredMesh("blunt-body-ellipse", True,
+                                         Config(41, 21), CacheDir=tmp,
+                                         Elliptic=True, Beta=1.2)
+            assert np.array_equal(Xs, Xe) and np.array_equal(Ys, Ye)
+        mesh.StructuredMesh("blunt-body-ellipse", True, Config(41, 21),
+                            CacheDir=tmp, Beta=1.2)
+        assert len(os.listdir(tmp)) == 2
+
+
+if __name__ == "__main__":
+    test_uniform()
+    print("Uniform grid test SUCCESS.")
+    test_ogrid()
+    print("O-grid test SUCCESS.")
+    test_bluntbody()
+    print("Blunt body grid test SUCCESS.")
+    test_structuredmesh()
+    print("Structured mesh test SUCCESS.")
@@ -0,0 +1,120 @@
+"""Tests for the elliptic solvers."""
+#   ***********************************************************************
+#
+#   FILE         test_ellipticsolvers.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+import nanpack.ellipticsolvers as ep
+
+
+def BC(U):
+    """Assign the Dirichlet boundary values of the test problem."""
+    U[:, 0] = 100.0
+    U[:, -1] = 0.0
+    U[0, 1:] = 0.0
+    U[-1, 1:] = 0.0
+
+    return U
+
+
+def test_redblack_pgs():
+    """Check that red-black PGS converges to the lexicographic solution."""
+    U1 = BC(np.zeros((21, 41)))
+    U2 = U1.copy()
+    for n in range(2000):
+        U1 = ep.PointGaussSeidel(U1, 1.0)
+        U2 = ep.PointGaussSeidel(U2, 1.0, Ordering="Red-Black")
+    assert np.allclose(U1, U2, rtol=0.0, atol=1e-8)
+
+
+def test_redblack_psor():
+    """Check that red-black PSOR converges to the lexicographic solution."""
+    U1 = BC(np.zeros((21, 41)))
+    U2 = U1.copy()
+    for n in range(500):
+        U1 = ep.PSOR(U1, 0.5)
+        U2 = ep.PSOR(U2, 0.5, Ordering="Red-Black")
+    assert np.allclose(U1, U2, rtol=0.0, atol=1e-8)
+
+
+def test_multigrid():
+    """Check the mesh independent convergence of the V-cycle."""
+    for iM, jM in [(33, 17), (129, 65)]:
+        for Smoother in ["Red-Black", "Zebra-Line"]:
+            U = BC(np.zeros((iM, jM)))
+            for n in range(10):
+                U = ep.MultigridV(U, 1.0, Smoother=Smoother)
+            Uo = U.copy()
+            U = ep.PointGaussSeidel(Uo, 1.0)
+            assert np.abs(U - Uo).max() < 1e-8
+
+
+def test_fullmultigrid_poisson():
+    """Compare FMG solution of Poisson's equation with the exact one."""
+    iM = 65
+    x = np.linspace(0.0, 1.0, iM)
+    dX = x[1] - x[0]
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    Uexact = np.sin(np.pi*X)*np.sin(np.pi*Y)
+    RHS = -2.0*np.pi*np.pi*Uexact*dX*dX
+    U = ep.FullMultigrid(np.zeros((iM, iM)), 1.0, nCycles=2, RHS=RHS)
+    assert np.abs(U - Uexact).max() < 5e-4
+
+
+def test_conjugategradient():
+    """Compare the PCG solution with the converged PSOR solution."""
+    U = BC(np.zeros((21, 41)))
+    Upsor = U.copy()
+    for n in range(1000):
+        Upsor = ep.PSOR(Upsor, 0.5, Ordering="Red-Black")
+    for Precond in ["SSOR", "Jacobi", "None"]:
+        Ucg = ep.ConjugateGradient(U, 0.5, Precond=Precond, Tol=1e-10)
+        assert np.allclose(Ucg, Upsor, rtol=0.0, atol=1e-6)
+        # Dirichlet boundary values are not modified
+        assert np.array_equal(Ucg[0], U[0])
+        assert np.array_equal(Ucg[:, -1], U[:, -1])
+
+
+if __name__ == "__main__":
+    test_redblack_pgs()
+    test_redblack_psor()
+    test_multigrid()
+    test_fullmultigrid_poisson()
+    test_conjugategradient()
+    print("Elliptic solvers test SUCCESS.")
@@ -0,0 +1,264 @@
+"""Tests for the hyperbolic and scalar Navier-Stokes solvers."""
+#   ***********************************************************************
+#
+#   FILE         test_hyperbolicsolvers.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+import nanpack.hyperbolicsolvers as hb
+import nanpack.scalarnssolvers as sn
+import nanpack.tvdfunctions as tvdf
+import nanpack.preprocess as pre
+from nanpack.backend.boundary import BCPlan1D
+from nanpack.backend.exceptions import InvalidValueError
+
+
+class Config:
+    """Use this class to store input parameters."""
+
+    def __init__(self, Model):
+        """Class constructor method."""
+        self.Model = Model
+
+
+def InitialCondition(iMax):
+    """Return a step profile for the 1D test cases."""
+    U = np.zeros(iMax)
+    U[0:iMax//3] = 1.0
+
+    return U
+
+
+def test_solverclasses():
+    """Compare the solver classes with the solver functions."""
+    Courant = 0.5
+    diffX = 0.2
+    Uinit = InitialCondition(41)
+    cases = []
+    for Model in ["FO_WAVE", "INV_BURGERS"]:
+        cfg = Config(Model)
+        cases += [
+            (lambda U, cfg=cfg: hb.MacCormack(cfg, U, Courant),
+             hb.MacCormackSolver(cfg, Uinit.shape, Courant)),
+            (lambda U, cfg=cfg: hb.FourthOrderRungeKutta(cfg, U, Courant),
+             hb.FourthOrderRungeKuttaSolver(cfg, Uinit.shape, Courant)),
+            (lambda U, cfg=cfg: hb.ModifiedRungeKutta(cfg, U, Courant),
+             hb.ModifiedRungeKuttaSolver(cfg, Uinit.shape, Courant)),
+            ]
+    cases += [
+        (lambda U: sn.FTCS(U, Courant, diffX),
+         sn.FTCSSolver(Uinit.shape, Courant, diffX)),
+        (lambda U: sn.MacCormack(U, Courant, diffX),
+         sn.MacCormackSolver(Uinit.shape, Courant, diffX)),
+        (lambda U: sn.ModifiedRungeKutta(U, Courant, diffX),
+         sn.ModifiedRungeKuttaSolver(Uinit.shape, Courant, diffX)),
+        ]
+    for func, solver in cases:
+        U1 = Uinit.copy()
+        U2 = Uinit.copy()
+        Unew = np.empty_like(Uinit)
+        U3 = Uinit.copy()
+        for n in range(20):
+            U1 = func(U1)
+            solver.Step(U2, Unew)
+            U2, Unew = Unew, U2
+            solver.Step(U3, U3)
+        assert np.array_equal(U1, U2)
+        assert np.array_equal(U1, U3)
+
+
+def MacCormackLoop(Uo, Courant, diffX=0.0, Model="INV_BURGERS"):
+    """Return the MacCormack solution computed point by point."""
+    iMax, = Uo.shape
+    U = Uo.copy()
+    Utemp = Uo.copy()
+    if Model == "FO_WAVE":
+        E = Uo
+        Etemp = Utemp
+    else:
+        E = Uo*Uo/2
+        Etemp = Uo.copy() if diffX else Utemp*Utemp/2
+    for i in range(1, iMax-1):
+        Utemp[i] = Uo[i] + (-Courant*(E[i+1] - E[i])
+                            + diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1]))
+        if Model != "FO_WAVE":
+            Etemp[i] = Utemp[i]*Utemp[i]/2
+        if diffX:
+            dUtemp = (-Courant*(Etemp[i]-Etemp[i-1])
+                      + diffX*(Utemp[i+1] - 2.0*Utemp[i] + Utemp[i-1]))
+            U[i] = 0.5 * (Uo[i]+Utemp[i]+dUtemp)
+        else:
+            U[i] = 0.5*((Uo[i]+Utemp[i])
+                        - Courant*(Etemp[i]-Etemp[i-1]))
+
+    return U
+
+
+def test_slicedschemes():
+    """Compare the slice based schemes with point by point loops."""
+    Courant = 0.5
+    Uinit = InitialCondition(41)
+    for Model in ["FO_WAVE", "INV_BURGERS"]:
+        cfg = Config(Model)
+        U1 = Uinit.copy()
+        U2 = Uinit.copy()
+        for n in range(20):
+            U1 = MacCormackLoop(U1, Courant, Model=Model)
+            U2 = hb.MacCormack(cfg, U2, Courant)
+        assert np.array_equal(U1, U2)
+
+    U1 = Uinit.copy()
+    U2 = Uinit.copy()
+    for n in range(20):
+        U1 = MacCormackLoop(U1, Courant, 0.2)
+        U2 = sn.MacCormack(U2, Courant, 0.2)
+    assert np.array_equal(U1, U2)
+
+    U1 = Uinit.copy()
+    U2 = Uinit.copy()
+    for n in range(20):
+        Uhalf = U1.copy()
+        U = U1.copy()
+        for i in range(1, 40):
+            Uhalf[i] = 0.5*(U1[i+1]+U1[i]) - 0.5*Courant*(U1[i+1]-U1[i])
+            U[i] = U1[i] - Courant*(Uhalf[i]-Uhalf[i-1])
+        U1 = U
+        U2 = hb.LaxWendroffMultiStep(Config("FO_WAVE"), U2, Courant)
+    assert np.array_equal(U1, U2)
+
+
+def test_tvdarray():
+    """Compare the array TVD limiter functions with the pointwise ones."""
+    Courant = 0.5
+    x = np.linspace(0.0, 1.0, 41)
+    Uo = InitialCondition(41) + 0.2*np.sin(6.0*x)
+    Uo[20:25] = 0.5  # include zero differences
+    E = Uo*Uo/2
+    options = {
+        "Harten-Yee-Upwind": ["G"],
+        "Modified-Harten-Yee-Upwind": ["G1", "G2", "G3", "G4", "G5"],
+        "Roe-Sweby-Upwind": ["G1", "G2", "G3"],
+        "Davis-Yee-Symmetric": ["G1", "G2", "G3"]
+        }
+    for LimFunction, limiters in options.items():
+        for Limiter in limiters:
+            phi = np.array([
+                tvdf.CalculateTVD(i, Uo, E, 0.1, Courant, Limiter,
+                                  LimFunction)
+                for i in range(2, 39)
+                ])
+            phiPlus, phiMinus = tvdf.CalculateTVDArray(
+                Uo, E, 0.1, Courant, Limiter, LimFunction)
+            assert np.array_equal(phi[:, 0], phiPlus)
+            assert np.array_equal(phi[:, 1], phiMinus)
+
+    # The solvers still advance the interior points only.
+    cfg = Config("INV_BURGERS")
+    U = hb.SecondOrderTVD(cfg, Uo, Courant, "Davis-Yee-Symmetric", "G1")
+    assert np.array_equal(U[[0, 1, -2, -1]], Uo[[0, 1, -2, -1]])
+    assert np.all(np.isfinite(U))
+
+
+def test_stagebc():
+    """Test the boundary conditions applied between the stages."""
+    Courant = 0.5
+    iMax = 42
+    dX = 1.0/(iMax-2)
+    x = (np.arange(iMax)-1)*dX
+    Uinit = 1.0 + 0.5*np.sin(2.0*np.pi*x)
+    Periodic = pre.CompileBC1D("PERIODIC", "PERIODIC", dX)
+    Periodic.Apply(Uinit)
+    assert Uinit[0] == Uinit[-2] and Uinit[-1] == Uinit[1]
+    cfg = Config("FO_WAVE")
+    cases = [
+        (lambda U: hb.MacCormack(cfg, U, Courant, BC=Periodic),
+         hb.MacCormackSolver(cfg, Uinit.shape, Courant, Periodic)),
+        (lambda U: hb.FourthOrderRungeKutta(cfg, U, Courant, Periodic),
+         hb.FourthOrderRungeKuttaSolver(cfg, Uinit.shape, Courant,
+                                        Periodic)),
+        (lambda U: hb.ModifiedRungeKutta(cfg, U, Courant, Periodic),
+         hb.ModifiedRungeKuttaSolver(cfg, Uinit.shape, Courant,
+                                     Periodic)),
+        ]
+    # The wave travels once around the periodic domain in 80 steps.
+    for func, solver in cases:
+        U1 = Uinit.copy()
+        U2 = Uinit.copy()
+        for n in range(80):
+            U1 = func(U1)
+            solver.Step(U2, U2)
+        assert np.array_equal(U1, U2)
+        assert np.abs(U1 - Uinit).max() < 0.02
+
+    # The viscous Burgers solvers with a zero-gradient outlet and a
+    # function as the boundary conditions at the inlet.
+    Outlet = BCPlan1D(("DIRICHLET", None), ("NEUMANN", 0.0), dX)
+
+    def Inlet(U):
+        U[0] = 1.0
+        Outlet.Apply(U)
+
+    Uinit = InitialCondition(iMax)
+    for func, solver in [
+            (lambda U: sn.MacCormack(U, Courant, 0.2, Inlet),
+             sn.MacCormackSolver(Uinit.shape, Courant, 0.2, Inlet)),
+            (lambda U: sn.ModifiedRungeKutta(U, Courant, 0.2, Inlet),
+             sn.ModifiedRungeKuttaSolver(Uinit.shape, Courant, 0.2, Inlet)),
+            ]:
+        U1 = Uinit.copy()
+        U2 = Uinit.copy()
+        for n in range(20):
+            U1 = func(U1)
+            U2 = solver.Step(U2)
+        assert np.array_equal(U1, U2)
+        assert U1[0] == 1.0 and U1[-1] == U1[-2]
+
+    try:
+        BCPlan1D("PERIODIC", "NEUMANN", dX)
+    except InvalidValueError:
+        pass
+    else:
+        raise AssertionError("InvalidValueError not raised.")
+
+
+if __name__ == "__main__":
+    test_solverclasses()
+    test_slicedschemes()
+    test_tvdarray()
+    test_stagebc()
+    print("Hyperbolic solvers test SUCCESS.")
@@ -0,0 +1,135 @@
+"""Test that all backends of the sequential kernels give the same results."""
+#   ***********************************************************************
+#
+#   FILE         test_kernels.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+import nanpack
+from nanpack.backend import kernels
+import nanpack.ellipticsolvers as es
+from nanpack.tridiagonal import TridiagonalSolver
+
+
+def AvailableBackends():
+    """Return the backends that can be selected on this machine."""
+    backends = ["python", "numpy"]
+    if kernels.numba is not None:
+        backends.append("numba")
+    return backends
+
+
+def RunBackends(func):
+    """Return the result of func() for every available backend."""
+    results = []
+    try:
+        for backend in AvailableBackends():
+            nanpack.set_backend(backend)
+            results.append(func())
+    finally:
+        nanpack.set_backend("numpy")
+    return results
+
+
+def test_pointsweeps():
+    """Compare the lexicographic PGS and PSOR sweeps of all backends."""
+    rng = np.random.default_rng(3)
+    Uo = rng.random((17, 23))
+    results = RunBackends(lambda: (es.PointGaussSeidel(Uo, 0.8),
+                                   es.PSOR(Uo, 0.8, 1.5)))
+    Upgs, Upsor = results[0]
+    # Reference point by point sweeps as in Hoffmann Vol. 1
+    B2 = 0.8*0.8
+    A = 0.5/(1.0 + B2)
+    U1 = Uo.copy()
+    U2 = Uo.copy()
+    for i in range(1, 16):
+        for j in range(1, 22):
+            U1[i][j] = A*(U1[i+1][j] + U1[i-1][j]
+                          + B2*(U1[i][j+1] + U1[i][j-1]))
+            U2[i][j] = ((1 - 1.5)*U2[i][j]
+                        + 1.5*A*(U2[i+1][j] + U2[i-1][j]
+                                 + B2*(U2[i][j+1] + U2[i][j-1])))
+    assert np.array_equal(Upgs, U1)
+    assert np.array_equal(Upsor, U2)
+    for U in results[1:]:
+        assert np.array_equal(U[0], Upgs)
+        assert np.array_equal(U[1], Upsor)
+
+
+def test_thomas():
+    """Compare the Thomas algorithm of all backends for list inputs."""
+    tMax = 30
+    rng = np.random.default_rng(4)
+    A = rng.random(tMax).tolist()
+    B = (2.0 + rng.random(tMax)).tolist()
+    C = rng.random(tMax).tolist()
+    D = rng.random(tMax).tolist()
+    UU = [1.0] + [0 for t in range(tMax-2)] + [2.0]
+    results = RunBackends(
+        lambda: TridiagonalSolver(tMax, A, B, C, D, UU.copy()))
+    for U in results:
+        assert isinstance(U, list)
+        assert U == results[0]
+
+
+def test_ogrid():
+    """Compare the O-grid interior points of all backends."""
+    iM, jM = 21, 11
+    x = np.zeros((iM, jM))
+    y = np.zeros((iM, jM))
+    theta = np.linspace(0.0, 2.0*np.pi, iM)
+    x[:, 0] = 2.0 + 0.5*np.cos(theta)
+    y[:, 0] = -0.5*np.sin(theta)
+    x[:, -1] = 2.0 + 2.0*np.cos(theta)
+    y[:, -1] = -2.0*np.sin(theta)
+    S = np.outer(np.full(iM, 1.5), np.linspace(0.0, 1.0, jM))
+    alpha = np.arctan2(np.abs(y[:, -1] - y[:, 0]), np.abs(x[:, 0] - x[:, -1]))
+    results = RunBackends(
+        lambda: kernels.ogrid_interior(x.copy(), y.copy(), S, np.cos(alpha),
+                                       np.sin(alpha), 11, 6, 16))
+    for xy in results[1:]:
+        assert np.array_equal(xy[0], results[0][0])
+        assert np.array_equal(xy[1], results[0][1])
+
+
+if __name__ == "__main__":
+    test_pointsweeps()
+    test_thomas()
+    test_ogrid()
+    print("Kernel backends test SUCCESS.")
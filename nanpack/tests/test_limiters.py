@@ -0,0 +1,119 @@
+"""Test the scalar and array TVD limiters and the limiter registry."""
+#   ***********************************************************************
+#
+#   FILE         test_limiters.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+import nanpack.limiters as lim
+import nanpack.utils as utils
+from nanpack.backend.exceptions import TVDLimiterInputError
+from nanpack.backend.exceptions import TVDLimiterFunctionInputError
+
+
+def RandomDifferences(nPts, seed=1):
+    """Return differences with both signs and exact zeros."""
+    rng = np.random.default_rng(seed)
+    dU = rng.normal(size=nPts)
+    dU[::7] = 0.0
+    return dU
+
+
+def test_arraylimiters():
+    """Compare every registered array limiter with its scalar version."""
+    dU1 = RandomDifferences(200, 1)
+    dU2 = RandomDifferences(200, 2)
+    dU3 = RandomDifferences(200, 3)
+    r = np.concatenate((dU1/0.3, [-1.0, 0.0, 0.5, 1.0, 2.0, 3.0]))
+    args = {
+        "Harten-Yee-Upwind": (dU1, dU2, dU2, dU1, 0.5, 0.1),
+        "Modified-Harten-Yee-Upwind": (dU1, dU2),
+        "Roe-Sweby-Upwind": (r,),
+        "Davis-Yee-Symmetric": (dU1, dU2, dU3)
+        }
+    for LimFunction, limiters in lim.LIMITERS.items():
+        for Limiter in limiters:
+            Scalar = lim.GetLimiter(LimFunction, Limiter, Array=False)
+            Array = lim.GetLimiter(LimFunction, Limiter)
+            a = args[LimFunction]
+            G = Array(*a)
+            nPts = len(a[0])
+            Gs = [Scalar(*[x[k] if np.ndim(x) else x for x in a])
+                  for k in range(nPts)]
+            assert np.array_equal(G, Gs)
+            # Array limiters also accept floats.
+            assert np.asarray(Array(*[x[3] if np.ndim(x) else x
+                                      for x in a])) == Gs[3]
+
+
+def test_arrayutils():
+    """Compare the array entropy correction and alpha with the scalar."""
+    Alpha = np.linspace(-0.3, 0.3, 61)
+    si = utils.EntropyCorrectionFunctionArray(Alpha, 0.1)
+    assert np.array_equal(
+        si, [utils.EntropyCorrectionFunction(a, 0.1) for a in Alpha])
+
+    U = np.array([1.0, 1.0, 0.5, -0.2, -0.2, 0.4])
+    E = U*U/2
+    dU = U[1:] - U[:-1]
+    alpha = utils.CalcAlphaArray(E[1:], E[:-1], dU, U[1:], U[:-1])
+    assert np.array_equal(alpha, [
+        utils.CalcAlpha(E[k+1], E[k], dU[k], U[k+1], U[k])
+        for k in range(5)])
+
+
+def test_getlimiter():
+    """Check that invalid inputs are reported by the registry."""
+    invalid = [
+        ("Roe-Sweby-Upwind", "G5", True, TVDLimiterInputError),
+        ("Harten-Yee-Upwind", "G1", False, TVDLimiterInputError),
+        ("Harten-Yee", "G", True, TVDLimiterFunctionInputError)
+        ]
+    for LimFunction, Limiter, Array, Error in invalid:
+        try:
+            lim.GetLimiter(LimFunction, Limiter, Array)
+        except Error:
+            pass
+        else:
+            raise AssertionError(f"{Error.__name__} not raised.")
+
+if __name__ == "__main__":
+    test_arraylimiters()
+    test_arrayutils()
+    test_getlimiter()
+    print("Limiters test SUCCESS.")
@@ -0,0 +1,127 @@
+"""Test the mesh files and the mesh cache."""
+#   ***********************************************************************
+#
+#   FILE         test_meshcache.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import configparser
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+import nanpack.meshing as mesh
+from nanpack.preprocess import RunConfig
+from nanpack.backend.exceptions import MeshFileError
+
+INPUT = os.path.join(os.path.dirname(__file__), "..", "input")
+
+
+def test_meshcache():
+    """Read the mesh from the cache for unchanged inputs."""
+    cfg = SimpleNamespace(iM=41, jM=21, dX=None, dY=None, Length=None,
+                          Height=None)
+    with tempfile.TemporaryDirectory() as tmp:
+        X1, Y1 = mesh.StructuredMesh("o-grid-cylinder", True, cfg,
+                                     CacheDir=tmp, Beta=1.05)
+        files = os.listdir(tmp)
+        assert len(files) == 1
+        Metrics1 = mesh.CalcMeshMetrics(X1, Y1)
+
+        X2, Y2 = mesh.StructuredMesh("o-grid-cylinder", True, cfg,
+                                     CacheDir=tmp, Beta=1.05)
+        assert os.listdir(tmp) == files
+        assert np.array_equal(X1, X2) and np.array_equal(Y1, Y2)
+        Metrics2 = mesh.CalcMeshMetrics(X2, Y2)
+        for A1, A2 in zip(Metrics1, Metrics2):
+            assert np.array_equal(A1, A2)
+
+        # Changed clustering gives a new mesh file.
+        X3, Y3 = mesh.StructuredMesh("o-grid-cylinder", True, cfg,
+                                     CacheDir=tmp, Beta=1.1)
+        assert len(os.listdir(tmp)) == 2
+        assert not np.array_equal(X1, X3)
+
+        # The cache directory may also be set in the config object.
+        cfg.GridCacheDir = tmp
+        X4, Y4 = mesh.StructuredMesh("o-grid-cylinder", True, cfg,
+                                     Beta=1.1)
+        assert len(os.listdir(tmp)) == 2
+        assert np.array_equal(X3, X4)
+
+
+def test_gridfromfile():
+    """Read the grid of the simulation from GRID_FNAME."""
+    Xi, Eta = np.meshgrid(np.linspace(0.0, 2.0, 21),
+                          np.linspace(0.0, 1.0, 11), indexing="ij")
+    X = Xi + 0.1*Eta
+    Y = Eta*(1.0 + 0.2*Xi)
+    with tempfile.TemporaryDirectory() as tmp:
+        fName = os.path.join(tmp, "grid.bin")
+        mesh.WriteMeshToFile(X, Y, fName)
+        X1, Y1 = mesh.ReadMeshFromFile(fName)
+        assert np.array_equal(X, X1) and np.array_equal(Y, Y1)
+        JJ = mesh.CalcMeshMetrics(X1, Y1)[4]
+        assert not JJ.flags.writeable
+
+        config = configparser.ConfigParser()
+        config.read(os.path.join(INPUT, "config.ini"))
+        config["SETUP"]["DIMENSION"] = "2D"
+        config["DOMAIN"]["LENGTH"] = "2.0"
+        config["DOMAIN"]["HEIGHT"] = "1.0"
+        config["MESH"]["GRID_FROM_FILE?"] = "YES"
+        config["MESH"]["GRID_FNAME"] = fName
+        config["OUTPUT"]["HIST_FILE_NAME"] = os.path.join(tmp, "hist.dat")
+        config["OUTPUT"]["RESULT_FNAME"] = os.path.join(tmp, "result.dat")
+        cfg = RunConfig(config)
+        assert (cfg.iMax, cfg.jMax) == (21, 11)
+        assert np.isclose(cfg.dX, 0.1) and np.isclose(cfg.dY, 0.1)
+        assert np.array_equal(cfg.X, X) and cfg.U.shape == X.shape
+
+        with open(fName, "wb") as f:
+            f.write(b"not a mesh")
+        try:
+            mesh.ReadMeshFromFile(fName)
+            raise AssertionError("MeshFileError not raised.")
+        except MeshFileError:
+            pass
+
+
+if __name__ == "__main__":
+    test_meshcache()
+    test_gridfromfile()
+    print("Mesh cache test SUCCESS.")
@@ -0,0 +1,112 @@
+"""Test the grid metrics and Jacobian of the transformation."""
+#   ***********************************************************************
+#
+#   FILE         test_meshmetrics.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import numpy as np
+
+import nanpack.meshing as mesh
+from nanpack.backend import meshmetrics
+
+
+def QuadraticGrid(iMax, jMax):
+    """Return a skewed grid with quadratic coordinates of Xi, Eta."""
+    Xi, Eta = np.meshgrid(np.arange(iMax, dtype=float),
+                          np.arange(jMax, dtype=float), indexing="ij")
+    X = 2.0*Xi + 0.3*Eta + 0.05*Xi*Xi
+    Y = 0.2*Xi + 1.5*Eta + 0.02*Eta*Eta
+
+    return X, Y, Xi, Eta
+
+
+def test_metrics2d():
+    """Compare the metrics with the exact values of a quadratic grid."""
+    X, Y, Xi, Eta = QuadraticGrid(21, 17)
+    # The second-order differences are exact for quadratic coordinates.
+    XXi = 2.0 + 0.1*Xi
+    XEta = 0.3
+    YXi = 0.2
+    YEta = 1.5 + 0.04*Eta
+    JJ = 1.0/(XXi*YEta - YXi*XEta)
+    XiX, XiY, EtaX, EtaY, JJc = meshmetrics.metrics_2d(X, Y)
+    assert np.allclose(JJc, JJ)
+    assert np.allclose(XiX, JJ*YEta)
+    assert np.allclose(XiY, -JJ*XEta)
+    assert np.allclose(EtaX, -JJ*YXi)
+    assert np.allclose(EtaY, JJ*XXi)
+
+    # Step sizes of the computational grid
+    Metrics = meshmetrics.MeshMetrics(X.shape, 0.5, 2.0).Compute(X, Y)
+    assert np.allclose(Metrics.XXi, XXi/0.5)
+    assert np.allclose(Metrics.YEta, YEta/2.0)
+
+
+def test_metrics1d():
+    """Compare the 1D metrics with the exact values."""
+    Xi = np.arange(31, dtype=float)
+    X = 0.1*Xi + 0.004*Xi*Xi
+    XiX, JJ = meshmetrics.metrics_1d(X)
+    assert np.allclose(JJ, 1.0/(0.1 + 0.008*Xi))
+    assert np.array_equal(XiX, JJ)
+
+
+def test_cachedmetrics():
+    """Reuse the metrics of an unchanged grid."""
+    X, Y, Xi, Eta = QuadraticGrid(21, 17)
+    Metrics1 = mesh.CalcMeshMetrics(X, Y)
+    Metrics2 = mesh.CalcMeshMetrics(X.copy(), Y.copy())
+    for A1, A2 in zip(Metrics1, Metrics2):
+        assert A1 is A2
+        assert not A1.flags.writeable
+    assert np.array_equal(Metrics1[4], meshmetrics.metrics_2d(X, Y)[4])
+
+    # A modified grid gives new metrics.
+    Y[3, 4] += 0.1
+    Metrics3 = mesh.CalcMeshMetrics(X, Y)
+    assert Metrics3[4] is not Metrics1[4]
+    assert np.array_equal(Metrics3[4], meshmetrics.metrics_2d(X, Y)[4])
+
+    XiX1, JJ1 = mesh.CalcMeshMetrics1D(X[:, 0])
+    XiX2, JJ2 = mesh.CalcMeshMetrics1D(X[:, 0].copy())
+    assert JJ1 is JJ2
+
+
+if __name__ == "__main__":
+    test_metrics2d()
+    test_metrics1d()
+    test_cachedmetrics()
+    print("Mesh metrics test SUCCESS.")
@@ -0,0 +1,81 @@
+"""Tests for the parabolic solvers."""
+#   ***********************************************************************
+#
+#   FILE         test_parabolicsolvers.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+import nanpack.parabolicsolvers as pb
+
+
+def test_adisolver():
+    """Compare the ADISolver time steps with the ADI function."""
+    rng = np.random.default_rng(3)
+    U1 = rng.uniform(0.0, 1.0, (17, 11))
+    U2 = U1.copy()
+    U3 = U1.copy()
+    Unew = np.empty_like(U1)
+    adi = pb.ADISolver(U1.shape, 0.4, 0.7)
+    for n in range(10):
+        U1 = pb.ADI(U1, 0.4, 0.7)
+        # ping-pong buffers
+        adi.Step(U2, Unew)
+        U2, Unew = Unew, U2
+        # in-place update
+        adi.Step(U3, U3)
+    assert np.array_equal(U1, U2)
+    assert np.array_equal(U1, U3)
+
+
+def test_ftcssolver():
+    """Compare the FTCSSolver time steps with the FTCS function."""
+    rng = np.random.default_rng(7)
+    for shape, diff in [((31,), (0.4,)), ((15, 12), (0.2, 0.25))]:
+        U1 = rng.uniform(0.0, 1.0, shape)
+        U2 = U1.copy()
+        ftcs = pb.FTCSSolver(shape, *diff)
+        for n in range(10):
+            U1 = pb.FTCS(U1, *diff)
+        ftcs.Run(U2, 10)
+        assert np.array_equal(U1, U2)
+
+
+if __name__ == "__main__":
+    test_adisolver()
+    test_ftcssolver()
+    print("Parabolic solvers test SUCCESS.")
@@ -0,0 +1,328 @@
+"""Test writing and reading the solution files."""
+#   ***********************************************************************
+#
+#   FILE         test_postprocess.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+import nanpack.postprocess as pp
+from nanpack.preprocess import RunConfig
+from nanpack.backend.exceptions import LogFormatInputError, RestartFileError
+from nanpack.backend.exceptions import ResidualNormInputError
+from nanpack.backend.exceptions import ResidualTypeInputError
+from nanpack.backend.snapshots import SnapshotArchive
+from nanpack.backend.solutionio import load_solution, read_binary_header
+
+
+def test_binarysolution():
+    """Compare the binary solution file with the text solution file."""
+    rng = np.random.default_rng(5)
+    U = rng.random((13, 9))
+    with tempfile.TemporaryDirectory() as tmp:
+        txtFile = os.path.join(tmp, "solution.dat")
+        binFile = os.path.join(tmp, "solution.bin")
+        pp.WriteSolutionToFile(U, 20, 10, 100, txtFile, 0.1, 0.2)
+        pp.WriteSolutionToFile(U, 20, 10, 100, binFile, 0.1, 0.2,
+                               Format="Binary")
+        Ubin = pp.ReadSolutionFromFile(binFile)
+        assert isinstance(Ubin, np.memmap)
+        assert np.array_equal(Ubin, U)
+        info = read_binary_header(binFile)
+        assert info["Shape"] == (13, 9)
+        assert info["n"] == 20
+        assert info["dX"] == 0.1 and info["dY"] == 0.2
+
+        # Both formats give the same grid and solution to the text precision
+        (X, Y), Utxt = load_solution(txtFile)
+        (Xb, Yb), Ub = load_solution(binFile)
+        assert np.allclose(Utxt, Ub, rtol=1e-8)
+        assert np.allclose(X, Xb) and np.allclose(Y, Yb)
+        del Ubin, Ub
+
+        # 1D solution, not written at n % nWrite != 0
+        u = rng.random(11)
+        pp.WriteSolutionToFile(u, 5, 10, 100, binFile, 0.5, Format="Binary")
+        assert read_binary_header(binFile)["Shape"] == (13, 9)
+        pp.WriteSolutionToFile(u, 10, 10, 100, binFile, 0.5, Format="Binary")
+        (x,), ub = load_solution(binFile)
+        assert np.array_equal(ub, u)
+        assert np.array_equal(x, 0.5*np.arange(11))
+        del ub
+
+
+def test_snapshotarchive():
+    """Append snapshots to an archive and read them back lazily."""
+    rng = np.random.default_rng(7)
+    Us = rng.random((40, 6, 5))
+    with tempfile.TemporaryDirectory() as tmp:
+        fName = os.path.join(tmp, "run_snapshots.bin")
+        cfg = SimpleNamespace(SaveforAnim="YES", nAnime=5,
+                              AnimFileName=fName, Model="DIFFUSION",
+                              dT=0.01, dX=0.1, dY=0.2)
+        Archive = None
+        for n in range(0, 100):
+            Archive = pp.WriteSnapshotToArchive(cfg, Us[n//5], n, Archive)
+        Archive.Close()
+
+        Archive = pp.ReadSnapshotsFromFile(fName)
+        assert len(Archive) == 20
+        assert np.array_equal(Archive.Steps, np.arange(0, 100, 5))
+        assert np.allclose(Archive.Times, 0.01*np.arange(0, 100, 5))
+        assert Archive.shape == (6, 5)
+        assert Archive.dX == 0.1 and Archive.dY == 0.2
+        assert isinstance(Archive.Read(3), np.memmap)
+        assert np.array_equal(Archive.Read(3), Us[3])
+        assert np.array_equal(Archive.Read(-1), Us[19])
+        assert np.array_equal(Archive.ReadStep(45), Us[9])
+        try:
+            Archive.ReadStep(46)
+            raise AssertionError("KeyError not raised.")
+        except KeyError:
+            pass
+
+        # Reopen the archive and append past the preallocated chunk
+        with SnapshotArchive(fName, "a") as Archive:
+            for k in range(20, 40):
+                Archive.Append(5*k, 0.05*k, Us[k])
+            assert np.array_equal(Archive.Read(30), Us[30])
+        Archive = pp.ReadSnapshotsFromFile(fName)
+        assert len(Archive) == 40
+        assert np.array_equal(Archive.Read(39), Us[39])
+
+        # 1D snapshots and SAVE_FOR_ANIM? = NO
+        u = rng.random(11)
+        with SnapshotArchive(fName, "w", shape=u.shape, dX=0.5) as Archive:
+            Archive.Append(0, 0.0, u)
+        assert np.array_equal(pp.ReadSnapshotsFromFile(fName).Read(0), u)
+        cfg.SaveforAnim = "NO"
+        assert pp.WriteSnapshotToArchive(cfg, u, 0) is None
+
+
+def test_asyncwriter():
+    """Compare the files written in the background with direct writes."""
+    rng = np.random.default_rng(9)
+    U = rng.random((8, 7))
+    cfg = SimpleNamespace(nDisplay=2, nMax=10, State="TRANSIENT",
+                          totTime=1.0, ConvCrit=-0.01)
+    with tempfile.TemporaryDirectory() as tmp:
+        sync = os.path.join(tmp, "sync")
+        bg = os.path.join(tmp, "async")
+        with pp.AsyncWriter(MaxQueue=2) as writer:
+            for n in range(0, 11):
+                U[0, 0] = n
+                pp.WriteSolutionToFile(U, n, 5, 10, sync + ".dat", 0.1, 0.2)
+                writer.WriteSolutionToFile(U, n, 5, 10, bg + ".dat", 0.1,
+                                           0.2)
+                U[0, 0] = -1.0  # the writer keeps a copy of U
+                pp.WriteConvHistToFile(cfg, n, 1.0/(n + 1), sync + ".hist")
+                writer.WriteConvHistToFile(cfg, n, 1.0/(n + 1),
+                                           bg + ".hist")
+        for ext in [".dat", ".hist"]:
+            with open(sync + ext) as f1, open(bg + ext) as f2:
+                assert f1.read() == f2.read()
+
+        # The error of a request is raised by Flush()
+        writer = pp.AsyncWriter()
+        writer.Submit(open, os.path.join(tmp, "missing", "file.dat"), "w")
+        try:
+            writer.Flush()
+            raise AssertionError("FileNotFoundError not raised.")
+        except FileNotFoundError:
+            pass
+        writer.Close()
+        writer.Close()
+
+
+def test_convergencelog():
+    """Write the convergence log in all formats and read it back."""
+    rng = np.random.default_rng(11)
+    R = rng.random((12, 6, 5)) - 0.5
+    Errors = 0.5**np.arange(12)
+    cfg = SimpleNamespace(nDisplay=1, nMax=20, State="STEADY",
+                          ConvCrit=1e-3, HistFileName=None)
+    with tempfile.TemporaryDirectory() as tmp:
+        for Format in ["Text", "CSV", "Binary"]:
+            fName = os.path.join(tmp, "hist." + Format)
+            with pp.ConvergenceLog(cfg, fName, Format=Format,
+                                   BufferSize=4) as log:
+                for n in range(0, 12):
+                    log.Log(n, Errors[n], R[n])
+            hist = pp.ReadConvHistFromFile(fName)
+            assert np.array_equal(hist["n"], np.arange(12))
+            rtol = 1e-8 if Format == "Text" else 0.0
+            assert np.allclose(hist["Error"], Errors, rtol=rtol, atol=1e-8)
+            assert np.allclose(hist["L1"], np.abs(R).sum(axis=(1, 2)),
+                               rtol=rtol)
+            assert np.allclose(hist["L2"],
+                               np.sqrt((R**2).sum(axis=(1, 2))), rtol=rtol)
+            assert np.allclose(hist["Linf"], np.abs(R).max(axis=(1, 2)),
+                               rtol=rtol)
+        with open(os.path.join(tmp, "hist.Text")) as f:
+            assert "CONVERGED SOLUTION OBTAINED" in f.read()
+
+        # Rows every nDisplay iterations, logs of WriteConvHistToFile()
+        cfg.nDisplay = 5
+        fName = os.path.join(tmp, "hist.dat")
+        log = pp.ConvergenceLog(cfg, fName)
+        for n in range(1, 12):
+            log.Log(n, Errors[n])
+            pp.WriteConvHistToFile(cfg, n, Errors[n], fName + ".old")
+        log.Close()
+        hist = pp.ReadConvHistFromFile(fName)
+        old = pp.ReadConvHistFromFile(fName + ".old")
+        assert np.array_equal(hist["n"], [5, 10, 11])
+        assert np.array_equal(old["n"], [5, 10])
+        assert np.allclose(old["Error"], hist["Error"][:2])
+        assert np.isnan(hist["L2"]).all() and np.isnan(old["L2"]).all()
+
+        try:
+            pp.ConvergenceLog(cfg, fName, Format="HDF5")
+            raise AssertionError("LogFormatInputError not raised.")
+        except LogFormatInputError:
+            pass
+
+
+def test_restart():
+    """Continue a simulation from a checkpoint written at a time step."""
+    cfgFile = os.path.join(os.path.dirname(__file__), "..", "input",
+                           "config.ini")
+    with open(cfgFile) as f:
+        text = f.read().replace("5.0", "0.001")
+    rng = np.random.default_rng(13)
+    with tempfile.TemporaryDirectory() as tmp:
+        chkFile = os.path.join(tmp, "restart.bin")
+        coldFile = os.path.join(tmp, "cold.ini")
+        with open(coldFile, "w") as f:
+            f.write(text.replace("RESTART_FNAME \t=   none",
+                                 f"RESTART_FNAME \t=   {chkFile}"))
+        cfg = RunConfig(coldFile)
+        assert cfg.nStart == 0 and cfg.Uo2 is None
+        U = rng.random(cfg.U.shape)
+        Uo2 = rng.random(cfg.U.shape)
+        pp.WriteCheckpointToFile(cfg, U, 15, Uo2)
+        assert not os.path.exists(chkFile)
+        pp.WriteCheckpointToFile(cfg, U, 20, Uo2)
+
+        restartFile = os.path.join(tmp, "restart.ini")
+        text = text.replace("COLD-START", "RESTART")
+        with open(restartFile, "w") as f:
+            f.write(text.replace("RESTART_FILE\t=   none",
+                                 f"RESTART_FILE\t=   {chkFile}"))
+        cfg2 = RunConfig(restartFile)
+        assert cfg2.nStart == 20
+        assert cfg2.StartTime == 20*cfg.dT
+        assert np.array_equal(cfg2.U, U)
+        assert np.array_equal(cfg2.Uo2, Uo2)
+
+        # A checkpoint of a different simulation setup is rejected
+        with open(restartFile, "w") as f:
+            f.write(text.replace("RESTART_FILE\t=   none",
+                                 f"RESTART_FILE\t=   {chkFile}")
+                    .replace("2.17e-4", "1.0e-4"))
+        try:
+            RunConfig(restartFile)
+            raise AssertionError("RestartFileError not raised.")
+        except RestartFileError:
+            pass
+
+
+def test_residualnorm():
+    """Compare the residual norms with the error functions and loops."""
+    rng = np.random.default_rng(17)
+    for shape in [(15,), (9, 12)]:
+        U = rng.random(shape)
+        Uold = rng.random(shape)
+        index = (slice(1, -1),)*len(shape)
+        diff = (U - Uold)[index]
+        assert pp.ResidualNorm(U, Uold) == pp.AbsoluteError(U, Uold)
+        assert np.isclose(pp.ResidualNorm(U, Uold, "L2"),
+                          np.sqrt((diff**2).sum()))
+        assert pp.ResidualNorm(U, Uold, "Linf") == abs(diff).max()
+        assert U.shape == shape  # U and Uold are not modified
+        assert np.isscalar(pp.LInfNormError(U, Uold))
+
+    # Laplace residual against a loop over the interior points
+    U = rng.random((9, 12))
+    for Beta in [1.0, 0.5]:
+        R = 0.0
+        for i in range(1, 8):
+            for j in range(1, 11):
+                R += abs(U[i+1, j] + U[i-1, j] + Beta**2*(U[i, j+1]
+                         + U[i, j-1]) - 2.0*(1.0 + Beta**2)*U[i, j])
+        assert np.isclose(pp.ResidualNorm(U, Residual="Laplace",
+                                          Beta=Beta), R)
+    u = np.linspace(0.0, 1.0, 11)**2
+    assert np.isclose(pp.ResidualNorm(u, Norm="Linf",
+                                      Residual="Laplace"), 0.02)
+
+    # Strided and adaptive evaluation
+    monitor = pp.ResidualMonitor(U.shape, nCheck=5)
+    assert not monitor.Due(4) and monitor.Due(5)
+    monitor.Evaluate(5, U, Uold=U)
+    assert monitor.nNext == 10
+    monitor = pp.ResidualMonitor(U.shape, Adaptive=True, Tol=1e-6,
+                                 nCheck=1, nCheckMax=50)
+    monitor.Evaluate(1, U, 0.9*U)
+    monitor.Evaluate(2, U, 0.99*U)  # residual reduced 10 times per step
+    assert monitor.nNext == 2 + 2
+    monitor.Evaluate(4, U, (1.0 - 1e-9)*U)
+    assert monitor.nNext == 5
+    try:
+        pp.ResidualMonitor(U.shape, Norm="L3")
+        raise AssertionError("ResidualNormInputError not raised.")
+    except ResidualNormInputError:
+        pass
+    try:
+        pp.ResidualMonitor(U.shape, Residual="Poisson")
+        raise AssertionError("ResidualTypeInputError not raised.")
+    except ResidualTypeInputError:
+        pass
+
+
+if __name__ == "__main__":
+    test_binarysolution()
+    test_snapshotarchive()
+    test_asyncwriter()
+    test_convergencelog()
+    test_restart()
+    test_residualnorm()
+    print("Postprocess test SUCCESS.")
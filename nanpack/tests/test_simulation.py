@@ -0,0 +1,164 @@
+"""Test the simulation driver."""
+#   ***********************************************************************
+#
+#   FILE         test_simulation.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import configparser
+import os
+import tempfile
+
+import numpy as np
+
+import nanpack.ellipticsolvers as ep
+import nanpack.parabolicsolvers as pb
+import nanpack.postprocess as pp
+from nanpack.preprocess import RunConfig
+from nanpack.simulation import Simulation
+from nanpack.backend.boundary import BC2D
+from nanpack.backend.exceptions import SimulationHookInputError
+
+INPUT = os.path.join(os.path.dirname(__file__), "..", "input")
+
+
+def Config(tmp, options=None):
+    """Return the configuration of a test case with outputs in tmp."""
+    options = {} if options is None else options
+    config = configparser.ConfigParser()
+    config.read(os.path.join(INPUT, "config.ini"))
+    config["MESH"]["dX"] = "0.001"
+    config["OUTPUT"]["HIST_FILE_NAME"] = os.path.join(tmp, "hist.dat")
+    config["OUTPUT"]["RESULT_FNAME"] = os.path.join(tmp, "result.dat")
+    for (section, option), value in options.items():
+        config[section][option] = str(value)
+    return config
+
+
+def test_transient():
+    """Compare the driver with the hand-written loop of the scheme."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = RunConfig(Config(tmp))
+        cfg.U[0] = 1.0
+        U = cfg.U.copy()
+        for n in range(1, cfg.nMax + 1):
+            U = pb.FTCS(U.copy(), cfg.CFL)
+
+        steps = []
+        sim = Simulation(cfg, nCheck=7)
+        sim.AddHook("PostStep", lambda s: steps.append(s.n))
+        Usim = sim.Run(pb.FTCS, cfg.CFL)
+        assert np.array_equal(Usim, U)
+        assert steps == list(range(1, cfg.nMax + 1))
+        assert np.isclose(sim.Time, cfg.nMax*cfg.dT)
+        assert np.allclose(pp.ReadSolutionFromFile(cfg.OutFileName), U)
+        hist = pp.ReadConvHistFromFile(cfg.HistFileName)
+        assert hist["n"][-1] == cfg.nMax
+
+        # A Stepper advances the solution in the driver buffers
+        sim = Simulation(cfg)
+        ftcs = pb.FTCSSolver(cfg.U.shape, cfg.CFL)
+        assert np.array_equal(sim.Run(ftcs), U)
+
+        try:
+            sim.AddHook("AfterStep", print)
+            raise AssertionError("SimulationHookInputError not raised.")
+        except SimulationHookInputError:
+            pass
+
+
+def test_restart():
+    """Continue a three-level scheme from a checkpoint."""
+    with tempfile.TemporaryDirectory() as tmp:
+        chk = os.path.join(tmp, "restart.bin")
+        cfg = RunConfig(Config(tmp))
+        cfg.U[0] = 1.0
+        U = Simulation(cfg).Run(pb.DuFortFrankel, cfg.CFL, ThreeLevel=True)
+
+        cfg1 = RunConfig(Config(tmp, {("STOP", "SIM_TIME"): 0.5,
+                                      ("OUTPUT", "RESTART_FNAME"): chk}))
+        cfg1.U[0] = 1.0
+        Simulation(cfg1).Run(pb.DuFortFrankel, cfg.CFL, ThreeLevel=True)
+        cfg2 = RunConfig(Config(tmp, {("IC", "START_OPT"): "RESTART",
+                                      ("IC", "RESTART_FILE"): chk}))
+        assert 0 < cfg2.nStart == cfg1.nMax < cfg.nMax
+        sim = Simulation(cfg2)
+        Urestart = sim.Run(pb.DuFortFrankel, cfg.CFL, ThreeLevel=True)
+        assert sim.n == cfg.nMax
+        assert np.array_equal(Urestart, U)
+
+
+def test_steady():
+    """Solve the Laplace equation until convergence."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = RunConfig(Config(tmp, {
+            ("SETUP", "STATE"): "STEADY", ("SETUP", "MODEL"): "LAPLACE",
+            ("SETUP", "DIMENSION"): "2D", ("DOMAIN", "LENGTH"): 1.0,
+            ("DOMAIN", "HEIGHT"): 1.0, ("MESH", "dX"): 0.1,
+            ("MESH", "dY"): 0.1, ("BC", "BC_FROM_FILE?"): "YES",
+            ("BC", "BC_FILE_NAME"): os.path.join(INPUT, "bc.ini"),
+            ("STOP", "CONV_CRIT"): 1e-4}))
+        U = cfg.U.copy()
+        n = 0
+        Error = 1.0
+        while n < cfg.nMax and Error > cfg.ConvCrit:
+            n = n + 1
+            Uold = U.copy()
+            U = ep.PointGaussSeidel(Uold, 1.0)
+            Error = pp.AbsoluteError(U, Uold)
+            U = BC2D(U, cfg.BC, cfg.dX, cfg.dY)
+
+        sim = Simulation(cfg)
+        Usim = sim.Run(ep.PointGaussSeidel, 1.0)
+        assert sim.n == n
+        assert np.array_equal(Usim, U)
+        assert np.allclose(pp.ReadSolutionFromFile(cfg.OutFileName), U)
+
+        # Linf norm of the Laplace residual evaluated every 10 iterations
+        monitor = pp.ResidualMonitor(cfg.U.shape, "Linf", "Laplace",
+                                     nCheck=10)
+        sim = Simulation(cfg, Monitor=monitor)
+        Usim = sim.Run(ep.PointGaussSeidel, 1.0)
+        assert sim.n % 10 == 0
+        assert sim.Error < cfg.ConvCrit
+        assert pp.ResidualNorm(Usim, Norm="Linf",
+                               Residual="Laplace") == sim.Error
+
+
+if __name__ == "__main__":
+    test_transient()
+    test_restart()
+    test_steady()
+    print("Simulation test SUCCESS.")
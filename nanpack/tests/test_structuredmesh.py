@@ -0,0 +1,129 @@
+"""Test the structured mesh generators of the geometry templates."""
+#   ***********************************************************************
+#
+#   FILE         test_structuredmesh.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+import nanpack.meshing as mesh
+
+
+def Config(iM, jM, Length=None, Height=None):
+    """Return the grid size and domain settings."""
+    dX = Length/(iM-1) if Length else None
+    dY = Height/(jM-1) if Height else None
+    return SimpleNamespace(iM=iM, jM=jM, dX=dX, dY=dY, Length=Length,
+                           Height=Height)
+
+
+def test_ogrid():
+    """Place the O-grid lines between the inner and outer boundaries."""
+    for ClustOpt in [True, False]:
+        X, Y = mesh.StructuredMesh("o-grid-cylinder", ClustOpt,
+                                   Config(41, 21), Beta=1.05,
+                                   outRad=3.0, inRad=1.0)
+        R = np.hypot(X - 3.0, Y)
+        assert np.allclose(R[:, 0], 1.0)
+        assert np.allclose(R[:, -1], 3.0)
+        # The points of each line i are ordered from inner to outer.
+        assert np.all(np.diff(R, axis=1) > 0.0)
+        assert np.allclose(X[0], X[-1]) and np.allclose(Y[0], Y[-1])
+
+    X, Y = mesh.StructuredMesh("o-grid-airfoil", True, Config(41, 21),
+                               Beta=1.1, Chord=1.0, Thickness=0.12)
+    # NACA 00xx thickness distribution at the airfoil surface
+    x = X[0:20, 0] - 2.5
+    yt = 0.6*(0.2969*np.sqrt(x) - 0.126*x - 0.3516*x**2 + 0.2843*x**3
+              - 0.1015*x**4)
+    assert np.allclose(Y[0:20, 0], -yt)
+    assert np.allclose(np.hypot(X[:, -1] - 3.0, Y[:, -1]), 3.0)
+
+
+def test_bluntbody():
+    """Place the blunt body grid on the inner and outer ellipses."""
+    iM, jM = 31, 15
+    X, Y = mesh.StructuredMesh("blunt-body-ellipse", True, Config(iM, jM),
+                               Beta=1.2)
+    dalp = -math.pi/(3 - 2*iM)
+    for i in [0, 7, 30]:
+        thet = (iM - i - 1)*dalp
+        for j, a, b in [(0, 3.0, 2.0), (-1, 4.0, 3.5)]:
+            r = 1.0/math.sqrt(math.sin(thet)**2/a**2
+                              + math.cos(thet)**2/b**2)
+            assert math.isclose(X[i, j], 4.0 - r*math.sin(thet))
+            assert math.isclose(Y[i, j], r*math.cos(thet))
+    # Straight grid lines between the boundaries
+    cross = ((X[:, 1:-1] - X[:, 0:1])*(Y[:, -1:] - Y[:, 0:1])
+             - (Y[:, 1:-1] - Y[:, 0:1])*(X[:, -1:] - X[:, 0:1]))
+    assert np.allclose(cross, 0.0)
+
+    X, Y = mesh.StructuredMesh("blunt-body-cone", False, Config(iM, jM),
+                               Length=3.0)
+    assert np.allclose(np.diff(X[:, :], axis=1), np.diff(X[:, 0:2], axis=1))
+
+
+def test_rectangular():
+    """Compare the rectangular templates with the uniform grid points."""
+    cfg = Config(21, 11, 2.0, 1.0)
+    X, Y = mesh.StructuredMesh("duct", False, cfg)
+    for i in range(21):
+        for j in range(11):
+            assert X[i, j] == i*cfg.dX and Y[i, j] == j*cfg.dY
+
+    X, Y = mesh.StructuredMesh("cavity", True, cfg, BetaX=1.2, BetaY=1.1)
+    assert X[0, 0] == 0.0 and X[-1, -1] == 2.0 and Y[-1, -1] == 1.0
+    assert np.all(X == X[:, 0:1]) and np.all(Y[1:-1] == Y[0:1])
+    assert np.all(np.diff(X[:, 0]) > 0.0) and np.all(np.diff(Y[0]) > 0.0)
+
+    X, Y = mesh.StructuredMesh("duct", True, cfg, BetaX=1.2)
+    y = 0.0
+    for j in range(1, 10):
+        y = y + cfg.dY
+        assert np.all(Y[:, j] == y)
+
+    X = mesh.StructuredMesh1D("left", Beta=1.1, dX=0.1, iM=21)
+    assert X[0] == 0.0 and math.isclose(X[-1], 2.0)
+
+
+if __name__ == "__main__":
+    test_ogrid()
+    test_bluntbody()
+    test_rectangular()
+    print("Structured mesh test SUCCESS.")
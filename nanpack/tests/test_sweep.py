@@ -0,0 +1,97 @@
+"""Test the parameter sweep runner."""
+#   ***********************************************************************
+#
+#   FILE         test_sweep.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+
+import os
+import tempfile
+
+import nanpack.parabolicsolvers as pb
+import nanpack.postprocess as pp
+from nanpack.sweep import RunSweep
+
+
+def DiffusionCase(cfg):
+    """Run the FTCS solution of the case for 20 time steps."""
+    U = cfg.U.copy()
+    U[0] = cfg.WallValue
+    for n in range(1, 21):
+        Uold = U.copy()
+        U = pb.FTCS(Uold, cfg.CFL)
+        Error = pp.AbsoluteError(U, Uold)
+        pp.WriteSolutionToFile(U, n, 10, 20, cfg.OutFileName, cfg.dX)
+    return n, Error
+
+
+def test_sweep():
+    """Run the sweep cases in parallel and in this process."""
+    cfgFile = os.path.join(os.path.dirname(__file__), "..", "input",
+                           "config.ini")
+    Grid = {"CONST.CFL": [0.25, 0.5], "MESH.DX": [0.002, 0.001],
+            "WallValue": [1.0]}
+    with tempfile.TemporaryDirectory() as tmp:
+        Summary = RunSweep(cfgFile, Grid, DiffusionCase,
+                           OutDir=os.path.join(tmp, "par"), MaxWorkers=2)
+        Serial = RunSweep(cfgFile, Grid, DiffusionCase,
+                          OutDir=os.path.join(tmp, "ser"), MaxWorkers=1)
+        assert len(Summary) == 4
+        for par, ser in zip(Summary, Serial):
+            assert par["Status"] == "OK"
+            assert par["Steps"] == 20
+            assert par["Error"] == ser["Error"]
+            assert par["Params"] == ser["Params"]
+        assert Summary[1]["Params"] == {"CONST.CFL": 0.25, "MESH.DX": 0.001,
+                                        "WallValue": 1.0}
+        # Larger diffusion number gives larger changes per step
+        assert Summary[2]["Error"] > Summary[0]["Error"]
+        for k in range(4):
+            caseDir = os.path.join(tmp, "par", f"case-{k:03d}")
+            assert os.path.exists(os.path.join(caseDir, "config.ini"))
+            assert os.path.exists(os.path.join(caseDir, "ftcs1D.dat"))
+        assert os.path.exists(os.path.join(tmp, "par", "summary.dat"))
+
+        # A failing case is reported in the summary
+        Grid["CONST.CFL"] = ["abc"]
+        Failed = RunSweep(cfgFile, Grid, DiffusionCase,
+                          OutDir=os.path.join(tmp, "fail"), MaxWorkers=1)
+        assert Failed[0]["Status"].startswith("ValueError")
+        assert Failed[0]["Steps"] is None
+
+
+if __name__ == "__main__":
+    test_sweep()
+    print("Sweep test SUCCESS.")
@@ -0,0 +1,105 @@
+"""Tests for the tridiagonal solvers."""
+#   ***********************************************************************
+#
+#   FILE         test_tridiagonal.py
+#
+#   AUTHOR       Dr. Vishal Sharma
+#
+#   VERSION      1.0.0-alpha5
+#
+#   WEBSITE      https://github.com/vxsharma-14/project-NAnPack
+#
+#   NAnPack Learner's Edition is distributed under the MIT License.
+#
+#   Copyright (c) 2022 Vishal Sharma
+#
+#   Permission is hereby granted, free of charge, to any person
+#   obtaining a copy of this software and associated documentation
+#   files (the "Software"), to deal in the Software without restriction,
+#   including without limitation the rights to use, copy, modify, merge,
+#   publish, distribute, sublicense, and/or sell copies of the Software,
+#   and to permit persons to whom the Software is furnished to do so,
+#   subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be
+#   included in all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#   EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+#   OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+#   NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+#   BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+#   ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+#   CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#   SOFTWARE.
+#
+#   You should have received a copy of the MIT License along with
+#   NAnPack Learner's Edition.
+#
+#   ***********************************************************************
+
+import numpy as np
+
+from nanpack.tridiagonal import TridiagonalSolver, BatchTridiagonalSolver
+from nanpack.tridiagonal import CyclicBatchTridiagonalSolver
+
+
+def test_batchtridiagonal():
+    """Compare the batched solver with the single line solver."""
+    rng = np.random.default_rng(14)
+    nSys, tMax = 7, 25
+    A = rng.uniform(-1.0, -0.1, (nSys, tMax))
+    B = rng.uniform(3.0, 4.0, (nSys, tMax))
+    C = rng.uniform(-1.0, -0.1, (nSys, tMax))
+    D = rng.uniform(-1.0, 1.0, (nSys, tMax))
+    UU = rng.uniform(0.0, 1.0, (nSys, tMax))
+
+    Ubatch = BatchTridiagonalSolver(A, B, C, D, UU.copy())
+    for s in range(nSys):
+        Uline = TridiagonalSolver(tMax, A[s], B[s], C[s], D[s],
+                                  UU[s].copy())
+        assert np.array_equal(Ubatch[s], Uline)
+
+
+def test_batchtridiagonal_1dcoeffs():
+    """Check the broadcasting of coefficients shared by all lines."""
+    rng = np.random.default_rng(5)
+    nSys, tMax = 4, 11
+    A = np.full(tMax, -0.5)
+    B = np.full(tMax, 2.0)
+    C = np.full(tMax, -0.5)
+    D = rng.uniform(-1.0, 1.0, (nSys, tMax))
+    UU = rng.uniform(0.0, 1.0, (nSys, tMax))
+
+    Ubatch = BatchTridiagonalSolver(A, B, C, D, UU.copy())
+    for s in range(nSys):
+        Uline = TridiagonalSolver(tMax, A, B, C, D[s], UU[s].copy())
+        assert np.array_equal(Ubatch[s], Uline)
+    # The boundary values are left untouched
+    assert np.array_equal(Ubatch[:, 0], UU[:, 0])
+    assert np.array_equal(Ubatch[:, -1], UU[:, -1])
+
+
+def test_cyclictridiagonal():
+    """Compare the periodic solver with the dense matrix solution."""
+    rng = np.random.default_rng(21)
+    nSys, tMax = 5, 13
+    A = rng.uniform(-1.0, -0.1, (nSys, tMax))
+    B = rng.uniform(3.0, 4.0, (nSys, tMax))
+    C = rng.uniform(-1.0, -0.1, (nSys, tMax))
+    D = rng.uniform(-1.0, 1.0, (nSys, tMax))
+
+    U = CyclicBatchTridiagonalSolver(A, B, C, D, np.empty((nSys, tMax)))
+    for s in range(nSys):
+        M = (np.diag(B[s]) + np.diag(A[s, 1:], -1)
+             + np.diag(C[s, :-1], 1))
+        M[0, -1] = A[s, 0]
+        M[-1, 0] = C[s, -1]
+        assert np.allclose(M @ U[s], D[s], rtol=0.0, atol=1e-13)
+
+
+if __name__ == "__main__":
+    test_batchtridiagonal()
+    test_batchtridiagonal_1dcoeffs()
+    test_cyclictridiagonal()
+    print("Tridiagonal solver test SUCCESS.")
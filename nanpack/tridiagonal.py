@@ -38,6 +38,10 @@
 #
 #   ***********************************************************************
 
+import numpy as np
+
+from .backend.kernels import thomas
+
 
 def TridiagonalSolver(tMax, A, B, C, D, UU):
     """Solve a tridiagonal matrix for a system of linear equations.
@@ -75,18 +79,159 @@ def TridiagonalSolver(tMax, A, B, C, D, UU):
         The dependent variable at time level, n+1 within the entire domain
         calculated using equation (B-5) in CFD Vol.1 by Klaus Hoffmann.
     """
-    H = [0 for t in range(tMax)]  # initialize H
-    G = [0 for t in range(tMax)]  # initialize G
+    # Equations B-8, B-9 and B-5 in CFD Vol. 1 by Klaus Hoffmann. The
+    # recursion is compiled when the numba backend is selected, see
+    # nanpack.set_backend().
+    UU = thomas(tMax, A, B, C, D, UU)
+
+    return UU
+
+
+def BatchTridiagonalSolver(A, B, C, D, UU, H=None, G=None):
+    """Solve a batch of independent tridiagonal systems in one call.
+
+    The same algorithm as TridiagonalSolver() (Appendix B of CFD Vol. 1
+    by Klaus Hoffmann) is used, but the forward elimination and the back
+    substitution are vectorized across all systems of the batch. This is
+    intended for the implicit sweeps in which the grid lines are
+    independent of each other, such as the ADI method for the parabolic
+    equations, so that an entire sweep is solved at once.
+
+    Each row of the 2D arrays is one tridiagonal system. The coefficients
+    A, B and C may also be given as 1D arrays of length tMax if they are
+    identical for every system of the batch.
+
+    Call signature:
+        BatchTridiagonalSolver(A, B, C, D, UU, H, G)
+
+    Parameters
+    ----------
+    A: ndarray[float], =1d or 2d
+        Coefficient of u(i-1, n+1) in the implicit formulation.
+    B: ndarray[float], =1d or 2d
+        Coefficient of u(i, n+1) in the implicit formulation.
+    C: ndarray[float], =1d or 2d
+        Coefficient of u(i+1, n+1) in the implicit formulation.
+    D: ndarray[float], =2d
+        Right-hand side equations in the implicit formulation.
+    UU: ndarray[float], =2d
+        The dependent variable at time level, n
+        along the lines of the sweep, shape (nSystems, tMax). The first
+        and the last column hold the boundary values.
+    H: ndarray[float], =2d, Default = None
+        Optional work array of shape (tMax, nSystems) for the
+        coefficients H of equation (B-8). Provide it to avoid the
+        allocation on every call when solving many batches of the
+        same size.
+    G: ndarray[float], =2d, Default = None
+        Optional work array of shape (tMax, nSystems) for the
+        coefficients G of equation (B-9).
+
+    Returns
+    -------
+    UU: ndarray[float], =2d
+        The dependent variable at time level, n+1 along the lines of the
+        sweep calculated using equation (B-5) in CFD Vol.1 by Klaus
+        Hoffmann. The input array is overwritten with the solution.
+    """
+    nSys, tMax = UU.shape
+    # Work with the transpose so that index t selects the t-th unknown
+    # of every system in the batch.
+    A = _BatchColumns(A)
+    B = _BatchColumns(B)
+    C = _BatchColumns(C)
+    D = _BatchColumns(D)
+    U = UU.T
+    if H is None:
+        H = np.empty((tMax, nSys))  # initialize H
+    if G is None:
+        G = np.empty((tMax, nSys))  # initialize G
+    Den = np.empty(nSys)
 
     H[0] = 0.0
-    G[0] = UU[0]
+    G[0] = U[0]
     for t in range(1, tMax-1):
         # Equation B-8 and B-9 in CFD Vol. 1 by Klaus Hoffmann
-        H[t] = C[t]/(B[t] - A[t]*H[t-1])
-        G[t] = (D[t] - A[t]*G[t-1])/(B[t] - A[t]*H[t-1])
+        np.subtract(B[t], A[t]*H[t-1], out=Den)
+        np.divide(C[t], Den, out=H[t])
+        np.divide(D[t] - A[t]*G[t-1], Den, out=G[t])
 
     for t in range(tMax-2, 0, -1):
         # Equation B-5 in CFD Vol. 1 by Klaus Hoffmann
-        UU[t] = -H[t]*UU[t+1] + G[t]
+        U[t] = -H[t]*U[t+1] + G[t]
 
     return UU
+
+
+def CyclicBatchTridiagonalSolver(A, B, C, D, UU):
+    """Solve a batch of periodic tridiagonal systems in one call.
+
+    In a periodic system the first unknown is coupled to the last one by
+    A[:, 0] and the last unknown to the first one by C[:, -1], e.g. along
+    the lines of an O-grid that close on themselves. The systems are
+    solved with the Sherman-Morrison formula from two non-periodic systems
+    that are solved together by BatchTridiagonalSolver().
+
+    Call signature:
+        CyclicBatchTridiagonalSolver(A, B, C, D, UU)
+
+    Parameters
+    ----------
+    A: ndarray[float], =1d or 2d
+        Coefficient of u(i-1, n+1) in the implicit formulation.
+    B: ndarray[float], =1d or 2d
+        Coefficient of u(i, n+1) in the implicit formulation.
+    C: ndarray[float], =1d or 2d
+        Coefficient of u(i+1, n+1) in the implicit formulation.
+    D: ndarray[float], =2d
+        Right-hand side equations in the implicit formulation.
+    UU: ndarray[float], =2d
+        Output array of shape (nSystems, tMax). All points of a line are
+        unknowns, the point following the last one is the first one.
+
+    Returns
+    -------
+    UU: ndarray[float], =2d
+        The dependent variable at time level, n+1 along the lines of the
+        sweep. The input array is overwritten with the solution.
+    """
+    nSys, tMax = UU.shape
+    A = np.broadcast_to(A, (nSys, tMax))
+    B = np.broadcast_to(B, (nSys, tMax))
+    C = np.broadcast_to(C, (nSys, tMax))
+    # The periodic matrix is M = T + u v^T, in which T is tridiagonal with
+    # the modified diagonal Bm, u = (g, 0, ..., C[-1]) and
+    # v = (1, 0, ..., A[0]/g).
+    g = -B[:, 0]
+    Bm = B.copy()
+    Bm[:, 0] -= g
+    Bm[:, -1] -= A[:, 0]*C[:, -1]/g
+    # The systems T Y = D and T Z = u are solved in one batch, with
+    # the first and the last column of the work arrays as zero boundary
+    # values.
+    Aw = np.zeros((2*nSys, tMax+2))
+    Bw = np.ones((2*nSys, tMax+2))
+    Cw = np.zeros((2*nSys, tMax+2))
+    Dw = np.zeros((2*nSys, tMax+2))
+    Aw[:, 1:-1] = np.concatenate([A, A])
+    Bw[:, 1:-1] = np.concatenate([Bm, Bm])
+    Cw[:, 1:-1] = np.concatenate([C, C])
+    Dw[:nSys, 1:-1] = D
+    Dw[nSys:, 1] = g
+    Dw[nSys:, -2] = C[:, -1]
+    YZ = BatchTridiagonalSolver(Aw, Bw, Cw, Dw, np.zeros((2*nSys, tMax+2)))
+    Y = YZ[:nSys, 1:-1]
+    Z = YZ[nSys:, 1:-1]
+    fact = ((Y[:, 0] + A[:, 0]*Y[:, -1]/g)
+            / (1.0 + Z[:, 0] + A[:, 0]*Z[:, -1]/g))
+    np.subtract(Y, fact[:, np.newaxis]*Z, out=UU)
+
+    return UU
+
+
+def _BatchColumns(X):
+    """Return the coefficients arranged as (tMax, nSystems)."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        return X[:, np.newaxis]
+    return X.T
@@ -38,30 +38,23 @@
 #
 #   ***********************************************************************
 
+import numpy as np
 import nanpack.utils as utils
 import nanpack.limiters as tvd
-from .backend.exceptions import TVDLimiterInputError
 
 
 def CalculateTVD(i, Uo, E, Eps, Courant, Limiter, LimFunction):
     """Return a limiter function for the second-order TVD schemes.
 
-    A dictionary is used to call the required limiter function based on
-    the user input.
+    The dictionary TVD_FUNCTIONS is used to call the required limiter
+    function based on the user input.
 
     The seventh function parameter "LimFunction" is used as a key to the
     dictionary and the
     first six function arguments are provided as input arguments to the
     selected limiter function method.
     """
-    tvd_type = {
-        "Harten-Yee-Upwind": HartenYeeUpwind,
-        "Modified-Harten-Yee-Upwind": ModifiedHartenYeeUpwind,
-        "Roe-Sweby-Upwind": RoeSwebyUpwind,
-        "Davis-Yee-Symmetric": DavisYeeSymmetric
-        }
-
-    SelectedFunction = tvd_type.get(LimFunction)
+    SelectedFunction = TVD_FUNCTIONS.get(LimFunction)
     return SelectedFunction(i, Uo, E, Eps, Courant, Limiter)
 
 
@@ -116,17 +109,16 @@ def HartenYeeUpwind(i, Uo, E, Eps, Courant, Limiter):
     alphaiMinus32 = utils.CalcAlpha(E[i-1], E[i-2], dUiMinus32,
                                     Uo[i-1], Uo[i-2])
 
-    if not Limiter == 'G':
-        raise TVDLimiterInputError(Limiter, "Harten-Yee Upwind TVD")
+    Limit = tvd.GetLimiter("Harten-Yee-Upwind", Limiter, Array=False)
 
     # .............................................................
     # Equation 6-130
-    Gi = tvd.LimiterGforHYU(alphaiPlus12, alphaiMinus12, dUiPlus12,
-                            dUiMinus12, Courant, Eps)
-    GiPlus1 = tvd.LimiterGforHYU(alphaiPlus32, alphaiPlus12, dUiPlus32,
-                                 dUiPlus12, Courant, Eps)
-    GiMinus1 = tvd.LimiterGforHYU(alphaiMinus12, alphaiMinus32, dUiMinus12,
-                                  dUiMinus32, Courant, Eps)
+    Gi = Limit(alphaiPlus12, alphaiMinus12, dUiPlus12,
+               dUiMinus12, Courant, Eps)
+    GiPlus1 = Limit(alphaiPlus32, alphaiPlus12, dUiPlus32,
+                    dUiPlus12, Courant, Eps)
+    GiMinus1 = Limit(alphaiMinus12, alphaiMinus32, dUiMinus12,
+                     dUiMinus32, Courant, Eps)
     # Equation 6-129
     if dUiPlus12 != 0:
         betaiPlus12 = (GiPlus1 - Gi)/dUiPlus12
@@ -199,14 +191,13 @@ def ModifiedHartenYeeUpwind(i, Uo, E, Eps, Courant, Limiter):
                                  Uo[i], Uo[i-1])
 
     # .............................................................
-    if Limiter not in ["G1", "G2", "G3", "G4", "G5"]:
-        raise TVDLimiterInputError(Limiter, "Modified Harten-Yee Upwind\
- TVD")
+    Limit = tvd.GetLimiter("Modified-Harten-Yee-Upwind", Limiter,
+                           Array=False)
 
     # .............................................................
-    Gi = tvd.LimiterforHYU(dUiPlus12, dUiMinus12, Limiter)
-    GiPlus1 = tvd.LimiterforHYU(dUiPlus32, dUiPlus12, Limiter)
-    GiMinus1 = tvd.LimiterforHYU(dUiMinus12, dUiMinus32, Limiter)
+    Gi = Limit(dUiPlus12, dUiMinus12)
+    GiPlus1 = Limit(dUiPlus32, dUiPlus12)
+    GiMinus1 = Limit(dUiMinus12, dUiMinus32)
 
     # Calculate si(alpha) and sigma(si(alpha))
     siAlphaP = utils.EntropyCorrectionFunction(alphaiPlus12, Eps)
@@ -310,12 +301,11 @@ def RoeSwebyUpwind(i, Uo, E, Eps, Courant, Limiter):
         riMinus = 0.0
 
     # .............................................................
-    if Limiter not in ["G1", "G2", "G3"]:
-        raise TVDLimiterInputError(Limiter, "Roe-Sweby Upwind TVD")
+    Limit = tvd.GetLimiter("Roe-Sweby-Upwind", Limiter, Array=False)
 
     # .............................................................
-    Gi = tvd.LimiterforRSU(riPlus, Limiter)
-    GiMinus1 = tvd.LimiterforRSU(riMinus, Limiter)
+    Gi = Limit(riPlus)
+    GiMinus1 = Limit(riMinus)
 
     # Calculate the flux limiter function, Equation 6-137
     phiPlus = (
@@ -376,13 +366,11 @@ def DavisYeeSymmetric(i, Uo, E, Eps, Courant, Limiter):
                                  Uo[i], Uo[i-1])
 
     # .............................................................
-    if Limiter not in ["G1", "G2", "G3"]:
-        raise TVDLimiterInputError(Limiter, "Davis-Yee Symmetric TVD")
+    Limit = tvd.GetLimiter("Davis-Yee-Symmetric", Limiter, Array=False)
 
     # .............................................................
-    GiPlus12 = tvd.LimiterforDYS(dUiMinus12, dUiPlus12, dUiPlus32, Limiter)
-    GiMinus12 = tvd.LimiterforDYS(dUiMinus32, dUiMinus12, dUiPlus12,
-                                  Limiter)
+    GiPlus12 = Limit(dUiMinus12, dUiPlus12, dUiPlus32)
+    GiMinus12 = Limit(dUiMinus32, dUiMinus12, dUiPlus12)
 
     # Calculate function si(alpha) in Equation 6-141
     siPlus = utils.EntropyCorrectionFunction(alphaiPlus12, Eps)
@@ -394,3 +382,191 @@ def DavisYeeSymmetric(i, Uo, E, Eps, Courant, Limiter):
                  + (siMinus*(dUiMinus12 - GiMinus12)))
 
     return phiPlus, phiMinus
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#           ARRAY LIMITER FUNCTIONS FOR SECOND-ORDER TVD      +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# The functions below evaluate the flux limiter function at every
+# interior point 2 <= i <= iMax-3 in a single call. The differences and
+# alpha are first calculated on the cell faces, where face k lies
+# between the grid points k and k+1, and then reused by neighbouring
+# grid points instead of being recalculated at every i.
+
+
+def CalculateTVDArray(Uo, E, Eps, Courant, Limiter, LimFunction):
+    """Return the flux limiter function for all interior grid points.
+
+    Array version of the function CalculateTVD(). The dictionary
+    TVD_ARRAY_FUNCTIONS is used to call the required limiter function
+    based on the user input.
+
+    Call signature:
+        CalculateTVDArray(Uo, E, Eps, Courant, Limiter, LimFunction)
+
+    Parameters
+    ----------
+    Uo: ndarray[float], =1d
+        The dependent variable at time level, n within the domain.
+    E: ndarray[float], =1D
+        The flux vector for the non-linear term in the inviscid Burgers
+        equation, which is E = U^2/2.
+    Eps: float
+        A positive constant value within the range 0.0 and 0.125.
+    Courant: float
+        Courant number (entered as user input in file).
+    Limiter: str
+        The limiter for the TVD function.
+    LimFunction: str
+        The TVD limiter function.
+
+    Returns
+    -------
+    phiPlus: ndarray[float], =1d
+        Flux limiter function at i+1/2 location for i = 2...iMax-3.
+    phiMinus: ndarray[float], =1d
+        Flux limiter function at i-1/2 location for i = 2...iMax-3.
+    """
+    SelectedFunction = TVD_ARRAY_FUNCTIONS.get(LimFunction)
+    return SelectedFunction(Uo, E, Eps, Courant, Limiter)
+
+
+def HartenYeeUpwindArray(Uo, E, Eps, Courant, Limiter):
+    """Return the Harten-Yee Upwind flux limiter function for all i.
+
+    Array version of the function HartenYeeUpwind(), see its docstring
+    for the description of the parameters.
+    """
+    Limit = tvd.GetLimiter("Harten-Yee-Upwind", Limiter)
+
+    dU, alpha = _FaceDifferences(Uo, E)
+    # Equation 6-130 at the grid points 1...iMax-2
+    G = Limit(alpha[1:], alpha[:-1], dU[1:], dU[:-1], Courant, Eps)
+    # Equation 6-129 at the faces 1...iMax-3
+    dUf = dU[1:-1]
+    alphaf = alpha[1:-1]
+    beta = _Divide(G[1:] - G[:-1], dUf)
+
+    # Calculate the flux limiter function, Equation 6-126
+    si = utils.EntropyCorrectionFunctionArray(alphaf + beta, Eps)
+    phi = (G[1:] + G[:-1]) - si*dUf
+
+    return phi[1:], phi[:-1]
+
+
+def ModifiedHartenYeeUpwindArray(Uo, E, Eps, Courant, Limiter):
+    """Return the Modified Harten-Yee Upwind flux limiter function.
+
+    Array version of the function ModifiedHartenYeeUpwind(), see its
+    docstring for the description of the parameters.
+    """
+    Limit = tvd.GetLimiter("Modified-Harten-Yee-Upwind", Limiter)
+
+    dU, alpha = _FaceDifferences(Uo, E)
+    # Limiter at the grid points 1...iMax-2
+    G = Limit(dU[1:], dU[:-1])
+    dUf = dU[1:-1]
+    alphaf = alpha[1:-1]
+
+    # Calculate si(alpha), sigma(si(alpha)) and beta at the faces
+    siAlpha = utils.EntropyCorrectionFunctionArray(alphaf, Eps)
+    sigma = 0.5*siAlpha + Courant*alphaf*alphaf
+    beta = _Divide(sigma*(G[1:] - G[:-1]), dUf)
+
+    # Calculate the flux limiter function, Equation 6-131
+    si = utils.EntropyCorrectionFunctionArray(alphaf + beta, Eps)
+    phi = sigma*(G[1:] + G[:-1]) - si*dUf
+
+    return phi[1:], phi[:-1]
+
+
+def RoeSwebyUpwindArray(Uo, E, Eps, Courant, Limiter):
+    """Return the Roe-Sweby Upwind flux limiter function for all i.
+
+    Array version of the function RoeSwebyUpwind(), see its docstring
+    for the description of the parameters.
+    """
+    Limit = tvd.GetLimiter("Roe-Sweby-Upwind", Limiter)
+
+    dU, alpha = _FaceDifferences(Uo, E)
+    iMax, = Uo.shape
+    i = np.arange(2, iMax-2)
+    zero_filter = 1.e-7  # variable to filter out division by zero
+    alphaPlus = alpha[i]
+    alphaMinus = alpha[i-1]
+    dUPlus = dU[i]
+    dUMinus = dU[i-1]
+    # The ratio r is upwinded with the sign of alpha at each face.
+    sigPlus = np.sign(alphaPlus).astype(int)
+    sigMinus = np.sign(alphaMinus).astype(int)
+    riPlus = _Divide(Uo[i+1+sigPlus] - Uo[i+sigPlus], dUPlus,
+                     dUPlus >= zero_filter)
+    riMinus = _Divide(Uo[i+sigMinus] - Uo[i+1+sigMinus], dUMinus,
+                      dUMinus >= zero_filter)
+
+    Gi = Limit(riPlus)
+    GiMinus1 = Limit(riMinus)
+
+    # Calculate the flux limiter function, Equation 6-137
+    phiPlus = (
+        ((Gi/2.0)*(np.abs(alphaPlus)+Courant*alphaPlus**2)
+         - np.abs(alphaPlus)) * dUPlus
+        )
+    phiMinus = (
+        ((GiMinus1/2.0)*(np.abs(alphaMinus)+Courant*alphaMinus**2)
+         - np.abs(alphaMinus))*dUMinus
+        )
+
+    return phiPlus, phiMinus
+
+
+def DavisYeeSymmetricArray(Uo, E, Eps, Courant, Limiter):
+    """Return the Davis-Yee Symmetric flux limiter function for all i.
+
+    Array version of the function DavisYeeSymmetric(), see its docstring
+    for the description of the parameters.
+    """
+    Limit = tvd.GetLimiter("Davis-Yee-Symmetric", Limiter)
+
+    dU, alpha = _FaceDifferences(Uo, E)
+    # Limiter at the faces 1...iMax-3
+    G = Limit(dU[:-2], dU[1:-1], dU[2:])
+    dUf = dU[1:-1]
+    alphaf = alpha[1:-1]
+
+    # Calculate the flux limiter function, Equation 6-141
+    si = utils.EntropyCorrectionFunctionArray(alphaf, Eps)
+    phi = -((Courant*alphaf**2*G) + (si*(dUf - G)))
+
+    return phi[1:], phi[:-1]
+
+
+def _FaceDifferences(Uo, E):
+    """Return dU and alpha (Equation 6-128) at the faces i+1/2."""
+    dU = utils.CalcUi(Uo[1:], Uo[:-1])
+    alpha = utils.CalcAlphaArray(E[1:], E[:-1], dU, Uo[1:], Uo[:-1])
+    return dU, alpha
+
+
+def _Divide(num, den, where=None):
+    """Return num/den where allowed and 0.0 elsewhere (default den != 0)."""
+    if where is None:
+        where = den != 0
+    out = np.zeros_like(num)
+    np.divide(num, den, out=out, where=where)
+    return out
+
+
+TVD_FUNCTIONS = {
+    "Harten-Yee-Upwind": HartenYeeUpwind,
+    "Modified-Harten-Yee-Upwind": ModifiedHartenYeeUpwind,
+    "Roe-Sweby-Upwind": RoeSwebyUpwind,
+    "Davis-Yee-Symmetric": DavisYeeSymmetric
+    }
+
+TVD_ARRAY_FUNCTIONS = {
+    "Harten-Yee-Upwind": HartenYeeUpwindArray,
+    "Modified-Harten-Yee-Upwind": ModifiedHartenYeeUpwindArray,
+    "Roe-Sweby-Upwind": RoeSwebyUpwindArray,
+    "Davis-Yee-Symmetric": DavisYeeSymmetricArray
+    }
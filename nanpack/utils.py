@@ -38,6 +38,8 @@
 #
 #   ***********************************************************************
 
+import numpy as np
+
 
 def EntropyCorrectionFunction(Alpha, Eps):
     """Return the value of the entropy correction term.
@@ -85,3 +87,38 @@ def CalcUi(U2, U1):
 def CalcE(U):
     """Return the result of the non-linear variable E = 0.5U**2."""
     return 0.5 * U * U
+
+
+def EntropyCorrectionFunctionArray(Alpha, Eps):
+    """Return the entropy correction term for an array of alpha values.
+
+    Array version of the function EntropyCorrectionFunction(), see
+    equation 6-127 in CFD Vol. 1 by Hoffmann.
+
+    Call signature:
+        EntropyCorrectionFunctionArray(Alpha, Eps)
+
+    Parameters
+    ----------
+    Alpha: ndarray[float]
+        Values of alpha.
+    Eps: float
+        A positive constant similar to the damping coefficient. Its value
+        must be selected within the range 0f 0.0 to 0.125.
+
+    Returns
+    -------
+    si: ndarray[float]
+        Entropy correction term.
+    """
+    AlphaAbs = np.abs(Alpha)
+    return np.where(AlphaAbs >= Eps, AlphaAbs,
+                    (Alpha*Alpha + Eps*Eps)/(2*Eps))
+
+
+def CalcAlphaArray(E1, E2, dU, U1, U2):
+    """Return the results of Equation 6-128 for arrays of grid points."""
+    nonzero = dU != 0
+    alpha = 0.5 * (U1 + U2)
+    np.divide(E1 - E2, dU, out=alpha, where=nonzero)
+    return alpha